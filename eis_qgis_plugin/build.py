@@ -2,8 +2,10 @@
 # -*- coding: utf-8 -*-
 
 import glob
+import os
 from typing import List
 
+from eis_processing.algorithm_manifest import MANIFEST_PATH, write_manifest
 from qgis_plugin_tools.infrastructure.plugin_maker import PluginMaker
 
 """
@@ -24,11 +26,16 @@ resources = list(glob.glob("**/*.qrc", recursive=True))
 extra_dirs = ["resources"]
 compiled_resources: List[str] = []
 
+# Algorithm manifest lets EISProvider register the algorithms without importing them at startup
+write_manifest()
+extra_files = [os.path.relpath(MANIFEST_PATH)]
+
 PluginMaker(
     py_files=py_files,
     ui_files=ui_files,
     resources=resources,
     extra_dirs=extra_dirs,
+    extra_files=extra_files,
     compiled_resources=compiled_resources,
     locales=locales,
     profile=profile,
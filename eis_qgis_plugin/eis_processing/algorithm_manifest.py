@@ -0,0 +1,156 @@
+"""
+Manifest of the EIS processing algorithms.
+
+The manifest lists, for every algorithm module, the algorithm ID, class name, module path and the metadata
+shown in the Processing Toolbox, so that EISProvider can register the algorithms without importing their
+modules. It is generated by `build.py` by parsing the modules (nothing is imported, so this module must not
+import QGIS either), committed to the repository so that release packages include it, and read by
+EISProvider. If the manifest is missing or older than the algorithm files (e.g. in a development checkout),
+it is regenerated when the provider loads.
+"""
+
+import ast
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ALGORITHMS_PATH = os.path.join(os.path.dirname(__file__), "algorithms")
+MANIFEST_PATH = os.path.join(ALGORITHMS_PATH, "manifest.json")
+ALGORITHM_CATEGORIES = [
+    "evaluation",
+    "vector_processing",
+    "raster_processing",
+    "exploratory_analysis",
+    "prediction",
+    "transformations",
+    "utilities",
+    "filtering",
+    "transformations_coda",
+]
+BASE_CLASS_NAME = "EISProcessingAlgorithm"
+
+# Attribute set in the __init__ of the algorithm class -> manifest key
+METADATA_ATTRIBUTES = {
+    "_name": "id",
+    "_display_name": "display_name",
+    "_group": "group",
+    "_group_id": "group_id",
+    "_short_help_string": "short_help_string",
+}
+
+
+def get_algorithm_files() -> List[str]:
+    """Returns the paths of the algorithm modules relative to the algorithms folder."""
+    module_paths = []
+    for category in ALGORITHM_CATEGORIES:
+        for file_name in sorted(os.listdir(os.path.join(ALGORITHMS_PATH, category))):
+            if file_name.endswith(".py") and not file_name.startswith("__"):
+                module_paths.append(f"{category}/{file_name}")
+    return module_paths
+
+
+def _parse_metadata(class_node: ast.ClassDef) -> Dict[str, Optional[str]]:
+    """Returns the literal string values assigned to the metadata attributes in __init__."""
+    metadata = {key: None for key in METADATA_ATTRIBUTES.values()}
+    for node in class_node.body:
+        if not isinstance(node, ast.FunctionDef) or node.name != "__init__":
+            continue
+        for statement in ast.walk(node):
+            if not isinstance(statement, ast.Assign) or len(statement.targets) != 1:
+                continue
+            target = statement.targets[0]
+            if (
+                isinstance(target, ast.Attribute)
+                and isinstance(target.value, ast.Name)
+                and target.value.id == "self"
+                and target.attr in METADATA_ATTRIBUTES
+            ):
+                try:
+                    value = ast.literal_eval(statement.value)
+                except ValueError:
+                    continue  # Not a literal, looked up from the algorithm when needed
+                if isinstance(value, str):
+                    metadata[METADATA_ATTRIBUTES[target.attr]] = value
+    return metadata
+
+
+def parse_algorithm_file(module_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Parses the manifest entry of an algorithm module.
+
+    Returns:
+        The entry, or None if the module has no EISProcessingAlgorithm subclass with a literal ID.
+    """
+    with open(os.path.join(ALGORITHMS_PATH, module_path), "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=module_path)
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(isinstance(base, ast.Name) and base.id == BASE_CLASS_NAME for base in node.bases):
+            continue
+        metadata = _parse_metadata(node)
+        if metadata["id"] is None:
+            return None
+        # Flags are asked for every algorithm when the Processing Toolbox is built, so the module is imported
+        # for them only if the class defines its own
+        overrides_flags = any(isinstance(item, ast.FunctionDef) and item.name == "flags" for item in node.body)
+        return {"class": node.name, "module_path": module_path, **metadata, "overrides_flags": overrides_flags}
+    return None
+
+
+def generate_manifest() -> List[Dict[str, Any]]:
+    """Returns the manifest entries of all algorithm modules."""
+    manifest = []
+    for module_path in get_algorithm_files():
+        entry = parse_algorithm_file(module_path)
+        if entry is None:
+            logger.warning("No EIS processing algorithm found in %s", module_path)
+            continue
+        manifest.append(entry)
+    return manifest
+
+
+def write_manifest(
+    path: str = MANIFEST_PATH, manifest: Optional[List[Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """Generates the manifest (unless given) and writes it to a file. Called from `build.py`."""
+    if manifest is None:
+        manifest = generate_manifest()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return manifest
+
+
+def is_manifest_stale(manifest: List[Dict[str, Any]], path: str = MANIFEST_PATH) -> bool:
+    """Whether the manifest lists other modules than there are or is older than some algorithm module."""
+    module_paths = get_algorithm_files()
+    if {entry["module_path"] for entry in manifest} != set(module_paths):
+        return True
+    manifest_mtime = os.path.getmtime(path)
+    return any(
+        os.path.getmtime(os.path.join(ALGORITHMS_PATH, module_path)) > manifest_mtime for module_path in module_paths
+    )
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> List[Dict[str, Any]]:
+    """Returns the manifest from the file, or regenerates the file if it is missing, stale or unreadable."""
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if not is_manifest_stale(manifest, path):
+                return manifest
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Failed to read algorithm manifest %s: %s", path, e)
+
+    manifest = generate_manifest()
+    try:
+        write_manifest(path, manifest)
+    except OSError as e:
+        logger.info("Could not write algorithm manifest %s: %s", path, e)  # E.g. a read-only plugin folder
+    return manifest
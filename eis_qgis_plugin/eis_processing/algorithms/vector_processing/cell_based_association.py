@@ -156,8 +156,9 @@ class EISCellBasedAssociation(EISProcessingAlgorithm):
         typer_options += values_options  # Combine lists
 
         toolkit_invoker = EISToolkitInvoker()
-        toolkit_invoker.assemble_cli_command(self.name(), typer_args, typer_options)
+        toolkit_invoker.assemble_cli_command(self.name(), typer_args, typer_options, list(output_paths.values()))
         results = toolkit_invoker.run_toolkit_command(feedback)
+        self.apply_raster_output_profile(output_paths, results, feedback)
 
         self.get_results(results, parameters)
         for param_name, output_path in output_paths.items():
@@ -1,4 +1,5 @@
 import os
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from qgis.core import (
@@ -34,9 +35,19 @@ from qgis.core import (
 
 from eis_qgis_plugin.environment.eis_toolkit_invoker import EISToolkitInvoker
 from eis_qgis_plugin.utils.model_feedback import EISProcessingFeedback
+from eis_qgis_plugin.utils.raster_output_profile import EISRasterOutputProfile
+from eis_qgis_plugin.utils.result_cache import EISResultCache
+from eis_qgis_plugin.utils.run_log import EISRunLog
+from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
 
 class EISProcessingAlgorithm(QgsProcessingAlgorithm):
+
+    # Groups of algorithms whose outputs depend only on their inputs and parameters
+    CACHEABLE_GROUPS = (
+        "filtering", "raster_processing", "transformations", "transformations_coda", "utilities", "vector_processing"
+    )
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -48,6 +59,7 @@ class EISProcessingAlgorithm(QgsProcessingAlgorithm):
 
         self.alg_parameters: List[str] = []
         self.multiple_layers_as_typer_option: bool = False
+        self.toolkit_invoker: Optional[EISToolkitInvoker] = None
 
     def name(self):
         """
@@ -315,9 +327,110 @@ class EISProcessingAlgorithm(QgsProcessingAlgorithm):
             # elif output.type() == "outputBoolean":        # NOTE: EIS Toolkit will send boolean results as a print
             #     results[output_name] = results["result"]  #       that is captured and printed in ToolkitInvoker
 
+    def get_raster_output_paths(self, output_paths: Dict[str, str], results: dict) -> List[str]:
+        """Returns the raster outputs of a run, including the extra rasters written to an output folder."""
+        raster_paths = [
+            path for name, path in output_paths.items()
+            if isinstance(self.parameterDefinition(name), QgsProcessingParameterRasterDestination)
+        ]
+        raster_paths += list(results.get("output_folder_rasters", {}).values())
+        return raster_paths
+
+
+    def apply_raster_output_profile(self, output_paths: Dict[str, str], results: dict, feedback: QgsProcessingFeedback):
+        """Rewrites the raster outputs of a finished run with the raster output profile selected in settings."""
+        if not EISRasterOutputProfile.is_enabled() or feedback.isCanceled():
+            return
+        raster_paths = self.get_raster_output_paths(output_paths, results or {})
+        if raster_paths:
+            feedback.pushInfo(f"Applying raster output profile to {len(raster_paths)} output raster(s).")
+            EISRasterOutputProfile.apply_all(raster_paths)
+
+
+    def is_cacheable(self) -> bool:
+        """Whether results of the algorithm can be reused from the result cache."""
+        return self._group_id in self.CACHEABLE_GROUPS and not any(
+            isinstance(param, QgsProcessingParameterFolderDestination) for param in self.parameterDefinitions()
+        )
+
+
+    def get_input_files(
+        self,
+        parameters: Dict[str, QgsProcessingParameterDefinition],
+        context: QgsProcessingContext
+    ) -> Optional[List[str]]:
+        """
+        Collects the files of all input layers and files.
+
+        Returns:
+            List of input file paths or None if some input is not file-based (e.g. a memory or database layer).
+        """
+        input_files = []
+        for name in self.alg_parameters:
+            param = self.parameterDefinition(name)
+            if isinstance(param, QgsProcessingParameterMultipleLayers):
+                sources = [layer.source() for layer in self.parameterAsLayerList(parameters, name, context)]
+            elif isinstance(
+                param,
+                (QgsProcessingParameterMapLayer, QgsProcessingParameterRasterLayer, QgsProcessingParameterVectorLayer)
+            ):
+                layer = self.parameterAsLayer(parameters, name, context)
+                sources = [layer.source()] if layer else []
+            elif isinstance(param, QgsProcessingParameterFile):
+                file_path = self.parameterAsFile(parameters, name, context)
+                sources = [file_path] if file_path else []
+            else:
+                continue
+
+            for source in sources:
+                path = os.path.normpath(source.split("|")[0])
+                if not os.path.isfile(path):
+                    return None
+                input_files.append(path)
+        return input_files
+
+
+    def get_input_sizes(
+        self,
+        parameters: Dict[str, QgsProcessingParameterDefinition],
+        context: QgsProcessingContext
+    ) -> Dict[str, int]:
+        """Returns the total pixel count, band count and feature count of the input layers, for the run log."""
+        sizes = {"input_pixels": 0, "input_bands": 0, "input_features": 0}
+        for name in self.alg_parameters:
+            param = self.parameterDefinition(name)
+            if isinstance(param, QgsProcessingParameterMultipleLayers):
+                layers = self.parameterAsLayerList(parameters, name, context)
+            elif isinstance(
+                param,
+                (QgsProcessingParameterMapLayer, QgsProcessingParameterRasterLayer, QgsProcessingParameterVectorLayer)
+            ):
+                layer = self.parameterAsLayer(parameters, name, context)
+                layers = [layer] if layer else []
+            else:
+                continue
+
+            for layer in layers:
+                if isinstance(layer, QgsRasterLayer):
+                    sizes["input_pixels"] += layer.width() * layer.height()
+                    sizes["input_bands"] += layer.bandCount()
+                elif isinstance(layer, QgsVectorLayer):
+                    sizes["input_features"] += max(layer.featureCount(), 0)
+        return sizes
+
+
+    def _record_run(self, started_at: float, input_sizes: Dict[str, int], run_stats: dict, canceled: bool):
+        if canceled:
+            status = "cancelled"
+        else:
+            status = "success" if run_stats.get("exit_code") == 0 else "failed"
+        EISRunLog.record(started_at=started_at, algorithm=self.name(), status=status, **input_sizes, **run_stats)
+
+
     def cancel(self):
-        if self.process:
-            self.process.terminate()
+        """Cancels the toolkit command run by this algorithm instance, stopping all its processes."""
+        if self.toolkit_invoker is not None:
+            self.toolkit_invoker.cancel()
 
 
     def processAlgorithm(
@@ -342,13 +455,49 @@ class EISProcessingAlgorithm(QgsProcessingAlgorithm):
  
         typer_args, typer_options, output_paths = self.prepare_arguments(parameters, context)
 
-        toolkit_invoker = EISToolkitInvoker()
-        toolkit_invoker.assemble_cli_command(self.name(), typer_args, typer_options)
-        results = toolkit_invoker.run_toolkit_command(feedback)
+        run_log = EISSettingsManager.get_run_log_selection()
+        input_sizes = self.get_input_sizes(parameters, context) if run_log else {}
+        started_at = time.time()
 
-        if feedback.isCanceled() or (is_eis_feedback and not feedback.no_errors):
-            feedback.setProgress(100)
-            return {}
+        cache_key = None
+        if EISSettingsManager.get_result_cache_selection() and self.is_cacheable():
+            input_files = self.get_input_files(parameters, context)
+            if input_files is not None:
+                cache_key = EISResultCache.make_key(
+                    self.name(), typer_args + typer_options, output_paths, input_files
+                )
+
+        cached_results = EISResultCache.restore(cache_key, output_paths) if cache_key else None
+        if cached_results is not None:
+            feedback.pushInfo("Identical inputs and parameters found in result cache, reusing cached outputs.")
+            results = cached_results
+            if run_log:
+                EISRunLog.record(
+                    started_at=started_at,
+                    algorithm=self.name(),
+                    execution_mode="cache",
+                    status="cached",
+                    wall_time=time.time() - started_at,
+                    **input_sizes
+                )
+        else:
+            run_started = time.time()
+            toolkit_invoker = EISToolkitInvoker()
+            self.toolkit_invoker = toolkit_invoker
+            toolkit_invoker.assemble_cli_command(
+                self.name(), typer_args, typer_options, list(output_paths.values())
+            )
+            results = toolkit_invoker.run_toolkit_command(feedback)
+            if run_log:
+                self._record_run(started_at, input_sizes, toolkit_invoker.run_stats, feedback.isCanceled())
+
+            if feedback.isCanceled() or (is_eis_feedback and not feedback.no_errors):
+                feedback.setProgress(100)
+                return {}
+
+            self.apply_raster_output_profile(output_paths, results, feedback)
+            if cache_key:
+                EISResultCache.store(cache_key, self.name(), results, output_paths, run_started)
 
         self.get_results(results, parameters)
         for param_name, output_path in output_paths.items():
@@ -1,15 +1,122 @@
 import importlib
+import logging
 import os
+import time
+from typing import Any, Dict, Optional
 
-from qgis.core import QgsProcessingProvider
+from qgis.core import QgsProcessingAlgorithm, QgsProcessingProvider
+
+from eis_qgis_plugin.eis_processing.algorithm_manifest import ALGORITHMS_PATH, load_manifest
 
 PLUGIN_PATH = os.path.dirname(__file__)
 ICON_PATH = os.path.join(PLUGIN_PATH, "../resources/icons/eis_logo.png")
 
+logger = logging.getLogger(__name__)
+
+_algorithm_classes: Dict[str, type] = {}  # Module path -> imported algorithm class
+
+
+def load_algorithm_class(entry: Dict[str, Any]) -> type:
+    """Imports the module of a manifest entry (once) and returns the algorithm class."""
+    module_path = entry["module_path"]
+    if module_path not in _algorithm_classes:
+        module_name = os.path.splitext(os.path.basename(module_path))[0]
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(ALGORITHMS_PATH, module_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _algorithm_classes[module_path] = getattr(module, entry["class"])
+    return _algorithm_classes[module_path]
+
+
+class EISLazyAlgorithm(QgsProcessingAlgorithm):
+    """
+    Placeholder of an EIS processing algorithm registered from the algorithm manifest.
+
+    It answers the metadata queries of the Processing Toolbox from the manifest. Algorithm dialogs,
+    `processing.run` and models create the algorithm through `createInstance`, which imports the module of
+    the algorithm on first use and returns an instance of the real algorithm class. The placeholder then
+    takes the parameters of the real algorithm, so callers of `algorithmById` see them too, and delegates
+    flags and processing to it.
+    """
+
+    def __init__(self, entry: Dict[str, Any]) -> None:
+        super().__init__()
+        self.entry = entry
+        self._algorithm: Optional[QgsProcessingAlgorithm] = None
+        self._has_parameters = False
+
+    def _get_algorithm(self) -> QgsProcessingAlgorithm:
+        """Returns an initialized instance of the real algorithm, created on first use."""
+        if self._algorithm is None:
+            algorithm = load_algorithm_class(self.entry)()
+            algorithm.initAlgorithm()
+            self._algorithm = algorithm
+        return self._algorithm
+
+    def _add_parameters(self):
+        """Adds the parameters (and thus outputs) of the real algorithm to the placeholder, once."""
+        if self._has_parameters:
+            return
+        self._has_parameters = True
+        for parameter in self._get_algorithm().parameterDefinitions():
+            self.addParameter(parameter.clone())
+
+    def _get_metadata(self, key: str, method_name: str) -> str:
+        value = self.entry.get(key)
+        if value is None:
+            # Not a literal in the algorithm module, so the module is imported for it
+            value = getattr(self._get_algorithm(), method_name)()
+            self.entry[key] = value
+        return value
+
+    def name(self):
+        return self.entry["id"]
+
+    def displayName(self):
+        return self._get_metadata("display_name", "displayName")
+
+    def group(self):
+        return self._get_metadata("group", "group")
+
+    def groupId(self):
+        return self._get_metadata("group_id", "groupId")
+
+    def shortHelpString(self):
+        return self._get_metadata("short_help_string", "shortHelpString")
+
+    def flags(self):
+        if self.entry.get("overrides_flags", True):
+            return self._get_algorithm().flags()
+        return super().flags()
+
+    def parameterDefinitions(self):
+        self._add_parameters()
+        return super().parameterDefinitions()
+
+    def parameterDefinition(self, name):
+        self._add_parameters()
+        return super().parameterDefinition(name)
+
+    def outputDefinitions(self):
+        self._add_parameters()
+        return super().outputDefinitions()
+
+    def createInstance(self):
+        self._add_parameters()
+        return load_algorithm_class(self.entry)()
+
+    def initAlgorithm(self, config=None):
+        # Called when the provider registers the algorithm, the parameters of the real algorithm are added
+        # on first use so that its module is not imported at startup
+        pass
+
+    def processAlgorithm(self, parameters, context, feedback):
+        return self._get_algorithm().processAlgorithm(parameters, context, feedback)
+
 
 class EISProvider(QgsProcessingProvider):
     def __init__(self) -> None:
-        self.base_alg_folder = os.path.join(PLUGIN_PATH, "algorithms")
+        self.base_alg_folder = ALGORITHMS_PATH
         super().__init__()
 
     def id(self) -> str:
@@ -26,46 +133,12 @@ class EISProvider(QgsProcessingProvider):
     #     return QIcon(ICON_PATH)
 
     def loadAlgorithms(self) -> None:
-        # Load algorithms from each directory
-        evaluation = self.load_algorithms_from_directory("evaluation")
-        vector_processing = self.load_algorithms_from_directory("vector_processing")
-        raster_processing = self.load_algorithms_from_directory("raster_processing")
-        exploratory_analysis = self.load_algorithms_from_directory("exploratory_analysis")
-        prediction = self.load_algorithms_from_directory("prediction")
-        transformations = self.load_algorithms_from_directory("transformations")
-        transformations_coda = self.load_algorithms_from_directory("transformations_coda")
-        utilities = self.load_algorithms_from_directory("utilities")
-        filtering = self.load_algorithms_from_directory("filtering")
-
-        # Add the algorithm instances to the provider
-        for algorithm in (
-            evaluation + vector_processing + raster_processing +
-            exploratory_analysis + prediction + transformations + utilities +
-            filtering + transformations_coda
-        ):
-            self.addAlgorithm(algorithm)
-
-    def load_algorithms_from_directory(self, category: str):
-        algorithms_dir = os.path.join(self.base_alg_folder, category)
-        algorithm_instances = []
-
-        for file_name in os.listdir(algorithms_dir):
-            if file_name.endswith(".py") and not file_name.startswith("__"):
-                module_name = file_name[:-3]
-                class_name_parts = [
-                    part.capitalize() for part in module_name.split("_")
-                ]
-                class_name = "EIS" + "".join(class_name_parts)
-
-                # Import the module
-                spec = importlib.util.spec_from_file_location(
-                    module_name, os.path.join(algorithms_dir, file_name)
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Create an instance of the algorithm class and add it to the list
-                algorithm_class = getattr(module, class_name)
-                algorithm_instances.append(algorithm_class())
-
-        return algorithm_instances
+        # Register the algorithms from the manifest, the algorithm modules are imported on first use
+        start = time.perf_counter()
+        _algorithm_classes.clear()  # Refreshing the provider picks up changes to the algorithm modules
+        manifest = load_manifest()
+        for entry in manifest:
+            self.addAlgorithm(EISLazyAlgorithm(entry))
+        logger.debug(
+            "Registered %d EIS algorithms in %.1f ms", len(manifest), (time.perf_counter() - start) * 1000
+        )
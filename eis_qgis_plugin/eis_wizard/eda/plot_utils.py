@@ -1,3 +1,4 @@
+import sys
 from enum import Enum
 
 from qgis.core import QgsColorRamp, QgsVectorLayer
@@ -99,3 +100,10 @@ def generate_color_mapping(
 
 def opacity_to_alpha(opacity: float):
     return opacity * 256
+
+
+def close_all_figures() -> None:
+    """Closes all matplotlib figures. Matplotlib is not imported just for this if no plot has been created."""
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is not None:
+        pyplot.close("all")
@@ -2,7 +2,6 @@ from qgis.core import QgsMapLayerProxyModel
 from qgis.gui import QgsColorButton, QgsFieldComboBox
 from qgis.PyQt.QtWidgets import QComboBox, QWidget
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.plot_template import EISPlot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
@@ -49,6 +48,8 @@ class EISWizardBoxplot(EISPlot, FORM_CLASS):
 
     def plot(self, ax):
         """Plot to given axis."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         layer = self.layer.currentLayer()
 
         X_field_name = self.X.currentField()
@@ -100,6 +101,8 @@ class EISWizardBoxplot(EISPlot, FORM_CLASS):
 
     def plot_example(self, ax):
         """Produce example plot using SNS data."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         penguins = sns.load_dataset("penguins")
 
         sns.boxplot(
@@ -5,7 +5,6 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
 )
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.plot_template import EISPlot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
@@ -64,6 +63,8 @@ class EISWizardEcdf(EISPlot, FORM_CLASS):
 
     def plot(self, ax):
         """Plot to given axis."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         layer = self.layer.currentLayer()
 
         if layer.type() == QgsMapLayer.VectorLayer:
@@ -84,7 +85,7 @@ class EISWizardEcdf(EISPlot, FORM_CLASS):
             }
 
         elif layer.type() == QgsMapLayer.RasterLayer:
-            data = self.raster_layer_to_array(layer)
+            data = self.raster_layer_to_array(layer, self.raster_X.currentBand())
 
             layer_specific_kwargs = {
                 "data": data
@@ -106,6 +107,8 @@ class EISWizardEcdf(EISPlot, FORM_CLASS):
 
     def plot_example(self, ax):
         """Produce example plot using SNS data."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         penguins = sns.load_dataset("penguins")
 
         sns.ecdfplot(
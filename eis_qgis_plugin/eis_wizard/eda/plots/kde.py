@@ -7,7 +7,6 @@ from qgis.gui import (
 )
 from qgis.PyQt.QtWidgets import QComboBox, QDoubleSpinBox, QWidget
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.plot_template import EISPlot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
@@ -70,6 +69,8 @@ class EISWizardKde(EISPlot, FORM_CLASS):
 
     def plot(self, ax):
         """Plot to given axis."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         layer = self.layer.currentLayer()
 
         if layer.type() == QgsMapLayer.VectorLayer:
@@ -91,7 +92,7 @@ class EISWizardKde(EISPlot, FORM_CLASS):
             }
 
         elif layer.type() == QgsMapLayer.RasterLayer:
-            data = self.raster_layer_to_array(layer)
+            data = self.raster_layer_to_array(layer, self.raster_X.currentBand())
 
             layer_specific_kwargs = {
                 "data": data
@@ -113,6 +114,8 @@ class EISWizardKde(EISPlot, FORM_CLASS):
 
     def plot_example(self, ax):
         """Produce example plot using SNS data."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         penguins = sns.load_dataset("penguins")
 
         sns.kdeplot(
@@ -6,7 +6,6 @@ from qgis.gui import (
 )
 from qgis.PyQt.QtWidgets import QWidget
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.plot_template import EISPlot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 
@@ -53,6 +52,8 @@ class EISWizardLineplot(EISPlot, FORM_CLASS):
 
     def plot(self, ax):
         """Plot to given axis."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         layer = self.layer.currentLayer()
 
         X_field_name = self.X.currentField()
@@ -94,6 +95,8 @@ class EISWizardLineplot(EISPlot, FORM_CLASS):
 
     def plot_example(self, ax):
         """Produce example plot using SNS data."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         penguins = sns.load_dataset("penguins")
 
         sns.lineplot(
@@ -1,6 +1,5 @@
 from qgis.PyQt.QtWidgets import QComboBox
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.plot_template import EISPlot
 
 
@@ -20,6 +19,8 @@ class EISWizardPairplot(EISPlot):
 
     def plot_example(self, ax):
         """Produce example plot using SNS data."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         penguins = sns.load_dataset("penguins")
 
         grid = sns.pairplot(
@@ -1,21 +1,19 @@
 from typing import List
 
-import numpy as np
-import pandas as pd
 from qgis.core import QgsMapLayerProxyModel, QgsRasterLayer
 from qgis.gui import QgsMapLayerComboBox
 from qgis.PyQt.QtWidgets import QGroupBox, QSizePolicy, QWidget
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.plot_template import EISPlot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 from eis_qgis_plugin.utils.layer_data_table import LayerDataTable
-from eis_qgis_plugin.utils.misc_utils import check_duplicate_names, check_raster_grids, check_raster_size
+from eis_qgis_plugin.utils.misc_utils import check_duplicate_names, check_raster_grids
 
 FORM_CLASS: QWidget = load_ui("eda/wizard_plot_pairplot_raster.ui")
 
 KIND_MAPPING = {"histogram": "hist", "scatterplot": "scatter", "kde": "kde", "regression": "reg"}
 DIAG_KIND_MAPPING = {"auto": "auto", "histogram": "hist", "kde": "kde", "none": "None"}
+SAMPLE_SIZE = 10000  # Pixels plotted at most
 
 class EISWizardPairplotRaster(EISPlot, FORM_CLASS):
     """
@@ -62,31 +60,26 @@ class EISWizardPairplotRaster(EISPlot, FORM_CLASS):
 
     def plot(self, ax):
         """Plot to given axis."""
+        import pandas as pd
+
+        import eis_qgis_plugin.libs.seaborn as sns
+
         rasters = self.get_layers()
+        color_raster = self.color_selection.currentLayer()
+        if color_raster is not None:
+            rasters.append(color_raster)
         raster_names = [raster.name() for raster in rasters]
 
         # Check matching raster CRSs, cell sizes, pixel alignments, and bounds
         if not check_raster_grids(rasters):
             return
 
-        # Initialize with first raster
-        if not check_raster_size(rasters[0], limit=10000):
-            return
-        raster_data = self.raster_layer_to_array(rasters[0]).reshape(-1, 1)
-        for raster in rasters[1:]:
-            if not check_raster_size(raster, limit=10000):
-                return
-            data = self.raster_layer_to_array(raster)
-            raster_data = np.hstack((raster_data, data.reshape(-1, 1)))
-
-        color_field = self.color_selection.currentLayer()
-        if color_field is not None:
-            color_field_name = color_field.name() if color_field is not None else None
-        else:
-            color_field_name = None
+        # Read pixels of all rasters together, sampled for large rasters
+        raster_data = self.raster_layers_to_array(rasters, sample_size=SAMPLE_SIZE)
 
         # Replace duplicate raster names
         raster_names = check_duplicate_names(raster_names)
+        color_field_name = raster_names[-1] if color_raster is not None else None
         df = pd.DataFrame(raster_data, columns=raster_names)
 
         # if color_field_name:
@@ -2,7 +2,6 @@ from qgis.core import QgsMapLayerProxyModel, QgsVectorLayer
 from qgis.gui import QgsFieldComboBox
 from qgis.PyQt.QtWidgets import QListWidget, QPushButton, QWidget
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.pairplot import EISWizardPairplot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 
@@ -57,6 +56,8 @@ class EISWizardPairplotVector(EISWizardPairplot, FORM_CLASS):
 
     def plot(self, ax):
         """Plot to given axis."""
+        import eis_qgis_plugin.libs.seaborn as sns
+
         layer = self.layer.currentLayer()
 
         fields = [item.text() for item in self.fields.selectedItems()]
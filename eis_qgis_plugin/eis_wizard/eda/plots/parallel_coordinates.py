@@ -1,10 +1,6 @@
 from typing import Tuple
 
-import matplotlib.patches as patches
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.cm import ScalarMappable
-from matplotlib.path import Path
 from qgis.core import QgsMapLayer, QgsRasterLayer, QgsVectorLayer
 from qgis.gui import QgsColorButton
 from qgis.PyQt.QtWidgets import QComboBox
@@ -115,6 +111,10 @@ class EISWizardParallelCoordinatesPlot(EISPlot):
 
     
     def prepare_legend(self, ax, color_data, color_labels, color_field_type, cmap, norm):
+        import matplotlib.patches as patches
+        import matplotlib.pyplot as plt
+        from matplotlib.cm import ScalarMappable
+
         if self.dtype == QgsRasterLayer:
             color_column_name = self.color_selection.currentLayer().name()
         elif self.dtype == QgsVectorLayer:
@@ -153,6 +153,10 @@ class EISWizardParallelCoordinatesPlot(EISPlot):
 
 
     def draw(self, ax, data, color_data, cmap, norm):
+        import matplotlib.patches as patches
+        import matplotlib.pyplot as plt
+        from matplotlib.path import Path
+
         curved_lines = self.line_type.currentIndex() == 0
 
         for i in range(data.shape[0]):
@@ -1,20 +1,19 @@
-from typing import List
+from typing import List, Optional
 
-import matplotlib.colors as mcolors
-import matplotlib.pyplot as plt
 import numpy as np
 from qgis.core import QgsMapLayerProxyModel, QgsRasterLayer
 from qgis.gui import QgsMapLayerComboBox
 from qgis.PyQt.QtWidgets import QGroupBox, QSizePolicy, QWidget
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.parallel_coordinates import EISWizardParallelCoordinatesPlot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 from eis_qgis_plugin.utils.layer_data_table import LayerDataTable
-from eis_qgis_plugin.utils.misc_utils import check_raster_grids, check_raster_size
+from eis_qgis_plugin.utils.misc_utils import check_raster_grids
 
 FORM_CLASS: QWidget = load_ui("eda/wizard_plot_parallel_coordinates_raster.ui")
 
+SAMPLE_SIZE = 10000  # Pixels plotted at most
+
 
 class EISWizardParallelCoordinatesRasterPlot(EISWizardParallelCoordinatesPlot, FORM_CLASS):
     """
@@ -35,6 +34,7 @@ class EISWizardParallelCoordinatesRasterPlot(EISWizardParallelCoordinatesPlot, F
         super().__init__(parent)
         
         self.dtype = QgsRasterLayer
+        self.color_values: Optional[np.ndarray] = None  # Values of the color raster on the plotted pixels
 
         self.data_box.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
 
@@ -72,26 +72,30 @@ class EISWizardParallelCoordinatesRasterPlot(EISWizardParallelCoordinatesPlot, F
         # Get input values
         rasters = self.get_layers()
         raster_names = [raster.name() for raster in rasters]
+        color_raster = self.color_selection.currentLayer()
 
         # Check matching raster CRSs, cell sizes, pixel alignments, and bounds
-        if not check_raster_grids(rasters):
-            return
-            
-        # Initialize with first raster
-        if not check_raster_size(rasters[0], limit=10000):
+        if not check_raster_grids(rasters + ([color_raster] if color_raster is not None else [])):
             return
-        raster_data = self.raster_layer_to_array(rasters[0]).reshape(-1, 1)
-        for raster in rasters[1:]:
-            if not check_raster_size(raster, limit=10000):
-                return
-            data = self.raster_layer_to_array(raster)
-            raster_data = np.hstack((raster_data, data.reshape(-1, 1)))
+
+        # Read pixels of all rasters (and the color raster) together, sampled for large rasters
+        if color_raster is not None:
+            raster_data = self.raster_layers_to_array(rasters + [color_raster], sample_size=SAMPLE_SIZE)
+            raster_data, self.color_values = raster_data[:, :-1], raster_data[:, -1]
+        else:
+            raster_data = self.raster_layers_to_array(rasters, sample_size=SAMPLE_SIZE)
+            self.color_values = None
         data, y_min, y_max = self._normalize_data(raster_data)
 
         return data, raster_names, y_min, y_max
 
 
     def prepare_color_data(self):
+        import matplotlib.colors as mcolors
+        import matplotlib.pyplot as plt
+
+        import eis_qgis_plugin.libs.seaborn as sns
+
         if self.color_selection.currentLayer() is None:
             color = self.color.color().getRgbF()
             return None, None, None, color, None
@@ -99,12 +103,12 @@ class EISWizardParallelCoordinatesRasterPlot(EISWizardParallelCoordinatesPlot, F
         color_field_type = self.color_field_type.currentText().lower()
 
         if color_field_type == "continuous":
-            color_data = self.raster_layer_to_array(self.color_selection.currentLayer()).astype(np.float32)
+            color_data = self.color_values.astype(np.float32)
             palette_name = self.get_default_continuous_palette()
             color_labels = None
 
         elif color_field_type == "categorical":
-            data = self.raster_layer_to_array(self.color_selection.currentLayer()).astype(np.float32)
+            data = self.color_values.astype(np.float32)
             color_labels, color_data = self._encode_data(data)
             palette_name = self.get_default_categorical_palette()
 
@@ -1,12 +1,9 @@
 
-import matplotlib.colors as mcolors
-import matplotlib.pyplot as plt
 import numpy as np
 from qgis.core import QgsMapLayerProxyModel, QgsVectorLayer
 from qgis.gui import QgsFieldComboBox
 from qgis.PyQt.QtWidgets import QListWidget, QPushButton, QWidget
 
-import eis_qgis_plugin.libs.seaborn as sns
 from eis_qgis_plugin.eis_wizard.eda.plots.parallel_coordinates import EISWizardParallelCoordinatesPlot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 
@@ -76,6 +73,11 @@ class EISWizardParallelCoordinatesVectorPlot(EISWizardParallelCoordinatesPlot, F
 
 
     def prepare_color_data(self):
+        import matplotlib.colors as mcolors
+        import matplotlib.pyplot as plt
+
+        import eis_qgis_plugin.libs.seaborn as sns
+
         layer = self.layer.currentLayer()
         color_column_name = self.color_field.currentField()
         if not color_column_name:
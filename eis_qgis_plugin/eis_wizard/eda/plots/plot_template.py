@@ -1,12 +1,17 @@
+from typing import TYPE_CHECKING, List, Optional
+
 import numpy as np
-import pandas as pd
-from qgis.core import Qgis, QgsMapLayer, QgsRasterLayer, QgsVectorLayer
+from qgis.core import QgsMapLayer, QgsRasterLayer, QgsVectorLayer
 from qgis.gui import QgsCollapsibleGroupBox, QgsColorButton, QgsMapLayerComboBox
 from qgis.PyQt.QtWidgets import QSizePolicy, QWidget
 
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
+from eis_qgis_plugin.utils.raster_blocks import get_numpy_dtype, read_aligned_raster_values, read_raster_values
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class EISPlot(QWidget):
     """Template / parent class for plot classes in EIS Wizard."""
@@ -71,7 +76,7 @@ class EISPlot(QWidget):
         # container.setMaximumHeight(self.height())
 
     @staticmethod
-    def check_unique_values(df: pd.DataFrame, field_name: str, threshold: int = 10):
+    def check_unique_values(df: "pd.DataFrame", field_name: str, threshold: int = 10):
         """
         Check if given field in a Dataframe has more unique values than given threshold.
 
@@ -94,22 +99,7 @@ class EISPlot(QWidget):
     @staticmethod
     def convert_dtype(qgis_dtype) -> np.dtype:
         """Convert QGIS datatype to Numpy type."""
-        if qgis_dtype == Qgis.Float32:
-            dtype = np.float32
-        elif qgis_dtype == Qgis.Float64:
-            dtype = np.float64
-        elif qgis_dtype == Qgis.Int16:
-            dtype = np.int16
-        elif qgis_dtype == Qgis.Int32:
-            dtype = np.int32
-        elif qgis_dtype == Qgis.UInt16:
-            dtype = np.uint16
-        elif qgis_dtype == Qgis.UInt32:
-            dtype = np.uint32
-        else:
-            raise ValueError(f"Datatype conversion to Numpy failed. QGIS datatype: {qgis_dtype}")
-
-        return dtype
+        return get_numpy_dtype(qgis_dtype)
     
     @staticmethod
     def vector_layer_to_numpy(layer: QgsVectorLayer, *fields, dtype = None):
@@ -120,8 +110,10 @@ class EISPlot(QWidget):
         return data
 
     @staticmethod
-    def vector_layer_to_df(layer: QgsVectorLayer, *fields) -> pd.DataFrame:
+    def vector_layer_to_df(layer: QgsVectorLayer, *fields) -> "pd.DataFrame":
         """Create a DataFrame from given vector layer and its fields."""
+        import pandas as pd
+
         df_data = {field: [] for field in fields}
 
         # Iterate over features and collect to arrays
@@ -135,17 +127,25 @@ class EISPlot(QWidget):
         return df
 
     @staticmethod
-    def raster_layer_to_array(layer: QgsRasterLayer, filter_nodata: bool = True) -> np.ndarray:
-        """Create a 1D Numpy array from raster layer and filter nodata."""
-        provider = layer.dataProvider()
-        rows, cols = layer.height(), layer.width()
+    def raster_layer_to_array(
+        layer: QgsRasterLayer, band: int = 1, filter_nodata: bool = True, sample_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Create a 1D Numpy array from a raster layer band and filter nodata.
 
-        block = provider.block(1, layer.extent(), cols, rows)
-        numpy_dtype = EISPlot.convert_dtype(block.dataType())
-        data = np.frombuffer(block.data(), dtype=numpy_dtype)
+        The raster is read in tiles. If it is larger than `sample_size` or the raster read memory limit in
+        settings, a regular sample of its pixels is read.
+        """
+        return read_raster_values(layer, band, sample_size, filter_nodata)
 
-        if filter_nodata:
-            filtered_data = data[data != block.noDataValue()]
-            return filtered_data
+    @staticmethod
+    def raster_layers_to_array(
+        layers: List[QgsRasterLayer], bands: Optional[List[int]] = None, sample_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Create a 2D Numpy array with a column for each raster layer band and filter nodata.
 
-        return data
+        The rasters should have matching grids. Pixels that are nodata in any of the rasters are left out.
+        Sampling works like in `raster_layer_to_array`.
+        """
+        return read_aligned_raster_values(layers, bands, sample_size)
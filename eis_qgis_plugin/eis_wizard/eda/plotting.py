@@ -1,10 +1,10 @@
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from typing import List, Optional
+
 from qgis.core import QgsApplication
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QComboBox, QDialogButtonBox, QFrame, QSizePolicy, QStackedWidget, QVBoxLayout, QWidget
 
+from eis_qgis_plugin.eis_wizard.eda.plot_utils import close_all_figures
 from eis_qgis_plugin.eis_wizard.eda.plots.barplot import EISWizardBarplot
 from eis_qgis_plugin.eis_wizard.eda.plots.boxplot import EISWizardBoxplot
 from eis_qgis_plugin.eis_wizard.eda.plots.ecdf import EISWizardEcdf
@@ -15,6 +15,7 @@ from eis_qgis_plugin.eis_wizard.eda.plots.pairplot_raster import EISWizardPairpl
 from eis_qgis_plugin.eis_wizard.eda.plots.pairplot_vector import EISWizardPairplotVector
 from eis_qgis_plugin.eis_wizard.eda.plots.parallel_coordinates_raster import EISWizardParallelCoordinatesRasterPlot
 from eis_qgis_plugin.eis_wizard.eda.plots.parallel_coordinates_vector import EISWizardParallelCoordinatesVectorPlot
+from eis_qgis_plugin.eis_wizard.eda.plots.plot_template import EISPlot
 from eis_qgis_plugin.eis_wizard.eda.plots.scatterplot import EISWizardScatterplot
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 
@@ -24,6 +25,21 @@ FORM_CLASS: QWidget = load_ui("eda/wizard_plot.ui")
 
 class EISWizardPlotting(QWidget, FORM_CLASS):
 
+    # Parameter pages in the order of plot type selection
+    PAGE_CLASSES = [
+        EISWizardHistogram,
+        EISWizardKde,
+        EISWizardEcdf,
+        EISWizardScatterplot,
+        EISWizardLineplot,
+        EISWizardBarplot,
+        EISWizardBoxplot,
+        EISWizardPairplotVector,
+        EISWizardPairplotRaster,
+        EISWizardParallelCoordinatesVectorPlot,
+        EISWizardParallelCoordinatesRasterPlot,
+    ]
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setupUi(self)
@@ -50,40 +66,47 @@ class EISWizardPlotting(QWidget, FORM_CLASS):
         self.create_plot_btn.clicked.connect(self.create_plot)
         self.create_plot_btn.setDefault(True)
 
-        self.plot_type_selection.currentIndexChanged['int'].connect(self.plot_parameters_container.setCurrentIndex)
+        self.plot_type_selection.currentIndexChanged['int'].connect(self.show_parameter_page)
 
         self.plot_parameters_container.currentChanged.connect(self.resize_parameter_container)
 
-        # Create pages for parameters
-        self.pages = [
-            EISWizardHistogram(self),
-            EISWizardKde(self),
-            EISWizardEcdf(self),
-            EISWizardScatterplot(self),
-            EISWizardLineplot(self),
-            EISWizardBarplot(self),
-            EISWizardBoxplot(self),
-            EISWizardPairplotVector(self),
-            EISWizardPairplotRaster(self),
-            EISWizardParallelCoordinatesVectorPlot(self),
-            EISWizardParallelCoordinatesRasterPlot(self),
-        ]
-
-        for i, page in enumerate(self.pages):
-            self.plot_parameters_container.insertWidget(i, page)
+        # Pages for parameters are built when their plot type is first selected, empty placeholders until then
+        self.pages: List[Optional[EISPlot]] = [None] * len(self.PAGE_CLASSES)
+        for i in range(len(self.PAGE_CLASSES)):
+            self.plot_parameters_container.insertWidget(i, QWidget())
+        self.get_page(0)
 
         # Init plot space
         self.plot_layout = QVBoxLayout()
         self.plot_container.setLayout(self.plot_layout)
 
-        # TODO: Refactor
-        for idx in (-1, -3):
-            self.pages[idx].data_layer_table.size_changed.connect(
-                lambda change: self.plot_parameters_container.setMinimumHeight(
-                    self.plot_parameters_container.minimumHeight() + change
+
+    def get_page(self, index: int) -> EISPlot:
+        """Returns the parameter page of a plot type, building it in place of its placeholder on first use."""
+        if self.pages[index] is None:
+            page = self.PAGE_CLASSES[index](self)
+            # The page is put directly to the container (not inside a wrapper), because it resizes the container
+            current_index = self.plot_parameters_container.currentIndex()
+            placeholder = self.plot_parameters_container.widget(index)
+            self.plot_parameters_container.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.plot_parameters_container.insertWidget(index, page)
+            self.plot_parameters_container.setCurrentIndex(current_index)
+
+            if hasattr(page, "data_layer_table"):
+                page.data_layer_table.size_changed.connect(
+                    lambda change: self.plot_parameters_container.setMinimumHeight(
+                        self.plot_parameters_container.minimumHeight() + change
+                    )
                 )
-            )
-        
+            self.pages[index] = page
+        return self.pages[index]
+
+
+    def show_parameter_page(self, index: int):
+        self.get_page(index)
+        self.plot_parameters_container.setCurrentIndex(index)
+
 
     def resize_parameter_container(self, index):
         """Resize the QStackedWidget that contains plot parameters according to the needed size."""
@@ -94,9 +117,13 @@ class EISWizardPlotting(QWidget, FORM_CLASS):
 
 
     def create_plot(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+
         self.close_and_remove_plot()
 
-        page = self.pages[self.plot_parameters_container.currentIndex()]
+        page = self.get_page(self.plot_parameters_container.currentIndex())
 
         fig, ax = plt.subplots()
         if isinstance(page, (EISWizardPairplotVector, EISWizardPairplotRaster)):
@@ -115,11 +142,13 @@ class EISWizardPlotting(QWidget, FORM_CLASS):
 
 
     def open_plot(self):
+        import matplotlib.pyplot as plt
+
         plt.show()
 
 
     def close_and_remove_plot(self):
-        plt.close('all')
+        close_all_figures()
         for i in reversed(range(self.plot_layout.count())):
             widget = self.plot_layout.itemAt(i).widget()
             if widget is not None:
@@ -127,4 +156,4 @@ class EISWizardPlotting(QWidget, FORM_CLASS):
 
 
     def reset_parameters(self):
-        self.pages[self.plot_parameters_container.currentIndex()].reset()
+        self.get_page(self.plot_parameters_container.currentIndex()).reset()
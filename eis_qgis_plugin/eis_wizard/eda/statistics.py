@@ -1,17 +1,82 @@
-from typing import Tuple
-
-from qgis import processing
-from qgis.core import NULL, QgsApplication, QgsFieldProxyModel, QgsMapLayer
+from typing import Optional
+
+from qgis.core import (
+    QgsApplication,
+    QgsFeedback,
+    QgsFieldProxyModel,
+    QgsMapLayer,
+    QgsProcessingAlgRunnerTask,
+    QgsProcessingContext,
+    QgsProcessingFeedback,
+    QgsProject,
+    QgsTask,
+)
 from qgis.gui import QgsFieldComboBox, QgsRasterBandComboBox, QgsSpinBox
 from qgis.PyQt.QtGui import QIcon
-from qgis.PyQt.QtWidgets import QLineEdit, QPushButton, QWidget
+from qgis.PyQt.QtWidgets import QCheckBox, QLineEdit, QProgressBar, QPushButton, QWidget
 
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
+from eis_qgis_plugin.utils.streaming_statistics import (
+    QUANTILES,
+    StreamingStatistics,
+    compute_raster_statistics,
+    compute_vector_statistics,
+)
 
 FORM_CLASS: QWidget = load_ui("eda/wizard_statistics.ui")
 
 
+class EISStatisticsTask(QgsTask):
+    """
+    Computes the statistics of a raster band or a vector field in the background.
+
+    The layer is cloned, so that it is not read from the task thread while QGIS uses it. If exact quantiles
+    were requested but the data was too large to keep the values in memory, `needs_exact_quantiles` is set
+    and the page computes them with EIS Toolkit in a processing task.
+    """
+
+    def __init__(self, layer: QgsMapLayer, band: int, field: str, exact_quantiles: bool) -> None:
+        super().__init__(f"Computing statistics for {layer.name()}", QgsTask.CanCancel)
+        self.layer = layer.clone()
+        self.band = band
+        self.field = field
+        self.exact_quantiles = exact_quantiles
+
+        self.feedback = QgsFeedback()
+        self.feedback.progressChanged.connect(self.setProgress)
+        self.statistics: Optional[StreamingStatistics] = None
+        self.results = {}
+        self.exception: Optional[Exception] = None
+
+
+    @property
+    def needs_exact_quantiles(self) -> bool:
+        return bool(self.results) and self.exact_quantiles and not self.statistics.has_exact_quantiles
+
+
+    def cancel(self):
+        self.feedback.cancel()
+        super().cancel()
+
+
+    def run(self) -> bool:
+        # Compute everything in one pass over the data, reading bounded raster tiles or feature batches
+        try:
+            if self.layer.type() == QgsMapLayer.VectorLayer:
+                self.statistics = compute_vector_statistics(self.layer, self.field, self.feedback)
+            else:
+                self.statistics = compute_raster_statistics(self.layer, self.band, self.feedback)
+        except Exception as e:
+            self.exception = e
+            return False
+        if self.isCanceled():
+            return False
+
+        self.results = self.statistics.to_dict()
+        return True
+
+
 class EISWizardStatistics(QWidget, FORM_CLASS):
 
     def __init__(self, parent=None) -> None:
@@ -23,7 +88,9 @@ class EISWizardStatistics(QWidget, FORM_CLASS):
         self.band: QgsRasterBandComboBox
         self.field: QgsFieldComboBox
         self.decimals: QgsSpinBox
+        self.exact_quantiles: QCheckBox
         self.compute_btn: QPushButton
+        self.progress_bar: QProgressBar
 
         self.n_total: QLineEdit
         self.n_null: QLineEdit
@@ -63,6 +130,12 @@ class EISWizardStatistics(QWidget, FORM_CLASS):
         self.compute_btn.setDefault(True)
         self.compute_btn.clicked.connect(self.compute_statistics)
 
+        self.statistics_task: Optional[EISStatisticsTask] = None
+        self.exact_quantiles_task: Optional[QgsProcessingAlgRunnerTask] = None
+        # The context and feedback must live as long as the processing task
+        self.exact_quantiles_context: Optional[QgsProcessingContext] = None
+        self.exact_quantiles_feedback: Optional[QgsProcessingFeedback] = None
+
 
     def _update_layer(self, layer: QgsMapLayer):
         """Update (set/show/hide) widgets based on selected layer."""
@@ -84,86 +157,113 @@ class EISWizardStatistics(QWidget, FORM_CLASS):
 
     def compute_statistics(self):
         layer = self.layer.currentLayer()
-        self._check_valid_layer_type(layer)
-        self.compute_general_statistics(layer)
-        self.compute_descriptive_statistics_and_quantiles(layer)
+        if not self._check_valid_layer_type(layer):
+            return
+        if self.statistics_task is not None or self.exact_quantiles_task is not None:
+            EISMessageManager().show_message("Statistics are still being computed.", "invalid")
+            return
 
+        task = EISStatisticsTask(
+            layer, self.band.currentBand(), self.field.currentField(), self.exact_quantiles.isChecked()
+        )
+        task.progressChanged.connect(lambda progress: self.progress_bar.setValue(int(progress)))
+        task.taskCompleted.connect(lambda: self._on_statistics_computed(task))
+        task.taskTerminated.connect(lambda: self._on_statistics_computed(task))
 
-    def _check_valid_layer_type(self, layer: QgsMapLayer) -> bool:
-        if layer.type() not in [QgsMapLayer.VectorLayer, QgsMapLayer.RasterLayer]:
-            EISMessageManager().show_message(f"Unsupported layer type: {layer.type()}", "invalid")
-            return False
-        return True
+        self.statistics_task = task
+        self.compute_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        QgsApplication.taskManager().addTask(task)
 
 
-    def compute_general_statistics(self, layer: QgsMapLayer):
-        if layer.type() == QgsMapLayer.VectorLayer:
-            n_total, n_null = self._compute_general_statistics_vector(layer)
+    def _on_statistics_computed(self, task: EISStatisticsTask):
+        self.statistics_task = None
+        if task.exception is not None:
+            self._finish()
+            EISMessageManager().show_message(f"Computing statistics failed: {task.exception}", "error")
+            return
+        if task.statistics is None or task.isCanceled():
+            self._finish()
+            return
+
+        self.n_total.setText(str(task.statistics.n_total))
+        self.n_null.setText(str(task.statistics.n_null))
+        if not task.results:
+            self._finish()
+            EISMessageManager().show_message("No valid values to compute descriptive statistics from.", "invalid")
+        elif task.needs_exact_quantiles:
+            self._compute_exact_quantiles(task)
         else:
-            n_total, n_null = self._compute_general_statistics_raster(layer)
-        self.n_total.setText(str(n_total))
-        self.n_null.setText(str(n_null))
-
-
-    def _compute_general_statistics_vector(self, layer: QgsMapLayer) -> Tuple[int, int]:
-        field = self.field.currentField()
-        all_values = [feature.attribute(field) for feature in layer.getFeatures()]
-        n_total = len(all_values)
-        n_null = len([value for value in all_values if value == NULL]) 
-        # nr_of_valids = nr_of_all_values - nr_of_nulls
-        return n_total, n_null  
-
-
-    def _compute_general_statistics_raster(self, layer: QgsMapLayer) -> Tuple[int, int]:
-        data_provider = layer.dataProvider()
-        width = layer.width()
-        height = layer.height()
-        band = int(self.band.currentIndex())
-
-        data_block = data_provider.block(band, layer.extent(), width, height)
-        n_null = 0
-        # nr_of_valids = 0
-        n_total = width * height
-
-        # Loop over all pixels
-        for row in range(height):
-            for col in range(width):
-                pixel_value = data_block.value(row, col)
-                if pixel_value == NULL:
-                    n_null += 1
-                else:
-                    # nr_of_valids += 1
-                    pass
-        return n_total, n_null
+            self._finish(task.results)
 
 
-    def compute_descriptive_statistics_and_quantiles(self, layer: QgsMapLayer):
-        # Compute descriptive statistics (including quantiles)
-        if layer.type() == QgsMapLayer.VectorLayer:
-            descriptive_statistics_results = processing.run(
-                "eis:descriptive_statistics_vector",
-                {
-                    "input_file": self.layer.currentLayer(),
-                    "column": self.field.currentField(),
-                },
-            )
+    def _compute_exact_quantiles(self, task: EISStatisticsTask):
+        """Computes exact quantiles with EIS Toolkit, used when the data is too large to keep in memory."""
+        if task.layer.type() == QgsMapLayer.VectorLayer:
+            alg_id = "eis:descriptive_statistics_vector"
+            params = {"input_file": task.layer, "column": task.field}
         else:
-            descriptive_statistics_results = processing.run(
-                "eis:descriptive_statistics_raster",
-                {
-                    "input_raster": self.layer.currentLayer(),
-                    "band": self.band.currentBand()
-                },
+            alg_id = "eis:descriptive_statistics_raster"
+            params = {"input_raster": task.layer, "band": task.band}
+
+        algorithm = QgsApplication.processingRegistry().createAlgorithmById(alg_id)
+        if algorithm is None:
+            self._finish(task.results)
+            EISMessageManager().show_message(
+                "Computing exact quantiles failed, showing approximate quantiles.", "error"
             )
+            return
+
+        self.exact_quantiles_context = QgsProcessingContext()
+        self.exact_quantiles_context.setProject(QgsProject.instance())
+        self.exact_quantiles_feedback = QgsProcessingFeedback()
+        self.exact_quantiles_task = QgsProcessingAlgRunnerTask(
+            algorithm,
+            params,
+            self.exact_quantiles_context,
+            self.exact_quantiles_feedback
+        )
+        self.exact_quantiles_task.progressChanged.connect(lambda progress: self.progress_bar.setValue(int(progress)))
+        self.exact_quantiles_task.executed.connect(
+            lambda successful, results: self._on_exact_quantiles_computed(task.results, successful, results)
+        )
+        self.progress_bar.setValue(0)
+        QgsApplication.taskManager().addTask(self.exact_quantiles_task)
+
+
+    def _on_exact_quantiles_computed(self, results: dict, successful: bool, descriptive_statistics_results: dict):
+        canceled = self.exact_quantiles_feedback.isCanceled()
+        self.exact_quantiles_task = None
+        self.exact_quantiles_context = None
+        self.exact_quantiles_feedback = None
+        if canceled:
+            self._finish()
+            return
 
         # Check if dictionary is empty = processing failed
-        if not descriptive_statistics_results:
-            EISMessageManager().show_message("Computing descriptive statistics failed.", "error")
+        if successful and descriptive_statistics_results:
+            results = {**results, **{key: descriptive_statistics_results.get(key) for key in QUANTILES}}
         else:
-            # Calculate variance 
-            descriptive_statistics_results["variance"] = pow(descriptive_statistics_results["standard_deviation"], 2)
+            EISMessageManager().show_message(
+                "Computing exact quantiles failed, showing approximate quantiles.", "error"
+            )
+        self._finish(results)
+
+
+    def _finish(self, results: Optional[dict] = None):
+        self.compute_btn.setEnabled(True)
+        if results is not None:
+            self._update_descriptive_statistics_widgets(results)
+
+
+    def _check_valid_layer_type(self, layer: QgsMapLayer) -> bool:
+        if layer.type() not in [QgsMapLayer.VectorLayer, QgsMapLayer.RasterLayer]:
+            EISMessageManager().show_message(f"Unsupported layer type: {layer.type()}", "invalid")
+            return False
+        return True
+
 
-        # Update widgets
+    def _update_descriptive_statistics_widgets(self, descriptive_statistics_results: dict):
         decimals = self.decimals.value()
         for dict_key, widget in self.descriptive_stats_widgets.items():
             value = descriptive_statistics_results.get(dict_key)
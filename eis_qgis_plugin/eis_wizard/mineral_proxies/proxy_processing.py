@@ -25,6 +25,7 @@ from eis_qgis_plugin.utils.misc_utils import (
     set_filter,
 )
 from eis_qgis_plugin.utils.model_feedback import EISProcessingFeedback
+from eis_qgis_plugin.utils.raster_overviews import build_overviews_in_background
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
 
@@ -139,6 +140,7 @@ class EISWizardProxyProcess(QWidget):
                 )
             else:
                 QgsProject.instance().addMapLayer(output_layer, True)
+            build_overviews_in_background(output_layer)
 
             if self.process_type == "multi_step":
                 i = self.proxy_manager.proxy_pages.currentIndex() + 1
@@ -1,9 +1,5 @@
 from typing import Tuple
 
-import matplotlib.pyplot as plt
-import pandas as pd
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from qgis.core import QgsApplication, QgsMapLayerProxyModel, QgsProject, QgsRasterLayer
 from qgis.gui import QgsDoubleSpinBox, QgsFileWidget, QgsMapLayerComboBox
 from qgis.PyQt.QtWidgets import (
@@ -21,7 +17,7 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
 )
 
-import eis_qgis_plugin.libs.seaborn as sns
+from eis_qgis_plugin.eis_wizard.eda.plot_utils import close_all_figures
 from eis_qgis_plugin.eis_wizard.modeling.fuzzy_modeling.fuzzy_memberships import (
     FuzzyMembership,
     GaussianMembership,
@@ -43,6 +39,8 @@ from eis_qgis_plugin.utils.misc_utils import (
     set_placeholder_text,
 )
 from eis_qgis_plugin.utils.model_feedback import EISProcessingFeedback
+from eis_qgis_plugin.utils.raster_overviews import build_overviews_in_background
+from eis_qgis_plugin.utils.raster_statistics import get_approximate_range
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
 FORM_CLASS: QWidget = load_ui("modeling/wizard_fuzzy_modeling.ui")
@@ -135,6 +133,7 @@ class EISWizardFuzzyModeling(QWidget, FORM_CLASS):
                     add_output_layer_to_group(layer, "Modeling — Fuzzy")
                 else:
                     QgsProject.instance().addMapLayer(layer, True)
+                build_overviews_in_background(layer)
 
                 # apply_color_ramp_to_raster_layer(layer, EISSettingsManager.get_raster_color_ramp())
 
@@ -283,12 +282,19 @@ class EISWizardFuzzyModeling(QWidget, FORM_CLASS):
 
     @staticmethod
     def get_selected_raster_range(layer: QgsRasterLayer) -> Tuple[float, float]:
-        stats = layer.dataProvider().bandStatistics(1)
-        return stats.minimumValue, stats.maximumValue
+        # Approximate range is enough for the plot and does not block the GUI with a full scan
+        return get_approximate_range(layer)
 
 
     def plot(self):
         """Create plot for membership function and handle related widget clearing and setting."""
+        import matplotlib.pyplot as plt
+        import pandas as pd
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+
+        import eis_qgis_plugin.libs.seaborn as sns
+
         self.close_and_remove_plot()
         fig, ax = plt.subplots()
 
@@ -320,7 +326,7 @@ class EISWizardFuzzyModeling(QWidget, FORM_CLASS):
 
     def close_and_remove_plot(self):
         """Close and remove existing plots."""
-        plt.close('all')
+        close_all_figures()
         for i in reversed(range(self.plot_layout.count())):
             widget = self.plot_layout.itemAt(i).widget()
             if widget is not None:
@@ -31,6 +31,7 @@ from eis_qgis_plugin.utils.misc_utils import (
     set_placeholder_text,
 )
 from eis_qgis_plugin.utils.model_feedback import EISProcessingFeedback
+from eis_qgis_plugin.utils.raster_overviews import build_overviews_in_background
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
 FORM_CLASS: QWidget = load_ui("modeling/testing.ui")
@@ -129,6 +130,7 @@ class EISMLModelTesting(QWidget, FORM_CLASS):
                     )
                 else:
                     QgsProject.instance().addMapLayer(layer, True)
+                build_overviews_in_background(layer)
 
                 # apply_color_ramp_to_raster_layer(layer, EISSettingsManager.get_raster_color_ramp())
 
@@ -23,7 +23,7 @@ from qgis.PyQt.QtWidgets import (
 from eis_qgis_plugin.eis_wizard.modeling.ml_model_info import MLModelInfo
 from eis_qgis_plugin.eis_wizard.modeling.model_data_table import ModelTrainingDataTable
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
-from eis_qgis_plugin.utils.algorithm_execution import AlgorithmExecutor
+from eis_qgis_plugin.utils.algorithm_execution import AlgorithmExecutor, AlgorithmJob
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
 from eis_qgis_plugin.utils.misc_utils import set_filter
 from eis_qgis_plugin.utils.model_feedback import EISProcessingFeedback
@@ -77,7 +77,8 @@ class EISMLModelTraining(QWidget, FORM_CLASS):
 
         set_filter(self.train_model_save_path, "joblib")
 
-        self.executor = AlgorithmExecutor()
+        # Training runs are long, let quicker runs of other pages go first
+        self.executor = AlgorithmExecutor(priority=AlgorithmJob.LOW_PRIORITY)
         self.executor.finished.connect(self.on_algorithm_executor_finished)
         self.executor.terminated.connect(self.on_algorithm_executor_terminated)
         self.executor.error.connect(self.on_algorithm_executor_error)
@@ -19,6 +19,7 @@ from eis_qgis_plugin.utils.misc_utils import (
     set_placeholder_text,
 )
 from eis_qgis_plugin.utils.model_feedback import EISProcessingFeedback
+from eis_qgis_plugin.utils.raster_overviews import build_overviews_in_background
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
 FORM_CLASS: QWidget = load_ui("modeling/calculate_weights.ui")
@@ -119,6 +120,7 @@ class EISWofeCalculateWeights(QWidget, FORM_CLASS):
                     )
                 else:
                     QgsProject.instance().addMapLayer(layer, True)
+                build_overviews_in_background(layer)
 
                 # apply_color_ramp_to_raster_layer(layer, EISSettingsManager.get_raster_color_ramp())
 
@@ -3,6 +3,7 @@ from qgis.PyQt.QtWidgets import QTabWidget, QVBoxLayout, QWidget
 from eis_qgis_plugin.eis_wizard.eda.exploratory_analysis import EISExploratoryAnalysis
 from eis_qgis_plugin.eis_wizard.eda.plotting import EISWizardPlotting
 from eis_qgis_plugin.eis_wizard.eda.statistics import EISWizardStatistics
+from eis_qgis_plugin.utils.lazy_page import LazyPage
 
 
 class EISWizardEDA(QWidget):
@@ -19,10 +20,10 @@ class EISWizardEDA(QWidget):
         self.plot_page = EISWizardPlotting(self)
         self.eda_tabs.addTab(self.plot_page, "Plots")
         
-        # 2. Statistics page
-        self.stats_page = EISWizardStatistics(self)
+        # 2. Statistics page (built when the tab is first opened)
+        self.stats_page = LazyPage(EISWizardStatistics, self)
         self.eda_tabs.addTab(self.stats_page, "Statistics")
 
-        # 3. Exploratory analysis page
-        self.exploratory_page = EISExploratoryAnalysis(self)
+        # 3. Exploratory analysis page (built when the tab is first opened)
+        self.exploratory_page = LazyPage(EISExploratoryAnalysis, self)
         self.eda_tabs.addTab(self.exploratory_page, "Exploratory analysis")
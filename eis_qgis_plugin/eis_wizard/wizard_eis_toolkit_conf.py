@@ -1,6 +1,9 @@
+import threading
+from typing import Optional
 
 from qgis.core import QgsApplication
 from qgis.gui import QgsFileWidget
+from qgis.PyQt.QtCore import pyqtSignal
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import (
     QDialog,
@@ -13,9 +16,12 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
 )
 
+from eis_qgis_plugin.environment.eis_docker_session import shutdown_docker_sessions
 from eis_qgis_plugin.environment.eis_toolkit_invoker import EISToolkitInvoker
+from eis_qgis_plugin.environment.eis_toolkit_worker import shutdown_toolkit_workers
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
+from eis_qgis_plugin.utils.result_cache import EISResultCache
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
 FORM_CLASS: QDialog = load_ui("wizard_toolkit_conf.ui")
@@ -27,6 +33,8 @@ CONF_BOX_VENV_HEIGHT = 49
 
 class EISWizardToolkitConfiguration(QWidget, FORM_CLASS):
 
+    verification_finished = pyqtSignal(bool, str, bool, str)
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setupUi(self)
@@ -66,6 +74,8 @@ class EISWizardToolkitConfiguration(QWidget, FORM_CLASS):
         )
         self.verify_env_btn.setIcon(QIcon(QgsApplication.getThemeIcon("mActionRefresh.svg")))
         self.verify_env_btn.clicked.connect(self._on_verify_env_btn_clicked)
+        self.verification_finished.connect(self._on_verification_finished)
+        self.verification_thread: Optional[threading.Thread] = None
 
         # self.create_venv_btn = self.venv_conf_button_box.addButton(
         #     "Create new venv and install EIS Toolkit", QDialogButtonBox.ActionRole
@@ -84,6 +94,7 @@ class EISWizardToolkitConfiguration(QWidget, FORM_CLASS):
 
         self._on_environment_type_changed(self.docker_selection.isChecked())
         self.load_settings()  # Initialize UI from settings
+        self.verify_environment(use_cache=True)
 
 
     def reset_verification_labels(self, text = None):
@@ -160,6 +171,7 @@ class EISWizardToolkitConfiguration(QWidget, FORM_CLASS):
             )
             env_result, env_message = toolkit_invoker.upgrade_toolkit()
             if env_result:
+                EISResultCache.clear()  # Results of the previous EIS Toolkit version might differ
                 EISMessageManager().show_message(env_message, "success")
             else:
                 EISMessageManager().show_message(env_message, "error")
@@ -171,19 +183,59 @@ class EISWizardToolkitConfiguration(QWidget, FORM_CLASS):
     #         print("Finished installing EIS Toolkit")
 
 
-    def _on_verify_env_btn_clicked(self):        
+    def _on_verify_env_btn_clicked(self):
+        self.verify_environment(use_cache=False)
+
+
+    def verify_environment(self, use_cache: bool):
+        """
+        Verifies the environment and EIS Toolkit installation in a background thread.
+
+        Args:
+            use_cache: Whether a cached EIS Toolkit verification outcome can be used. The cache is keyed
+                by the environment, so a cached outcome is only used if the environment has not changed.
+        """
+        if self.verification_thread is not None and self.verification_thread.is_alive():
+            return
+
         self.reset_verification_labels()
+        self.environment_status_line.setStyleSheet("")
+        self.environment_status_line.setText("Verifying...")
+        self.verify_env_btn.setEnabled(False)
 
         toolkit_invoker = EISToolkitInvoker(
             self.env_type, self.venv_directory.filePath(), self.docker_path.filePath(), self.docker_image_name.text()
         )
-        env_result, env_message = toolkit_invoker.verify_environment()
+        self.verification_thread = threading.Thread(
+            target=self._verify, args=(toolkit_invoker, use_cache), daemon=True
+        )
+        self.verification_thread.start()
+
+
+    def _verify(self, toolkit_invoker: EISToolkitInvoker, use_cache: bool):
+        """Runs in the verification thread."""
+        toolkit_result, toolkit_message = False, ""
+        try:
+            env_result, env_message = toolkit_invoker.verify_environment()
+            # Only try to verify toolkit installation if environment itself is OK
+            if env_result:
+                toolkit_result, toolkit_message = toolkit_invoker.verify_toolkit(use_cache)
+        except Exception as e:
+            env_result, env_message = False, f"Verification failed. Error: {e}"
+
+        try:
+            self.verification_finished.emit(env_result, env_message, toolkit_result, toolkit_message)
+        except RuntimeError:  # Page was deleted while verifying
+            pass
+
+
+    def _on_verification_finished(
+        self, env_result: bool, env_message: str, toolkit_result: bool, toolkit_message: str
+    ):
+        self.verify_env_btn.setEnabled(True)
         self.environment_status_line.setText(env_message)
         if env_result:
             self.environment_status_line.setStyleSheet("color: green;")
-            
-            # Only try to verify toolkit installation if environment itself is OK
-            toolkit_result, toolkit_message = toolkit_invoker.verify_toolkit()
             self.eis_toolkit_status_line.setText(toolkit_message)
             if toolkit_result:
                 self.eis_toolkit_status_line.setStyleSheet("color: green;")
@@ -212,5 +264,9 @@ class EISWizardToolkitConfiguration(QWidget, FORM_CLASS):
         EISSettingsManager.set_docker_image_name(self.docker_image_name.text())
         EISSettingsManager.set_docker_host_folder(self.docker_host_folder.filePath())
         EISSettingsManager.set_docker_temp_folder(self.docker_temp_folder.filePath())
+
+        # Persistent workers and containers of the previous configuration are not needed anymore
+        shutdown_toolkit_workers()
+        shutdown_docker_sessions()
         
         EISMessageManager().show_message("EIS Toolkit environment configuration saved.", "success")
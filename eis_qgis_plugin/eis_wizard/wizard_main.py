@@ -13,7 +13,10 @@ from eis_qgis_plugin.eis_wizard.wizard_history import EISWizardHistory
 from eis_qgis_plugin.eis_wizard.wizard_modeling import EISWizardModeling
 from eis_qgis_plugin.eis_wizard.wizard_proxies import EISWizardProxies
 from eis_qgis_plugin.eis_wizard.wizard_settings import EISWizardSettings
+from eis_qgis_plugin.environment.eis_toolkit_invoker import EISToolkitInvoker
+from eis_qgis_plugin.environment.eis_toolkit_prewarm import start_prewarm
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
+from eis_qgis_plugin.utils.lazy_page import LazyPage
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
 from eis_qgis_plugin.utils.misc_utils import PLUGIN_PATH
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
@@ -101,29 +104,29 @@ class EISWizard(QWidget, FORM_CLASS):
         self.message_manager.set_message_bar(self.message_bar)
         self.model_manager = ModelManager()
 
-        # Add pages
+        # Add pages. Pages other than Settings are built when first shown (see LazyPage), so that opening
+        # the wizard does not fill every layer combo box of every page
 
         # Create Settings page first
         self.settings_page = EISWizardSettings(self)
         self.pages_widget.insertWidget(5, self.settings_page)
 
-        self.proxies_page = EISWizardProxies(self)
+        self.proxies_page = LazyPage(EISWizardProxies, self)
         self.pages_widget.insertWidget(0, self.proxies_page)
 
-        self.eda_page = EISWizardEDA(self)
+        self.eda_page = LazyPage(EISWizardEDA, self)
         self.pages_widget.insertWidget(1, self.eda_page)
 
-        self.model_page = EISWizardModeling(self, self.model_manager)
+        self.model_page = LazyPage(lambda parent: EISWizardModeling(parent, self.model_manager), self)
         self.pages_widget.insertWidget(2, self.model_page)
-        # self.pages_widget.insertWidget(2, QWidget())
 
-        self.evaluation_page = EISWizardEvaluation(self)
+        self.evaluation_page = LazyPage(EISWizardEvaluation, self)
         self.pages_widget.insertWidget(3, self.evaluation_page)
 
-        self.history_page = EISWizardHistory(self, self.model_manager)
+        self.history_page = LazyPage(lambda parent: EISWizardHistory(parent, self.model_manager), self)
         self.pages_widget.insertWidget(4, self.history_page)
 
-        self.about_page = EISWizardAbout(self)
+        self.about_page = LazyPage(EISWizardAbout, self)
         self.pages_widget.insertWidget(6, self.about_page)
 
         # Set menu
@@ -138,6 +141,17 @@ class EISWizard(QWidget, FORM_CLASS):
         # Connect settings signal
         self.settings_page.minimal_menu_setting_changed.connect(self.create_menu)
 
+        if EISSettingsManager.get_prewarm_selection():
+            self.prewarm_toolkit()
+
+
+    def prewarm_toolkit(self):
+        """Starts warming up the configured EIS Toolkit environment in the background."""
+        try:
+            start_prewarm(EISToolkitInvoker())
+        except ValueError:
+            pass  # Environment not configured, nothing to warm up
+
 
     def create_menu(self, minimize_text: bool = False):
         for i, (text, icon) in enumerate(self.menu_items):
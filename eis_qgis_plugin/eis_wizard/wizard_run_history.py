@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from qgis.core import QgsApplication
+from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtGui import QIcon
+from qgis.PyQt.QtWidgets import (
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QHeaderView,
+    QLineEdit,
+    QMessageBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QWidget,
+)
+
+from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
+from eis_qgis_plugin.utils.message_manager import EISMessageManager
+from eis_qgis_plugin.utils.run_log import EISRunLog
+
+FORM_CLASS = load_ui("wizard_run_history.ui")
+
+
+class EISWizardRunHistory(QDialog, FORM_CLASS):
+    """Dialog that lists, filters and aggregates the algorithm runs recorded in EISRunLog."""
+
+    RUN_HEADERS = {
+        "started_at": "Started",
+        "algorithm": "Algorithm",
+        "execution_mode": "Mode",
+        "status": "Status",
+        "exit_code": "Exit code",
+        "input_pixels": "Pixels",
+        "input_bands": "Bands",
+        "input_features": "Features",
+        "wall_time": "Wall time (s)",
+        "spawn_time": "Spawn (s)",
+        "read_time": "Read (s)",
+        "compute_time": "Compute (s)",
+        "write_time": "Write (s)",
+        "peak_memory": "Peak memory (MB)",
+        "cpu_time": "CPU time (s)",
+    }
+
+    SUMMARY_HEADERS = {
+        "algorithm": "Algorithm",
+        "runs": "Runs",
+        "failed_runs": "Failed",
+        "total_time": "Total time (s)",
+        "mean_time": "Mean time (s)",
+        "max_time": "Max time (s)",
+        "mean_compute_time": "Mean compute (s)",
+        "max_peak_memory": "Max peak memory (MB)",
+        "mean_cpu_time": "Mean CPU time (s)",
+    }
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+        # DECLARE TYPES
+        self.algorithm_filter: QLineEdit
+        self.status_filter: QComboBox
+        self.runs_table: QTableWidget
+        self.summary_table: QTableWidget
+        self.button_box: QDialogButtonBox
+
+        self.clear_btn = self.button_box.addButton("Clear history", QDialogButtonBox.ActionRole)
+        self.clear_btn.setIcon(QIcon(QgsApplication.getThemeIcon("mActionDeleteSelected.svg")))
+        self.clear_btn.clicked.connect(self._on_clear_clicked)
+
+        self.algorithm_filter.textChanged.connect(self.update_tables)
+        self.status_filter.currentIndexChanged.connect(self.update_tables)
+
+        self.update_tables()
+
+
+    def update_tables(self):
+        algorithm_filter = self.algorithm_filter.text().strip()
+        status = self.status_filter.currentText() if self.status_filter.currentIndex() > 0 else None
+        self._fill_table(self.runs_table, self.RUN_HEADERS, EISRunLog.get_runs(algorithm_filter, status))
+        self._fill_table(self.summary_table, self.SUMMARY_HEADERS, EISRunLog.get_summary(algorithm_filter, status))
+
+
+    @staticmethod
+    def _format_value(column: str, value):
+        """Returns the value to display. Numbers are kept numeric so that the columns sort correctly."""
+        if value is None:
+            return ""
+        if column == "started_at":
+            return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+        if column.endswith("memory"):
+            return round(value / (1024 * 1024), 1)
+        if isinstance(value, float):
+            return round(value, 2)
+        return value
+
+
+    def _fill_table(self, table: QTableWidget, headers: Dict[str, str], rows: List[Dict]):
+        table.setSortingEnabled(False)
+        table.clear()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(list(headers.values()))
+        table.setRowCount(len(rows))
+        for i, row in enumerate(rows):
+            for j, column in enumerate(headers.keys()):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, self._format_value(column, row.get(column)))
+                table.setItem(i, j, item)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        table.setSortingEnabled(True)
+
+
+    def _on_clear_clicked(self):
+        reply = QMessageBox.question(
+            self,
+            "Confirm deletion",
+            "Are you sure you want to delete the whole algorithm run history?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            EISRunLog.clear()
+            self.update_tables()
+            EISMessageManager().show_message("Algorithm run history cleared.", "success")
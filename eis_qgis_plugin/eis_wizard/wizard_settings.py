@@ -1,12 +1,31 @@
 from qgis.core import QgsMapLayerProxyModel
 from qgis.gui import QgsColorButton, QgsColorRampButton, QgsMapLayerComboBox
 from qgis.PyQt.QtCore import pyqtSignal
-from qgis.PyQt.QtWidgets import QCheckBox, QComboBox, QDialog, QDialogButtonBox, QTabWidget, QVBoxLayout, QWidget
+from qgis.PyQt.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QLabel,
+    QPushButton,
+    QSpinBox,
+    QTabWidget,
+    QVBoxLayout,
+    QWidget,
+)
 
 from eis_qgis_plugin.eis_wizard.wizard_eis_toolkit_conf import EISWizardToolkitConfiguration
+from eis_qgis_plugin.eis_wizard.wizard_run_history import EISWizardRunHistory
+from eis_qgis_plugin.environment.eis_docker_session import shutdown_docker_sessions
+from eis_qgis_plugin.environment.eis_toolkit_invoker import EISToolkitInvoker
+from eis_qgis_plugin.environment.eis_toolkit_worker import shutdown_toolkit_workers
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import load_ui
+from eis_qgis_plugin.utils.algorithm_execution import AlgorithmScheduler
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
+from eis_qgis_plugin.utils.raster_output_profile import EISRasterOutputProfile
+from eis_qgis_plugin.utils.result_cache import EISResultCache
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+from eis_qgis_plugin.utils.temp_output_store import EISTempOutputStore
 
 FORM_CLASS: QDialog = load_ui("wizard_settings.ui")
 
@@ -26,6 +45,28 @@ class EISWizardSettings(QWidget, FORM_CLASS):
         self.dock_wizard_selection: QCheckBox
         self.minimal_menu_selection: QCheckBox
         self.layer_group_selection: QCheckBox
+        self.persistent_worker_selection: QCheckBox
+        self.docker_session_selection: QCheckBox
+        self.max_concurrent_jobs: QSpinBox
+        self.result_cache_selection: QCheckBox
+        self.result_cache_hash_selection: QCheckBox
+        self.result_cache_quota: QSpinBox
+        self.result_cache_usage_label: QLabel
+        self.clear_result_cache_btn: QPushButton
+        self.run_log_selection: QCheckBox
+        self.show_run_history_btn: QPushButton
+        self.memory_limit: QSpinBox
+        self.thread_budget: QSpinBox
+        self.prewarm_selection: QCheckBox
+        self.temp_output_eviction_selection: QCheckBox
+        self.temp_output_quota: QSpinBox
+        self.temp_output_usage_label: QLabel
+        self.remove_unused_temp_outputs_btn: QPushButton
+        self.raster_output_profile: QComboBox
+        self.overview_selection: QCheckBox
+        self.overview_threshold: QSpinBox
+        self.exact_statistics_selection: QCheckBox
+        self.raster_read_memory: QSpinBox
 
         self.color_ramp_layout: QVBoxLayout
         self.categorical_palette_selection: QComboBox
@@ -40,12 +81,17 @@ class EISWizardSettings(QWidget, FORM_CLASS):
             QDialogButtonBox.RestoreDefaults
         ).clicked.connect(self.reset_settings_to_default)
         self.settings_button_box.button(QDialogButtonBox.RestoreDefaults).setAutoDefault(False)
+        self.clear_result_cache_btn.clicked.connect(self.clear_result_cache)
+        self.show_run_history_btn.clicked.connect(self.show_run_history)
+        self.remove_unused_temp_outputs_btn.clicked.connect(self.remove_unused_temp_outputs)
 
         # Initialize
         self.configuration_page = EISWizardToolkitConfiguration()
         self.settings_tabs.addTab(self.configuration_page, "EIS Toolkit configuration")
 
         self.default_base_raster.setFilters(QgsMapLayerProxyModel.RasterLayer)
+        for profile, label in EISRasterOutputProfile.PROFILES.items():
+            self.raster_output_profile.addItem(label, profile)
         self.raster_color_ramp_selection = QgsColorRampButton()
         self.raster_color_ramp_selection.setEnabled(False)
         self.raster_color_ramp_selection.setToolTip("Setting disabled")
@@ -63,10 +109,32 @@ class EISWizardSettings(QWidget, FORM_CLASS):
         self.continuous_palette_selection.setCurrentText(EISSettingsManager.get_default_continuous_palette())
         self.layer_group_selection.setChecked(EISSettingsManager.get_layer_group_selection())
         self.default_base_raster.setLayer(EISSettingsManager.get_default_base_raster())
+        self.persistent_worker_selection.setChecked(EISSettingsManager.get_persistent_worker_selection())
+        self.docker_session_selection.setChecked(EISSettingsManager.get_docker_session_selection())
+        self.max_concurrent_jobs.setValue(EISSettingsManager.get_max_concurrent_jobs())
+        self.result_cache_selection.setChecked(EISSettingsManager.get_result_cache_selection())
+        self.result_cache_hash_selection.setChecked(EISSettingsManager.get_result_cache_hash_selection())
+        self.result_cache_quota.setValue(EISSettingsManager.get_result_cache_quota())
+        self.update_result_cache_usage()
+        self.run_log_selection.setChecked(EISSettingsManager.get_run_log_selection())
+        self.memory_limit.setValue(EISSettingsManager.get_memory_limit())
+        self.thread_budget.setValue(EISSettingsManager.get_thread_budget())
+        self.prewarm_selection.setChecked(EISSettingsManager.get_prewarm_selection())
+        self.temp_output_eviction_selection.setChecked(EISSettingsManager.get_temp_output_eviction_selection())
+        self.temp_output_quota.setValue(EISSettingsManager.get_temp_output_quota())
+        self.update_temp_output_usage()
+        self.raster_output_profile.setCurrentIndex(
+            self.raster_output_profile.findData(EISRasterOutputProfile.get_profile())
+        )
+        self.overview_selection.setChecked(EISSettingsManager.get_overview_selection())
+        self.overview_threshold.setValue(EISSettingsManager.get_overview_threshold())
+        self.exact_statistics_selection.setChecked(EISSettingsManager.get_exact_statistics_selection())
+        self.raster_read_memory.setValue(EISSettingsManager.get_raster_read_memory())
 
 
     def save_settings(self):
         """Save current selections."""
+        previous_thread_budget = EISToolkitInvoker.get_thread_budget()
         EISSettingsManager.set_dock_wizard_selection(self.dock_wizard_selection.isChecked())
         EISSettingsManager.set_minimal_menu_selection(self.minimal_menu_selection.isChecked())
         EISSettingsManager.set_raster_color_ramp(self.raster_color_ramp_selection.colorRamp())
@@ -75,6 +143,32 @@ class EISWizardSettings(QWidget, FORM_CLASS):
         EISSettingsManager.set_continuous_palette_selection(self.continuous_palette_selection.currentText())
         EISSettingsManager.set_layer_group_selection(self.layer_group_selection.isChecked())
         EISSettingsManager.set_default_base_raster(self.default_base_raster.currentLayer())
+        EISSettingsManager.set_persistent_worker_selection(self.persistent_worker_selection.isChecked())
+        if not self.persistent_worker_selection.isChecked():
+            shutdown_toolkit_workers()
+        EISSettingsManager.set_docker_session_selection(self.docker_session_selection.isChecked())
+        if not self.docker_session_selection.isChecked():
+            shutdown_docker_sessions()
+        EISSettingsManager.set_max_concurrent_jobs(self.max_concurrent_jobs.value())
+        AlgorithmScheduler.instance().start_queued_jobs()
+        EISSettingsManager.set_result_cache_selection(self.result_cache_selection.isChecked())
+        EISSettingsManager.set_result_cache_hash_selection(self.result_cache_hash_selection.isChecked())
+        EISSettingsManager.set_result_cache_quota(self.result_cache_quota.value())
+        EISSettingsManager.set_run_log_selection(self.run_log_selection.isChecked())
+        EISSettingsManager.set_memory_limit(self.memory_limit.value())
+        EISSettingsManager.set_thread_budget(self.thread_budget.value())
+        if EISToolkitInvoker.get_thread_budget() != previous_thread_budget:
+            shutdown_toolkit_workers()  # Thread pools are sized when EIS Toolkit is imported
+        EISSettingsManager.set_prewarm_selection(self.prewarm_selection.isChecked())
+        EISSettingsManager.set_temp_output_eviction_selection(self.temp_output_eviction_selection.isChecked())
+        EISSettingsManager.set_temp_output_quota(self.temp_output_quota.value())
+        EISSettingsManager.set_raster_output_profile(self.raster_output_profile.currentData())
+        EISSettingsManager.set_overview_selection(self.overview_selection.isChecked())
+        EISSettingsManager.set_overview_threshold(self.overview_threshold.value())
+        EISSettingsManager.set_exact_statistics_selection(self.exact_statistics_selection.isChecked())
+        EISSettingsManager.set_raster_read_memory(self.raster_read_memory.value())
+        AlgorithmScheduler.instance().enforce_temp_output_quota()
+        self.update_temp_output_usage()
         
         self.minimal_menu_setting_changed.emit(self.minimal_menu_selection.isChecked())
         EISMessageManager().show_message("EIS QGIS Plugin settings saved.", "success")
@@ -92,5 +186,58 @@ class EISWizardSettings(QWidget, FORM_CLASS):
         self.continuous_palette_selection.setCurrentText(defaults[EISSettingsManager.CONTINUOUS_PALETTE_SETTING])
         self.layer_group_selection.setChecked(defaults[EISSettingsManager.LAYER_GROUP_SETTING] == "true")
         self.default_base_raster.setLayer(defaults[EISSettingsManager.DEFAULT_BASE_RASTER])
+        self.persistent_worker_selection.setChecked(defaults[EISSettingsManager.PERSISTENT_WORKER_SETTING] == "true")
+        self.docker_session_selection.setChecked(defaults[EISSettingsManager.DOCKER_SESSION_SETTING] == "true")
+        self.max_concurrent_jobs.setValue(int(defaults[EISSettingsManager.MAX_CONCURRENT_JOBS_SETTING]))
+        self.result_cache_selection.setChecked(defaults[EISSettingsManager.RESULT_CACHE_SETTING] == "true")
+        self.result_cache_hash_selection.setChecked(defaults[EISSettingsManager.RESULT_CACHE_HASH_SETTING] == "true")
+        self.result_cache_quota.setValue(int(defaults[EISSettingsManager.RESULT_CACHE_QUOTA_SETTING]))
+        self.run_log_selection.setChecked(defaults[EISSettingsManager.RUN_LOG_SETTING] == "true")
+        self.memory_limit.setValue(int(defaults[EISSettingsManager.MEMORY_LIMIT_SETTING]))
+        self.thread_budget.setValue(int(defaults[EISSettingsManager.THREAD_BUDGET_SETTING]))
+        self.prewarm_selection.setChecked(defaults[EISSettingsManager.PREWARM_SETTING] == "true")
+        self.temp_output_eviction_selection.setChecked(
+            defaults[EISSettingsManager.TEMP_OUTPUT_EVICTION_SETTING] == "true"
+        )
+        self.temp_output_quota.setValue(int(defaults[EISSettingsManager.TEMP_OUTPUT_QUOTA_SETTING]))
+        self.raster_output_profile.setCurrentIndex(
+            self.raster_output_profile.findData(defaults[EISSettingsManager.RASTER_OUTPUT_PROFILE_SETTING])
+        )
+        self.overview_selection.setChecked(defaults[EISSettingsManager.OVERVIEW_SETTING] == "true")
+        self.overview_threshold.setValue(int(defaults[EISSettingsManager.OVERVIEW_THRESHOLD_SETTING]))
+        self.exact_statistics_selection.setChecked(defaults[EISSettingsManager.EXACT_STATISTICS_SETTING] == "true")
+        self.raster_read_memory.setValue(int(defaults[EISSettingsManager.RASTER_READ_MEMORY_SETTING]))
 
         EISMessageManager().show_message("EIS QGIS Plugin settings reset.", "info")
+
+
+    def update_result_cache_usage(self):
+        size_mb = EISResultCache.get_size() / (1024 * 1024)
+        self.result_cache_usage_label.setText(f"Result cache usage: {size_mb:.1f} MB")
+
+
+    def clear_result_cache(self):
+        EISResultCache.clear()
+        self.update_result_cache_usage()
+        EISMessageManager().show_message("Result cache cleared.", "success")
+
+
+    def update_temp_output_usage(self):
+        total_size, referenced_size = EISTempOutputStore.get_usage()
+        self.temp_output_usage_label.setText(
+            f"Temporary outputs usage: {total_size / (1024 * 1024):.1f} MB "
+            f"({referenced_size / (1024 * 1024):.1f} MB loaded as layers)"
+        )
+
+
+    def remove_unused_temp_outputs(self):
+        freed = AlgorithmScheduler.instance().enforce_temp_output_quota(quota_bytes=0)
+        self.update_temp_output_usage()
+        EISMessageManager().show_message(
+            f"Removed {freed / (1024 * 1024):.1f} MB of unused temporary outputs.", "success"
+        )
+
+
+    def show_run_history(self):
+        dialog = EISWizardRunHistory(self)
+        dialog.exec()
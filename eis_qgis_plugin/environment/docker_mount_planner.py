@@ -0,0 +1,118 @@
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Host path, container path and whether the mount is read-only
+DockerMount = Tuple[str, str, bool]
+
+WINDOWS_DRIVE_PATTERN = re.compile(r"^[A-Za-z]:[\\/]")
+
+
+class DockerMountPlan:
+    """
+    Bind mounts that give an EIS Toolkit container access to the files of one command.
+
+    Every host directory is mounted at a fixed location under CONTAINER_ROOT derived from its host path
+    (e.g. `/home/user/data` at `/host/home/user/data`, `C:\\data` at `/host/c/data`), so a path is
+    rewritten the same way in every command and no data needs to be copied to a dedicated folder.
+
+    The plan mounts the minimal set of directories that contain all the paths of the command: for files
+    their parent directories, for directories the directories themselves. Directories inside another
+    planned directory are covered by it. Directories of inputs are mounted read-only and directories of
+    outputs read-write, a directory containing both is mounted read-write.
+    """
+
+    CONTAINER_ROOT = "/host"
+
+    def __init__(self, arguments: Iterable[str], output_paths: Optional[Iterable[str]] = None) -> None:
+        """
+        Args:
+            arguments: Arguments of the command. Absolute paths among them are mounted.
+            output_paths: Paths the command writes. Paths that do not exist yet and directories are
+                treated as outputs too, so that for example folder destinations are writable.
+        """
+        output_paths = {os.path.normpath(path) for path in output_paths or []}
+        directories: Dict[str, bool] = {}  # Directory -> read-only
+        for argument in arguments:
+            if not self.is_host_path(argument):
+                continue
+            path = os.path.normpath(argument)
+            if os.path.isdir(path):
+                directory, read_only = path, False
+            else:
+                directory = os.path.dirname(path)
+                read_only = path not in output_paths and os.path.exists(path)
+            directories[directory] = directories.get(directory, True) and read_only
+
+        self.mounts: List[DockerMount] = []
+        for directory in sorted(directories, key=len):
+            parent = self._find_mount(directory)
+            if parent is None:
+                self.mounts.append((directory, self.to_container_path(directory), directories[directory]))
+            elif parent[2] and not directories[directory]:
+                index = self.mounts.index(parent)
+                self.mounts[index] = (parent[0], parent[1], False)
+
+
+    @staticmethod
+    def is_host_path(argument: str) -> bool:
+        """Whether the argument is an absolute path of the host (POSIX, Windows drive or UNC path)."""
+        return argument.startswith(("/", "\\\\")) or WINDOWS_DRIVE_PATTERN.match(argument) is not None
+
+
+    @classmethod
+    def to_container_path(cls, host_path: str) -> str:
+        """Returns the location of a host path in the container."""
+        path = host_path.replace("\\", "/")
+        if WINDOWS_DRIVE_PATTERN.match(path):
+            path = f"/{path[0].lower()}{path[2:]}"
+        elif path.startswith("//"):
+            path = f"/unc{path[1:]}"
+        return cls.CONTAINER_ROOT + path.rstrip("/")
+
+
+    def _find_mount(self, host_path: str) -> Optional[DockerMount]:
+        """Returns the planned mount that contains the host path, if any."""
+        for mount in self.mounts:
+            if self._is_within(host_path, mount[0]):
+                return mount
+        return None
+
+
+    @staticmethod
+    def _is_within(path: str, directory: str) -> bool:
+        path, directory = os.path.normcase(path), os.path.normcase(directory)
+        return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+    def is_covered_by(self, mounts: Iterable[DockerMount]) -> bool:
+        """Whether the given (pre-existing) mounts give access to everything in this plan."""
+        mounts = list(mounts)
+        for host_path, _, read_only in self.mounts:
+            if not any(self._is_within(host_path, mount[0]) and (read_only or not mount[2]) for mount in mounts):
+                return False
+        return True
+
+
+    def rewrite(self, arguments: List[str]) -> List[str]:
+        """Returns a copy of the arguments with host paths replaced by their container paths."""
+        return [
+            self.to_container_path(os.path.normpath(argument)) if self.is_host_path(argument) else argument
+            for argument in arguments
+        ]
+
+
+    def to_host_path(self, container_path: str) -> str:
+        """Returns the host path of a container path reported by EIS Toolkit, or the path itself if not mounted."""
+        for host_path, mount_path, _ in self.mounts:
+            if container_path == mount_path or container_path.startswith(mount_path + "/"):
+                return os.path.normpath(os.path.join(host_path, container_path[len(mount_path):].lstrip("/")))
+        return container_path
+
+
+    def get_mount_args(self) -> List[str]:
+        """Returns the `-v` options of `docker run` for the planned mounts."""
+        mount_args = []
+        for host_path, container_path, read_only in self.mounts:
+            mount_args += ["-v", f"{host_path}:{container_path}" + (":ro" if read_only else "")]
+        return mount_args
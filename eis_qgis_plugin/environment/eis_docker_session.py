@@ -0,0 +1,186 @@
+import logging
+import os
+import subprocess
+import threading
+import uuid
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DockerSessionException(Exception):
+    """Exception error class raised if the Docker session container cannot be started."""
+
+
+class EISDockerSession:
+    """
+    One long-running EIS Toolkit container that is reused for all algorithm runs of a QGIS session.
+
+    The container is started once with the host and temp folders mounted and kept alive with a no-op
+    process. Algorithms are then run with `docker exec`, which avoids creating a container and resolving
+    the Poetry environment for every run. The container is checked before each run and started again
+    if it has died.
+    """
+
+    KEEP_ALIVE_CMD = ["tail", "-f", "/dev/null"]
+    PID_DIR = "/tmp"  # PID files of runs in the container, used to signal a run
+    COMMAND_TIMEOUT = 60  # Seconds for Docker management commands (run, inspect, rm)
+
+    def __init__(
+        self,
+        docker_path: str,
+        image_name: str,
+        mounts: List[Tuple[str, str]],
+        env = None
+    ) -> None:
+        self.docker_path = docker_path
+        self.image_name = image_name
+        self.mounts = mounts
+        self.env = env
+
+        self.container_id: Optional[str] = None
+        self.python_cmd: List[str] = []
+        self._lock = threading.Lock()
+
+
+    def _docker(self, *args: str) -> subprocess.CompletedProcess:
+        creationflags = 0
+        if os.name == 'nt':  # If Windows, prevent process window creation
+            creationflags = subprocess.CREATE_NO_WINDOW
+        return subprocess.run(
+            [self.docker_path, *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            creationflags=creationflags,
+            env=self.env,
+            timeout=self.COMMAND_TIMEOUT
+        )
+
+
+    def is_healthy(self) -> bool:
+        """Checks that the session container exists and is running."""
+        if self.container_id is None:
+            return False
+        try:
+            result = self._docker("inspect", "-f", "{{.State.Running}}", self.container_id)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0 and result.stdout.strip() == "true"
+
+
+    def start(self) -> None:
+        """Starts the session container unless a healthy one is running already."""
+        with self._lock:
+            if self.is_healthy():
+                return
+            if self.container_id is not None:
+                logger.warning("EIS Toolkit Docker session container %s died, restarting it", self.container_id)
+                self._remove_container()
+
+            mount_args = []
+            for host_path, container_path in self.mounts:
+                mount_args += ["-v", f"{host_path}:{container_path}"]
+
+            name = f"eis-toolkit-session-{uuid.uuid4().hex[:8]}"
+            try:
+                result = self._docker(
+                    "run", "-d", "--rm", "--name", name, *mount_args, self.image_name, *self.KEEP_ALIVE_CMD
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                raise DockerSessionException(f"Could not start EIS Toolkit Docker session: {e}")
+            if result.returncode != 0:
+                raise DockerSessionException(f"Could not start EIS Toolkit Docker session: {result.stderr.strip()}")
+
+            self.container_id = result.stdout.strip().splitlines()[-1]
+            self.python_cmd = self._resolve_python_cmd()
+            logger.debug("Started EIS Toolkit Docker session %s (%s)", name, self.container_id)
+
+
+    def _resolve_python_cmd(self) -> List[str]:
+        """Resolves the Python of the Poetry environment once, so `poetry run` is not needed per command."""
+        try:
+            result = self._docker("exec", self.container_id, "poetry", "env", "info", "-p")
+            env_path = result.stdout.strip()
+            if result.returncode == 0 and env_path:
+                return [f"{env_path}/bin/python"]
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        return ["poetry", "run", "python"]
+
+
+    def get_exec_cmd(self, run_id: Optional[str] = None, exec_args: Optional[List[str]] = None) -> List[str]:
+        """
+        Returns the command prefix that runs a Python module in the session container.
+
+        Args:
+            run_id: If given, the PID of the run is stored in the container so that the run can be
+                stopped with `signal_exec`. Killing the `docker exec` client alone does not stop it.
+                The PID file is removed when the run exits.
+            exec_args: Extra options of `docker exec`, such as environment variables.
+        """
+        self.start()
+        cmd = [self.docker_path, "exec", *(exec_args or []), self.container_id]
+        if run_id is not None:
+            pid_file = f"{self.PID_DIR}/{run_id}.pid"
+            script = f'"$@" & pid=$!; echo $pid > {pid_file}; wait $pid; status=$?; rm -f {pid_file}; exit $status'
+            cmd += ["sh", "-c", script, "sh"]
+        return [*cmd, *self.python_cmd, "-W", "ignore", "-m"]
+
+
+    def signal_exec(self, run_id: str, force: bool = False) -> None:
+        """Sends SIGTERM (or SIGKILL if force is True) to a run started with `get_exec_cmd(run_id)`."""
+        if self.container_id is None:
+            return
+        pid_file = f"{self.PID_DIR}/{run_id}.pid"
+        kill_cmd = f"[ -f {pid_file} ] && kill -{'KILL' if force else 'TERM'} $(cat {pid_file})"
+        try:
+            self._docker("exec", self.container_id, "sh", "-c", kill_cmd)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error("Failed to signal EIS Toolkit run %s in Docker session: %s", run_id, e)
+
+
+    def stop(self) -> None:
+        """Removes the session container."""
+        with self._lock:
+            self._remove_container()
+
+
+    def _remove_container(self) -> None:
+        if self.container_id is None:
+            return
+        try:
+            self._docker("rm", "-f", self.container_id)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error("Failed to remove EIS Toolkit Docker session container %s: %s", self.container_id, e)
+        self.container_id = None
+        self.python_cmd = []
+
+
+_session: Optional[EISDockerSession] = None
+_session_lock = threading.Lock()
+
+
+def get_docker_session(
+    docker_path: str, image_name: str, mounts: List[Tuple[str, str]], env = None
+) -> EISDockerSession:
+    """Returns the shared Docker session. A session with a different configuration is replaced."""
+    global _session
+    with _session_lock:
+        if _session is not None and (
+            _session.docker_path != docker_path or _session.image_name != image_name or _session.mounts != mounts
+        ):
+            _session.stop()
+            _session = None
+        if _session is None:
+            _session = EISDockerSession(docker_path, image_name, mounts, env)
+        return _session
+
+
+def shutdown_docker_sessions() -> None:
+    """Removes the session container. Called when the plugin is unloaded."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.stop()
+            _session = None
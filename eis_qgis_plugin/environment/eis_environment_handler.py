@@ -1,6 +1,19 @@
+import glob
+import logging
 import os
 import subprocess
-from typing import List, Tuple
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from eis_qgis_plugin.environment.docker_mount_planner import DockerMount, DockerMountPlan
+from eis_qgis_plugin.environment.eis_docker_session import DockerSessionException, get_docker_session
+from eis_qgis_plugin.environment.eis_toolkit_worker import (
+    EISToolkitWorker,
+    get_toolkit_worker,
+    shutdown_toolkit_workers,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class EnvironmentHandler:
@@ -8,6 +21,8 @@ class EnvironmentHandler:
 
     EIS_CLI_MODULE = "eis_toolkit.cli"
 
+    run_name: Optional[str] = None  # Identifies the latest assembled run for `signal_run`
+
     def assemble_cli_cmd() -> List[str]:
         raise NotImplementedError
     
@@ -23,50 +38,102 @@ class EnvironmentHandler:
     def upgrade_toolkit(self, env) -> Tuple[bool, str]:
         raise NotImplementedError
 
+    def get_worker(self, env: Dict[str, str]) -> Optional[EISToolkitWorker]:
+        """
+        Returns the worker to run commands in, or None if commands should run in new processes.
+
+        Args:
+            env: Environment variables of the worker process.
+        """
+        return None
+
+    def get_verification_key(self) -> Optional[str]:
+        """Returns a key that changes when the environment changes, or None if it cannot be determined."""
+        return None
+
+    def signal_run(self, force: bool = False) -> None:
+        """
+        Stops processes of the run named `run_name` that are not children of the plugin.
+
+        Local runs are stopped through their process group, so there is nothing to do by default.
+        """
+        return
+
+    def to_host_path(self, path: str) -> str:
+        """Returns the host path of a path reported by EIS Toolkit. Paths are the same by default."""
+        return path
+
 
 class DockerEnvironmentHandler(EnvironmentHandler):
     """Environment handler for Docker.
     
-    Makes some assumptions, for example that the image includes Poetry env with EIS Toolkit in it."""
-
-    DOCKER_DATA_FOLDER = "/data_folder"
-    DOCKER_TEMP_FOLDER = "/temp"
-
-    def __init__(self, docker_path: str, image_name: str, host_folder: str, temp_folder: str) -> None:
+    Makes some assumptions, for example that the image includes Poetry env with EIS Toolkit in it.
+
+    The directories of the input and output paths of each command are bind-mounted to the container
+    (see DockerMountPlan), so data can be used where it is. The configured host and temp folders are
+    mounted to the Docker session container, runs with paths elsewhere use a new container instead."""
+
+    def __init__(
+        self,
+        docker_path: str,
+        image_name: str,
+        host_folder: str,
+        temp_folder: str,
+        use_session: bool = False,
+        container_env: Optional[Dict[str, str]] = None
+    ) -> None:
         self.docker_path = docker_path
         self.image_name = image_name
         self.host_folder = host_folder
         self.temp_folder = temp_folder
+        self.use_session = use_session
+        self.container_env = container_env or {}  # Environment variables of the runs in the container
 
-        self.mount_host = False
-        self.mount_temp = False
+        self.mount_plan: Optional[DockerMountPlan] = None  # Mounts of the latest assembled run
+        self.session = None
 
 
-    def assemble_cli_cmd(self, alg_name: str, typer_args: List[str], typer_options: List[str]):
-        typer_args = self.modify_paths(typer_args)
-        typer_options = self.modify_paths(typer_options)
+    def assemble_cli_cmd(
+        self,
+        alg_name: str,
+        typer_args: List[str],
+        typer_options: List[str],
+        output_paths: Optional[List[str]] = None
+    ):
+        mount_plan = DockerMountPlan([*typer_args, *typer_options], output_paths)
 
         return [
-            *self.get_invocation_cmd(),
+            *self.get_invocation_cmd(mount_plan),
             self.EIS_CLI_MODULE,
             alg_name,
-            *typer_args,
-            *typer_options
+            *mount_plan.rewrite(typer_args),
+            *mount_plan.rewrite(typer_options)
         ]
 
 
-    def get_invocation_cmd(self) -> List[str]:
-        mount_host_cmd = ["-v", f"{self.host_folder}:{self.DOCKER_DATA_FOLDER}"] if self.mount_host else []
-        mount_temp_cmd = ["-v", f"{self.temp_folder}:{self.DOCKER_TEMP_FOLDER}"] if self.mount_temp else []
-        # if DEBUG:
-        #     print("Mounted host folder") if mount_host_cmd is not [] else print("Did not mount host folder")
-        #     print("Mounted temp folder") if mount_temp_cmd is not [] else print("Did not mount temp folder")
+    def get_invocation_cmd(self, mount_plan: Optional[DockerMountPlan] = None) -> List[str]:
+        # Containers and session runs are named, so that they can be stopped when the run is cancelled
+        self.run_name = f"eis-toolkit-run-{uuid.uuid4().hex[:12]}"
+        self.mount_plan = mount_plan if mount_plan is not None else DockerMountPlan([])
+        self.session = None
+        if self.use_session:
+            session_mounts = self.get_session_mounts()
+            if not self.mount_plan.is_covered_by(session_mounts):
+                logger.info("Paths of the run are outside the folders of the Docker session, using a new container.")
+            else:
+                try:
+                    return self.get_session_invocation_cmd(session_mounts)
+                except DockerSessionException as e:
+                    logger.warning("%s Falling back to a new container per algorithm run.", e)
+
         cmd = [
             self.docker_path,
             "run",
             "--rm",
-            *mount_host_cmd,
-            *mount_temp_cmd,
+            "--name",
+            self.run_name,
+            *self.get_container_env_args(),
+            *self.mount_plan.get_mount_args(),
             self.image_name,
             "poetry",
             "run",
@@ -78,24 +145,56 @@ class DockerEnvironmentHandler(EnvironmentHandler):
         return cmd
 
 
-    def modify_paths(self, arguments: List[str]) -> List[str]:
-        """Modify path arguments to match container directory and convert path Windows -> Unix."""
-        for i, argument in enumerate(arguments):
-            if "/" in argument or "\\" in argument:
-                if self.host_folder in argument:
-                    modified_path_argument = argument.replace(self.host_folder, self.DOCKER_DATA_FOLDER)
-                    self.mount_host = True
-                elif self.temp_folder in argument:
-                    modified_path_argument = argument.replace(self.temp_folder, self.DOCKER_TEMP_FOLDER)
-                    self.mount_temp = True
-                else:
-                    raise ValueError(f"Parameter path points to a folder not specified for Docker: {argument}")
-                modified_path_argument = modified_path_argument.replace("\\", "/")
-                arguments[i] = modified_path_argument
-                # if DEBUG:
-                #     print(f"Path: {argument} replaced with {modified_path_argument} for Docker call")
+    def get_container_env_args(self) -> List[str]:
+        env_args = []
+        for variable, value in self.container_env.items():
+            env_args += ["-e", f"{variable}={value}"]
+        return env_args
+
+
+    def get_session_mounts(self) -> List[DockerMount]:
+        """Returns the read-write mounts of the configured host and temp folders for the session container."""
+        folders = [os.path.normpath(folder) for folder in (self.host_folder, self.temp_folder) if folder]
+        return [(folder, DockerMountPlan.to_container_path(folder), False) for folder in folders]
+
+
+    def get_session_invocation_cmd(self, session_mounts: List[DockerMount]) -> List[str]:
+        """Returns a `docker exec` command into the session container, starting the container if needed."""
+        mounts = [(host_path, container_path) for host_path, container_path, _ in session_mounts]
+        session = get_docker_session(self.docker_path, self.image_name, mounts)
+        cmd = session.get_exec_cmd(self.run_name, self.get_container_env_args())
+        self.session = session
+        return cmd
+
+
+    def signal_run(self, force: bool = False) -> None:
+        """Stops the container of the run, or the run in the session container, with SIGTERM or SIGKILL."""
+        if self.run_name is None:
+            return
+        if self.session is not None:
+            self.session.signal_exec(self.run_name, force)
+            return
+
+        creationflags = 0
+        if os.name == 'nt':  # If Windows, prevent process window creation
+            creationflags = subprocess.CREATE_NO_WINDOW
+        try:
+            subprocess.run(
+                [self.docker_path, "kill", "--signal", "KILL" if force else "TERM", self.run_name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                creationflags=creationflags,
+                timeout=30
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error("Failed to stop EIS Toolkit container %s: %s", self.run_name, e)
+
 
-        return arguments
+    def to_host_path(self, path: str) -> str:
+        """Returns the host path of a container path of the latest assembled run."""
+        if self.mount_plan is None:
+            return path
+        return self.mount_plan.to_host_path(path)
 
 
     def verify_environment(self) -> Tuple[bool, str]:
@@ -130,6 +229,27 @@ class DockerEnvironmentHandler(EnvironmentHandler):
             return False, f"Docker image '{self.image_name}' not found."
 
 
+    def get_verification_key(self) -> Optional[str]:
+        """Returns the ID of the Docker image, which changes whenever the image is rebuilt or pulled."""
+        creationflags = 0
+        if os.name == 'nt':  # If Windows, prevent process window creation
+            creationflags = subprocess.CREATE_NO_WINDOW
+        try:
+            result = subprocess.run(
+                [self.docker_path, "image", "inspect", "-f", "{{.Id}}", self.image_name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                creationflags=creationflags,
+                timeout=30
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        return f"docker:{result.stdout.strip()}"
+
+
     def verify_toolkit(self, required_version: str, env) -> Tuple[bool, str]:
         """
         Verifies if EIS Toolkit is installed and checks if the installed version matches the required version.
@@ -218,12 +338,28 @@ class VenvEnvironmentHandler(EnvironmentHandler):
     
     Should work with venv and conda environments."""
 
-    def __init__(self, venv_directory: os.PathLike) -> None:
+    def __init__(
+        self, venv_directory: os.PathLike, use_persistent_worker: bool = False, max_workers: int = 1
+    ) -> None:
+        """
+        Args:
+            venv_directory: Directory of the environment.
+            use_persistent_worker: Whether commands run in persistent worker processes.
+            max_workers: Number of worker processes that can run commands concurrently.
+        """
         self.venv_directory = venv_directory
         self.python_path = self.get_python_path(venv_directory)
+        self.use_persistent_worker = use_persistent_worker
+        self.max_workers = max_workers
 
 
-    def assemble_cli_cmd(self, alg_name: str, typer_args: List[str], typer_options: List[str]):
+    def assemble_cli_cmd(
+        self,
+        alg_name: str,
+        typer_args: List[str],
+        typer_options: List[str],
+        output_paths: Optional[List[str]] = None
+    ):
         return [
             *self.get_invocation_cmd(),
             self.EIS_CLI_MODULE,
@@ -250,6 +386,27 @@ class VenvEnvironmentHandler(EnvironmentHandler):
         return [self.python_path, "-W", "ignore", "-m"]
 
 
+    def get_worker(self, env: Dict[str, str]) -> Optional[EISToolkitWorker]:
+        if self.use_persistent_worker:
+            return get_toolkit_worker(self.python_path, env, self.max_workers)
+        return None
+
+
+    def get_verification_key(self) -> Optional[str]:
+        """
+        Returns a key made of the Python executable path and the modification times of the executable
+        and the site-packages directories, which change when packages are installed or upgraded.
+        """
+        try:
+            mtimes = [os.path.getmtime(self.python_path)]
+            site_packages = glob.glob(os.path.join(self.venv_directory, "lib", "python*", "site-packages"))
+            site_packages += glob.glob(os.path.join(self.venv_directory, "Lib", "site-packages"))
+            mtimes += [os.path.getmtime(path) for path in sorted(set(site_packages))]
+        except OSError:
+            return None
+        return f"venv:{self.python_path}:" + ":".join(str(mtime) for mtime in mtimes)
+
+
     def verify_environment(self) -> Tuple[bool, str]:
         if self.venv_directory == "":
             return False, "Venv directory not specified."
@@ -335,6 +492,8 @@ class VenvEnvironmentHandler(EnvironmentHandler):
             )
 
             if result.returncode == 0:
+                # Workers still have the old version imported
+                shutdown_toolkit_workers()
                 return True, "EIS Toolkit was successfully upgraded."
             else:
                 return False, f"Failed to upgrade EIS Toolkit: {result.stderr}"
@@ -2,14 +2,24 @@ import json
 import logging
 import os
 import queue
+import signal
 import subprocess
 import threading
 import time
-from typing import List, TextIO, Tuple
+from typing import Dict, List, Optional, TextIO, Tuple
 
 from qgis.core import QgsProcessingFeedback
 
 from eis_qgis_plugin.environment.eis_environment_handler import DockerEnvironmentHandler, VenvEnvironmentHandler
+from eis_qgis_plugin.environment.eis_toolkit_prewarm import is_prewarming, wait_for_prewarm
+from eis_qgis_plugin.environment.eis_toolkit_worker import EISToolkitWorker, WorkerException
+from eis_qgis_plugin.environment.process_control import (
+    TERMINATE_TIMEOUT,
+    get_popen_kwargs,
+    signal_process_group,
+    terminate_process_tree,
+)
+from eis_qgis_plugin.environment.process_monitor import ProcessMonitor
 from eis_qgis_plugin.utils.model_feedback import EISProcessingFeedback
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
@@ -28,12 +38,44 @@ class EnvironmentException(Exception):
 
 
 class EISToolkitInvoker:
-    """Class that handles communication between EIS QGIS plugin and EIS Toolkit."""
+    """
+    Class that handles communication between EIS QGIS plugin and EIS Toolkit.
+
+    EIS Toolkit reports progress and results either as free text lines (legacy protocol) or as
+    newline-delimited JSON events. Event protocol is advertised to the toolkit with the
+    EIS_TOOLKIT_EVENT_PROTOCOL environment variable. Each event is a JSON object on its own line
+    with the protocol version and the event type, for example:
+
+    {"eis_event": 1, "type": "progress", "value": 42.5, "message": "Fold 2/5 done"}
+    {"eis_event": 1, "type": "log", "level": "warning", "message": "Nodata value not set"}
+    {"eis_event": 1, "type": "result", "values": {"accuracy": 0.93}}
+    {"eis_event": 1, "type": "output_raster", "name": "W+", "path": "/tmp/w_plus.tif"}
+    {"eis_event": 1, "type": "metric", "name": "loss", "value": 0.123, "step": 4}
+
+    Output raster events can also carry the value range of the raster as "min" and "max", which is then
+    used for styling the output instead of computing statistics.
+
+    Lines that are not events, or events of another protocol version, are handled with the legacy text
+    protocol.
+    """
+
+    EVENT_PROTOCOL_VERSION = 1
+    EVENT_KEY = "eis_event"
+    EVENT_HANDLERS = {
+        "progress": "_on_progress_event",
+        "log": "_on_log_event",
+        "result": "_on_result_event",
+        "output_raster": "_on_output_raster_event",
+        "metric": "_on_metric_event",
+    }
 
     PROGRESS_PREFIX = "Progress:"
     OUT_RASTERS_PREFIX = "Output rasters:"
     RESULTS_PREFIX = "Results:"
 
+    VERIFICATION_CACHE_SIZE = 10  # Verification outcomes of this many environments are remembered
+    CANCEL_CHECK_INTERVAL = 0.1  # Max seconds to wait for output before checking if execution was cancelled
+
     PREFIX_TO_PROGRESS_MAP = {
         "Input files read": 25,
         "Algorithm run succesfully": 75,
@@ -41,21 +83,39 @@ class EISToolkitInvoker:
         "Algorithm execution finished": 100
     }
 
+    # Progress messages that end the input read, compute and output write phases of a run
+    PHASE_MARKERS = {
+        "Input files read": "read",
+        "Algorithm run succesfully": "compute",
+        "Output file(s) saved": "write",
+    }
+
+    # Thread pools of numerical libraries, limited to the thread budget of a run. LOKY_MAX_CPU_COUNT caps the
+    # worker processes of joblib (scikit-learn n_jobs=-1)
+    THREAD_LIMIT_VARIABLES = [
+        "OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS", "LOKY_MAX_CPU_COUNT"
+    ]
+
     def __init__(self, env_type = None, venv_directory = None, docker_path = None, docker_image_name = None):
         """Initializes the EISToolkitInvoker."""
         env_type = EISSettingsManager.get_environment_selection() if env_type is None else env_type
+        thread_environment = self.get_thread_environment()
 
         # Environment handler is needed for environment-specific communication
         if env_type == "venv":
             self.environment_handler = VenvEnvironmentHandler(
-                EISSettingsManager.get_venv_directory() if venv_directory is None else venv_directory
+                EISSettingsManager.get_venv_directory() if venv_directory is None else venv_directory,
+                EISSettingsManager.get_persistent_worker_selection(),
+                EISSettingsManager.get_max_concurrent_jobs()
             )
         elif env_type == "docker":
             self.environment_handler = DockerEnvironmentHandler(
                 EISSettingsManager.get_docker_path() if docker_path is None else docker_path,
                 EISSettingsManager.get_docker_image_name() if docker_image_name is None else docker_image_name,
                 EISSettingsManager.get_docker_host_folder(),
-                EISSettingsManager.get_docker_temp_folder()
+                EISSettingsManager.get_docker_temp_folder(),
+                EISSettingsManager.get_docker_session_selection(),
+                thread_environment
             )
         else:
             raise ValueError(f"Unsupported environment type: {env_type}")
@@ -63,8 +123,43 @@ class EISToolkitInvoker:
         self.python_free_environment = {key: value for key, value in os.environ.items() if not key.startswith("PYTHON")}
         self.python_free_environment.pop("PROJ_LIB", None)
         self.python_free_environment.pop("GDAL_DATA", None)
+        self.python_free_environment["EIS_TOOLKIT_EVENT_PROTOCOL"] = str(self.EVENT_PROTOCOL_VERSION)
+        self.python_free_environment.update(thread_environment)
         self.cmd = []
+        self.cli_args = []
         self.process = None
+        self.feedback: Optional[QgsProcessingFeedback] = None
+        self._unsupported_event_versions = set()
+
+        self.run_stats = {}  # Timing and exit code of the latest run, see `_finish_run_stats`
+        self._run_started = None
+        self._run_marks = {}
+
+
+    @staticmethod
+    def get_thread_budget() -> int:
+        """
+        Returns the number of threads one toolkit run may use.
+
+        The budget is set in settings. If it is automatic (0), the CPU cores are divided evenly between
+        the runs that can run concurrently, so that parallel runs do not oversubscribe the cores.
+        """
+        thread_budget = EISSettingsManager.get_thread_budget()
+        if thread_budget > 0:
+            return thread_budget
+        return max(1, (os.cpu_count() or 1) // max(1, EISSettingsManager.get_max_concurrent_jobs()))
+
+
+    @classmethod
+    def get_thread_environment(cls) -> Dict[str, str]:
+        """Returns environment variables that limit the thread pools of numerical libraries to the budget."""
+        thread_budget = str(cls.get_thread_budget())
+        thread_environment = {}
+        for variable in cls.THREAD_LIMIT_VARIABLES:
+            # Limits the user has set explicitly are kept, unless a budget is configured
+            if EISSettingsManager.get_thread_budget() > 0 or variable not in os.environ:
+                thread_environment[variable] = thread_budget
+        return thread_environment
 
 
     @staticmethod
@@ -92,6 +187,86 @@ class EISToolkitInvoker:
                 feedback.setProgress(progress)
 
 
+    def _start_run_stats(self, execution_mode: str):
+        self.run_stats = {"execution_mode": execution_mode}
+        self._run_started = time.perf_counter()
+        self._run_marks = {}
+
+
+    def _mark_run_phase(self, stdout_line: str):
+        """Records the time of the first output line and of each phase message of the running command."""
+        now = time.perf_counter()
+        self._run_marks.setdefault("first_output", now)
+        for message, phase in self.PHASE_MARKERS.items():
+            if message in stdout_line:
+                self._run_marks.setdefault(phase, now)
+
+
+    def _finish_run_stats(self, exit_code: Optional[int]):
+        """
+        Completes `run_stats` of the finished (or cancelled) run.
+
+        Spawn time lasts until the first output line of the toolkit, i.e. it covers process start and
+        imports. Each phase lasts from the end of the previous seen phase until its own message. Phases
+        whose message was not seen are None.
+        """
+        if self._run_started is None:
+            return
+        self.run_stats["wall_time"] = time.perf_counter() - self._run_started
+        self.run_stats["exit_code"] = exit_code
+
+        previous = self._run_marks.get("first_output")
+        self.run_stats["spawn_time"] = previous - self._run_started if previous is not None else None
+        for phase in self.PHASE_MARKERS.values():
+            mark = self._run_marks.get(phase)
+            self.run_stats[f"{phase}_time"] = mark - previous if mark is not None and previous is not None else None
+            if mark is not None:
+                previous = mark
+
+
+    def _start_process_monitor(self, process: Optional[subprocess.Popen]) -> Optional[ProcessMonitor]:
+        """
+        Starts sampling the memory and CPU usage of a local EIS Toolkit process.
+
+        Docker runs are not sampled, since the container processes are not children of the plugin.
+        """
+        if process is None or isinstance(self.environment_handler, DockerEnvironmentHandler):
+            return None
+        memory_limit = EISSettingsManager.get_memory_limit() * 1024 * 1024
+        return ProcessMonitor(
+            process.pid, memory_limit, lambda: signal_process_group(process, force=True)
+        ).start()
+
+
+    def _report_resource_usage(
+        self,
+        monitor: Optional[ProcessMonitor],
+        process: Optional[subprocess.Popen],
+        feedback: QgsProcessingFeedback
+    ):
+        """Adds peak memory and CPU time to `run_stats` and the log, and explains memory related kills."""
+        if monitor is not None:
+            monitor.stop()
+            self.run_stats["peak_memory"] = monitor.peak_memory
+            self.run_stats["cpu_time"] = monitor.cpu_time
+            if monitor.peak_memory is not None:
+                feedback.pushInfo(
+                    f"Peak memory: {monitor.peak_memory / (1024 * 1024):.0f} MB, CPU time: {monitor.cpu_time:.1f} s"
+                )
+            if monitor.limit_exceeded:
+                feedback.reportError(
+                    "EIS Toolkit was terminated because it used more than the memory limit of "
+                    f"{EISSettingsManager.get_memory_limit()} MB. Increase the limit in Settings or use smaller inputs."
+                )
+                return
+
+        sigkill = getattr(signal, "SIGKILL", None)
+        if sigkill is not None and process is not None and process.poll() == -sigkill and not feedback.isCanceled():
+            feedback.reportError(
+                "EIS Toolkit was killed by the operating system, most likely because it ran out of memory."
+            )
+
+
     def _update_results(self, stdout: str, results: dict, feedback: QgsProcessingFeedback):
         """Prints the result information parsed from the stdout message."""
         json_str = stdout.split(self.RESULTS_PREFIX)[-1].strip()
@@ -101,6 +276,12 @@ class EISToolkitInvoker:
         json_str = json_str.replace("\'", "\"")
         output_dict = json.loads(json_str)
 
+        self._report_results(output_dict, results, feedback)
+
+
+    @staticmethod
+    def _report_results(output_dict: dict, results: dict, feedback: QgsProcessingFeedback):
+        """Prints the result information and adds it to results."""
         # feedback.pushInfo("=============== Results ==============")
         feedback.pushInfo("RESULTS")
         for key, value in output_dict.items():
@@ -125,10 +306,18 @@ class EISToolkitInvoker:
         output_dict = json.loads(json_str)
 
         # results.update(output_dict)
-        results["output_folder_rasters"] = output_dict
-
-
-    def assemble_cli_command(self, alg_name: str, typer_args: List[str], typer_options: List[str]):
+        results["output_folder_rasters"] = {
+            name: self.environment_handler.to_host_path(path) for name, path in output_dict.items()
+        }
+
+
+    def assemble_cli_command(
+        self,
+        alg_name: str,
+        typer_args: List[str],
+        typer_options: List[str],
+        output_paths: Optional[List[str]] = None
+    ):
         """
         Assembles command-line interface command for a specific algorithm of EIS toolkit.
 
@@ -136,6 +325,7 @@ class EISToolkitInvoker:
             alg_name: Name of the algorithm (in QGIS) to be invoked.
             typer_args: List of arguments for the Typer CLI.
             typer_options: List of options for the Typer CLI.
+            output_paths: Paths the algorithm writes, needed to mount them writable in Docker.
         """
         if isinstance(self.environment_handler, VenvEnvironmentHandler) and not self.environment_handler.venv_directory:
             raise EnvironmentException(
@@ -147,7 +337,10 @@ class EISToolkitInvoker:
                 "in Settings page of EIS Wizard.")
 
         formatted_alg_name = self._format_algorithm_name(alg_name)
-        self.cmd = self.environment_handler.assemble_cli_cmd(formatted_alg_name, typer_args, typer_options)
+        self.cli_args = [formatted_alg_name, *typer_args, *typer_options]
+        self.cmd = self.environment_handler.assemble_cli_cmd(
+            formatted_alg_name, typer_args, typer_options, output_paths
+        )
 
         if DEBUG:
             print(f"Assembled command: {self.cmd}")
@@ -159,9 +352,38 @@ class EISToolkitInvoker:
         return self.environment_handler.verify_environment()
 
 
-    def verify_toolkit(self) -> Tuple[bool, str]:
-        """Checks if EIS Toolkit can be found in the selected environment."""
-        return self.environment_handler.verify_toolkit(REQUIRED_EIS_TOOLKIT_VERSION, self.python_free_environment)
+    def verify_toolkit(self, use_cache: bool = True) -> Tuple[bool, str]:
+        """
+        Checks if EIS Toolkit can be found in the selected environment.
+
+        The outcome is cached by the verification key of the environment (Python executable and installed
+        packages or Docker image ID), so the check runs again only when the environment has changed.
+
+        Args:
+            use_cache: If False, the check is run even if a cached outcome exists.
+
+        Returns:
+            A tuple of a boolean indicating success and a message describing the result.
+        """
+        key = self.environment_handler.get_verification_key()
+        if key is None:
+            return self.environment_handler.verify_toolkit(REQUIRED_EIS_TOOLKIT_VERSION, self.python_free_environment)
+
+        key = f"{key}:{REQUIRED_EIS_TOOLKIT_VERSION}"
+        cache = EISSettingsManager.get_toolkit_verification_cache()
+        if use_cache and key in cache:
+            result, message = cache[key]
+            return result, message
+
+        result, message = self.environment_handler.verify_toolkit(
+            REQUIRED_EIS_TOOLKIT_VERSION, self.python_free_environment
+        )
+        cache.pop(key, None)
+        cache[key] = [result, message]
+        while len(cache) > self.VERIFICATION_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        EISSettingsManager.set_toolkit_verification_cache(cache)
+        return result, message
 
     
     def upgrade_toolkit(self) -> Tuple[bool, str]:
@@ -173,8 +395,94 @@ class EISToolkitInvoker:
         if not self.cmd:
             return
 
+        self.feedback = feedback
+        if not self._wait_for_prewarm(feedback):
+            return {}
+        worker = self.environment_handler.get_worker(self.python_free_environment)
+        if worker is not None:
+            try:
+                worker.start(feedback.isCanceled)
+                return self._run_toolkit_command_in_worker(worker, feedback)
+            except WorkerException as e:
+                if feedback.isCanceled():
+                    return {}
+                feedback.pushInfo(f"{e}\nRunning EIS Toolkit in a new process instead.\n")
+
+        return self._run_toolkit_command_in_subprocess(feedback)
+
+
+    @staticmethod
+    def _wait_for_prewarm(feedback: QgsProcessingFeedback) -> bool:
+        """Waits for a running warm-up of the environment. Returns False if the run was cancelled meanwhile."""
+        if not is_prewarming():
+            return True
+        feedback.pushInfo("Waiting for EIS Toolkit warm-up to finish...\n")
+        return wait_for_prewarm(feedback.isCanceled)
+
+
+    def cancel(self):
+        """
+        Cancels the running command. Can be called from any thread.
+
+        The command is stopped by the thread that runs it within CANCEL_CHECK_INTERVAL, escalating from
+        SIGTERM to SIGKILL of its process group (and container) after TERMINATE_TIMEOUT.
+        """
+        if self.feedback is not None:
+            self.feedback.cancel()
+
+
+    def _terminate_process(self):
+        """Terminates the toolkit process, everything it started and its Docker container if any."""
+        terminate_process_tree(self.process, signal_external=self.environment_handler.signal_run)
+
+
+    @staticmethod
+    def _report_termination(e: TerminationException, feedback: QgsProcessingFeedback):
+        if type(feedback) == EISProcessingFeedback:
+            feedback.report_terminated_execution(e)
+        else:
+            feedback.reportError(str(e))
+
+
+    def _run_toolkit_command_in_worker(self, worker: EISToolkitWorker, feedback: QgsProcessingFeedback) -> dict:
+        """Runs the toolkit command in the persistent worker and captures the output."""
+        results = {}
+        returncode = None
+        self._start_run_stats("worker")
+        process = worker.process
+        monitor = self._start_process_monitor(process)
+        feedback.pushInfo("[OPENING EIS TOOLKIT]\n")
+        try:
+            returncode = worker.run(
+                self.cli_args,
+                lambda line: self._process_command_output(line.strip(), feedback, results),
+                feedback.isCanceled
+            )
+            if returncode is None:
+                raise TerminationException("\n❌ Execution cancelled\n")
+
+            # Inform user whether execution was successful or not
+            if returncode != 0:
+                feedback.reportError("EIS Toolkit algorithm execution failed.")
+
+        except TerminationException as e:
+            self._report_termination(e, feedback)
+            return {}
+
+        finally:
+            self._report_resource_usage(monitor, process, feedback)
+            self._finish_run_stats(returncode)
+            feedback.pushInfo("[CLOSING EIS TOOLKIT]\n")
+
+        return results
+
+
+    def _run_toolkit_command_in_subprocess(self, feedback: QgsProcessingFeedback) -> dict:
+        """Runs the toolkit command in a new process and captures the output."""
         results = {}
         q = queue.Queue()
+        monitor = None
+        self._start_run_stats("subprocess")
 
         def enqueue_output(pipe: TextIO, queue: queue.Queue, process_event: threading.Event) -> None:
             try:
@@ -184,41 +492,48 @@ class EISToolkitInvoker:
                     queue.put(line)
             finally:
                 pipe.close()
+                queue.put(None)  # Signal end of the stream
 
         # Execute EIS Toolkit through subprocess
         try:
             # QGIS sets some PYTHON environment variables that might disturb the external python the process is using
             logger.debug(f'Running command "{" ".join(self.cmd)}" with environment: {self.python_free_environment=}')
 
-            creationflags = 0
-            if os.name == 'nt':  # If Windows, prevent process window creation
-                creationflags = subprocess.CREATE_NO_WINDOW
-
             feedback.pushInfo("[OPENING EIS TOOLKIT]\n")
 
+            # Own process group, so that cancelling stops also the processes started by the toolkit
             self.process = subprocess.Popen(
                 self.cmd,   
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
                 env=self.python_free_environment,
-                creationflags=creationflags,
-                errors='replace'
+                errors='replace',
+                **get_popen_kwargs()
             )
+            monitor = self._start_process_monitor(self.process)
 
             process_event = threading.Event()
 
-            stdout_thread = threading.Thread(target=enqueue_output, args=(self.process.stdout, q, process_event))
-            stderr_thread = threading.Thread(target=enqueue_output, args=(self.process.stderr, q, process_event))
+            # Daemon threads, since processes started by the toolkit can keep its pipes open
+            stdout_thread = threading.Thread(
+                target=enqueue_output, args=(self.process.stdout, q, process_event), daemon=True
+            )
+            stderr_thread = threading.Thread(
+                target=enqueue_output, args=(self.process.stderr, q, process_event), daemon=True
+            )
 
             stdout_thread.start()
             stderr_thread.start()
 
-            while self.process.poll() is None:
+            # Block until output is available and handle everything that has been queued in one batch.
+            # The wait is bounded only to check for cancellation regularly.
+            open_streams = 2
+            process_exited = False
+            while open_streams > 0:
                 if feedback.isCanceled():
                     process_event.set()
-                    self.process.terminate()
-                    self.process.wait()
+                    self._terminate_process()
 
                     stdout_thread.join()
                     stderr_thread.join()
@@ -226,23 +541,34 @@ class EISToolkitInvoker:
                     raise TerminationException("\n❌ Execution cancelled\n")
 
                 try:
-                    line = q.get_nowait()
+                    lines = [q.get(timeout=self.CANCEL_CHECK_INTERVAL)]
                 except queue.Empty:
+                    # Processes started by the toolkit (e.g. joblib workers) inherit its pipes and can keep
+                    # them open after it has exited. Stop once it has exited and its output has been drained
+                    if process_exited:
+                        break
+                    process_exited = self.process.poll() is not None
                     continue
 
-                if line:
-                    self._process_command_output(line.strip(), feedback, results)
+                while True:
+                    try:
+                        lines.append(q.get_nowait())
+                    except queue.Empty:
+                        break
 
-                time.sleep(0.05)
+                for line in lines:
+                    if line is None:
+                        open_streams -= 1
+                    elif line:
+                        self._process_command_output(line.strip(), feedback, results)
 
+            self.process.wait()
             process_event.set()
-            stdout_thread.join()
-            stderr_thread.join()
-
-            while not q.empty():
-                line = q.get_nowait()
-                if line:
-                    self._process_command_output(line.strip(), feedback, results)
+            if open_streams > 0:
+                # Stop the processes left in the process group of the toolkit, they hold its pipes open
+                signal_process_group(self.process, force=True)
+            stdout_thread.join(TERMINATE_TIMEOUT)
+            stderr_thread.join(TERMINATE_TIMEOUT)
 
             # Inform user whether execution was successful or not
             if self.process.returncode != 0:
@@ -251,10 +577,7 @@ class EISToolkitInvoker:
             #     feedback.pushInfo("EIS Toolkit algorithm executed successfully!")
 
         except TerminationException as e:
-            if type(feedback) == EISProcessingFeedback:
-                feedback.report_terminated_execution(e)
-            else:
-                feedback.reportError(str(e))
+            self._report_termination(e, feedback)
             return {}
 
         # Handle potential exceptions
@@ -263,8 +586,7 @@ class EISToolkitInvoker:
             try:
                 if self.process and self.process.poll() is None:
                     process_event.set()
-                    self.process.terminate()
-                    self.process.wait()
+                    self._terminate_process()
                     stdout_thread.join()
                     stderr_thread.join()
             except UnboundLocalError as ex:
@@ -272,20 +594,98 @@ class EISToolkitInvoker:
             return {}
 
         finally:
+            self._report_resource_usage(monitor, self.process, feedback)
             feedback.pushInfo("[CLOSING EIS TOOLKIT]\n")
 
             # Ensure the subprocess is properly cleaned up in all cases
             if self.process and self.process.poll() is None:
                 process_event.set()
-                self.process.terminate()
-                self.process.wait()
+                self._terminate_process()
                 stdout_thread.join()
                 stderr_thread.join()
 
+            self._finish_run_stats(self.process.returncode if self.process else None)
+
         return results
 
 
+    def _parse_event(self, stdout_line: str) -> Optional[dict]:
+        """Returns the line as an event dictionary or None if the line is not an event."""
+        if not stdout_line.startswith("{"):
+            return None
+        try:
+            event = json.loads(stdout_line)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(event, dict) or self.EVENT_KEY not in event:
+            return None
+        version = event[self.EVENT_KEY]
+        if version != self.EVENT_PROTOCOL_VERSION:
+            # Events of another protocol version can have different fields, the line is shown as text
+            if str(version) not in self._unsupported_event_versions:
+                self._unsupported_event_versions.add(str(version))
+                logger.warning(
+                    "Unsupported EIS Toolkit event protocol version %s, expected %s",
+                    version, self.EVENT_PROTOCOL_VERSION
+                )
+            return None
+        return event
+
+
+    def _on_progress_event(self, event: dict, feedback: QgsProcessingFeedback, results: dict) -> None:
+        feedback.setProgress(max(0.0, min(100.0, float(event["value"]))))
+        if event.get("message"):
+            feedback.pushInfo(event["message"])
+
+
+    def _on_log_event(self, event: dict, feedback: QgsProcessingFeedback, results: dict) -> None:
+        level = event.get("level", "info")
+        message = event.get("message", "")
+        if level == "error":
+            feedback.reportError(message)
+        elif level == "warning":
+            feedback.pushInfo(f"Warning: {message}")
+        else:
+            feedback.pushInfo(message)
+
+
+    def _on_result_event(self, event: dict, feedback: QgsProcessingFeedback, results: dict) -> None:
+        self._report_results(event["values"], results, feedback)
+
+
+    def _on_output_raster_event(self, event: dict, feedback: QgsProcessingFeedback, results: dict) -> None:
+        path = self.environment_handler.to_host_path(event["path"])
+        results.setdefault("output_folder_rasters", {})[event["name"]] = path
+        if event.get("min") is not None and event.get("max") is not None:
+            results.setdefault("output_raster_ranges", {})[path] = (float(event["min"]), float(event["max"]))
+
+
+    def _on_metric_event(self, event: dict, feedback: QgsProcessingFeedback, results: dict) -> None:
+        """Stores a metric value. Metrics reported with a step (e.g. epoch) are collected to a list."""
+        name, value = event["name"], event["value"]
+        if "step" in event:
+            results.setdefault(name, []).append(value)
+            feedback.pushInfo(f"{name} [{event['step']}]: {value}")
+        else:
+            results[name] = value
+            feedback.pushInfo(f"{name}: {value}")
+
+
     def _process_command_output(self, stdout_line: str, feedback: QgsProcessingFeedback, results: dict) -> None:
+        self._mark_run_phase(stdout_line)
+        event = self._parse_event(stdout_line)
+        if event is not None:
+            handler = self.EVENT_HANDLERS.get(event.get("type"))
+            if handler is None:
+                feedback.pushInfo(stdout_line)
+                return
+            try:
+                getattr(self, handler)(event, feedback, results)
+            except (KeyError, TypeError, ValueError) as e:
+                feedback.pushInfo(f"Malformed EIS Toolkit event ({e}): {stdout_line}")
+            return
+
+        # Legacy text protocol
         if any(prefix in stdout_line for prefix in self.PREFIX_TO_PROGRESS_MAP.keys()):
             self._update_progress(stdout_line, feedback)
             feedback.pushInfo(stdout_line)
@@ -0,0 +1,122 @@
+import logging
+import subprocess
+import threading
+from typing import TYPE_CHECKING, Callable, Optional, Set
+
+from eis_qgis_plugin.environment.eis_environment_handler import VenvEnvironmentHandler
+from eis_qgis_plugin.environment.eis_toolkit_worker import WorkerException
+from eis_qgis_plugin.environment.process_control import get_popen_kwargs, terminate_process_tree
+
+if TYPE_CHECKING:
+    from eis_qgis_plugin.environment.eis_toolkit_invoker import EISToolkitInvoker
+
+logger = logging.getLogger(__name__)
+
+PREWARM_TIMEOUT = 120  # Seconds, a dry import run taking longer than this is stopped
+POLL_INTERVAL = 0.1  # Seconds between checks for cancellation while waiting for the warm-up
+
+_prewarm_thread: Optional[threading.Thread] = None
+_prewarm_process: Optional[subprocess.Popen] = None
+_prewarmed_environments: Set[str] = set()  # Environments that have had a dry import run in this session
+_prewarm_lock = threading.Lock()
+_prewarm_done = threading.Event()
+_prewarm_done.set()
+
+
+def start_prewarm(invoker: "EISToolkitInvoker") -> bool:
+    """
+    Warms up the EIS Toolkit environment of the invoker in a background thread.
+
+    If the persistent worker is enabled, the worker is started. Otherwise EIS Toolkit is imported once in a
+    throwaway process (in a Docker session container if sessions are enabled), which brings the interpreter
+    and the site-packages of the environment to the disk cache. The dry import is done once per environment
+    per QGIS session.
+
+    Returns:
+        True if a warm-up was started, False if one is running already or none is needed.
+    """
+    global _prewarm_thread
+
+    handler = invoker.environment_handler
+    if isinstance(handler, VenvEnvironmentHandler):
+        if not handler.venv_directory:
+            return False
+        environment_key = f"venv:{handler.python_path}"
+    else:
+        if not handler.docker_path:
+            return False
+        environment_key = f"docker:{handler.image_name}:{handler.use_session}"
+
+    worker = handler.get_worker(invoker.python_free_environment)
+    if worker is None and environment_key in _prewarmed_environments:
+        return False
+
+    with _prewarm_lock:
+        if not _prewarm_done.is_set():
+            return False
+        _prewarm_done.clear()
+        _prewarmed_environments.add(environment_key)
+        _prewarm_thread = threading.Thread(target=_prewarm, args=(invoker, worker), daemon=True)
+        _prewarm_thread.start()
+    return True
+
+
+def _prewarm(invoker: "EISToolkitInvoker", worker) -> None:
+    global _prewarm_process
+
+    handler = invoker.environment_handler
+    try:
+        if worker is not None:
+            # A first run arriving meanwhile waits for the worker lock, so no second process is started
+            worker.start()
+            logger.debug("EIS Toolkit worker warmed up")
+            return
+
+        cmd = [*handler.get_invocation_cmd(), handler.EIS_CLI_MODULE, "--help"]
+        with _prewarm_lock:
+            _prewarm_process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=invoker.python_free_environment,
+                **get_popen_kwargs()
+            )
+        try:
+            _prewarm_process.wait(PREWARM_TIMEOUT)
+            logger.debug("EIS Toolkit warmed up with a dry import run")
+        except subprocess.TimeoutExpired:
+            logger.warning("EIS Toolkit warm-up did not finish in %s s, stopping it", PREWARM_TIMEOUT)
+            terminate_process_tree(_prewarm_process, signal_external=handler.signal_run)
+
+    except (WorkerException, OSError) as e:
+        logger.warning("EIS Toolkit warm-up failed: %s", e)
+
+    finally:
+        with _prewarm_lock:
+            _prewarm_process = None
+        _prewarm_done.set()
+
+
+def is_prewarming() -> bool:
+    return not _prewarm_done.is_set()
+
+
+def wait_for_prewarm(is_canceled: Callable[[], bool] = lambda: False) -> bool:
+    """
+    Waits until a running warm-up has finished, so that a run does not start a second cold process.
+
+    Returns:
+        False if the wait was cancelled, True otherwise.
+    """
+    while not _prewarm_done.wait(POLL_INTERVAL):
+        if is_canceled():
+            return False
+    return True
+
+
+def shutdown_prewarm() -> None:
+    """Stops a running dry import run. Called when the plugin is unloaded."""
+    with _prewarm_lock:
+        process = _prewarm_process
+    if process is not None and process.poll() is None:
+        terminate_process_tree(process)
@@ -0,0 +1,316 @@
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+from typing import Callable, Dict, List, Optional, TextIO
+
+from eis_qgis_plugin.environment.process_control import (
+    get_popen_kwargs,
+    signal_process_group,
+    terminate_process_tree,
+)
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "toolkit_worker_script.py")
+
+
+class WorkerException(Exception):
+    """Exception error class raised if the persistent worker cannot be started."""
+
+
+class EISToolkitWorker:
+    """
+    A long-lived EIS Toolkit process that serves algorithm requests over stdin/stdout.
+
+    Interpreter startup and the heavy imports of EIS Toolkit are paid only once per worker. Requests
+    are serialized, i.e. one worker runs one algorithm at a time, and a request waiting for the worker
+    can be cancelled. If the worker dies, it is restarted automatically in the background.
+    """
+
+    STARTUP_TIMEOUT = 300  # Seconds, first import of a cold environment can be very slow
+    POLL_INTERVAL = 0.1  # Seconds between cancellation checks while waiting for events
+
+    _EXITED = {"event": "exited"}
+
+    def __init__(self, python_path: str, env: Dict[str, str]) -> None:
+        self.python_path = python_path
+        self.env = env
+
+        self.process: Optional[subprocess.Popen] = None
+        self._events: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._request_id = 0
+        self._shutting_down = False
+
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+
+    def is_busy(self) -> bool:
+        """Whether a request (or a startup) is holding the worker."""
+        return self._lock.locked()
+
+
+    def _acquire(self, is_canceled: Callable[[], bool]) -> bool:
+        """Waits until the worker is free. Returns False if the wait was cancelled."""
+        while not self._lock.acquire(timeout=self.POLL_INTERVAL):
+            if is_canceled():
+                return False
+        return True
+
+
+    def start(self, is_canceled: Callable[[], bool] = lambda: False) -> None:
+        """Starts the worker (if not running already) and waits until EIS Toolkit has been imported."""
+        if not self._acquire(is_canceled):
+            raise WorkerException("Waiting for EIS Toolkit worker cancelled.")
+        try:
+            self._start(is_canceled)
+        finally:
+            self._lock.release()
+
+
+    def _start(self, is_canceled: Callable[[], bool]) -> None:
+        if self.is_alive():
+            return
+
+        self._events = queue.Queue()
+
+        try:
+            self.process = subprocess.Popen(
+                [self.python_path, "-W", "ignore", "-u", WORKER_SCRIPT_PATH],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                env=self.env,
+                errors='replace',
+                **get_popen_kwargs()
+            )
+        except OSError as e:
+            self.process = None
+            raise WorkerException(f"Could not start EIS Toolkit worker: {e}")
+
+        threading.Thread(target=self._read_events, args=(self.process.stdout, self._events), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(self.process.stderr, self._events), daemon=True).start()
+
+        startup_output = []
+        waited = 0.0
+        while waited < self.STARTUP_TIMEOUT:
+            if is_canceled():
+                self._kill()
+                raise WorkerException("EIS Toolkit worker startup cancelled.")
+            try:
+                event = self._events.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                waited += self.POLL_INTERVAL
+                continue
+
+            if event.get("event") == "ready":
+                logger.debug("EIS Toolkit worker started with PID %s", event.get("pid"))
+                return
+            elif event.get("event") == "line":
+                startup_output.append(event.get("text", ""))
+            elif event.get("event") in ("failed", "exited"):
+                self._kill()
+                details = event.get("error") or "\n".join(startup_output[-5:])
+                raise WorkerException(f"EIS Toolkit worker failed to start. {details}")
+
+        self._kill()
+        raise WorkerException("EIS Toolkit worker did not start in time.")
+
+
+    def run(
+        self,
+        args: List[str],
+        on_line: Callable[[str], None],
+        is_canceled: Callable[[], bool]
+    ) -> Optional[int]:
+        """
+        Runs one EIS Toolkit CLI command in the worker.
+
+        Args:
+            args: CLI arguments, starting with the command name (for example `log-transform-cli`).
+            on_line: Called for each output line of the command.
+            is_canceled: Polled while the command runs. Cancelling kills the worker.
+
+        Returns:
+            Exit code of the command or None if the command was cancelled.
+
+        Raises:
+            WorkerException: The worker could not be started.
+        """
+        done_event = self._run_request({"args": args}, on_line, is_canceled)
+        if done_event is None:
+            return None
+        return done_event.get("returncode", 1)
+
+
+    def _run_request(
+        self,
+        request: dict,
+        on_line: Callable[[str], None],
+        is_canceled: Callable[[], bool]
+    ) -> Optional[dict]:
+        """
+        Sends a request and dispatches its events. Returns the `done` event or None if cancelled.
+
+        If another run holds the worker, waits for it while polling for cancellation.
+        """
+        if not self._acquire(is_canceled):
+            return None
+        try:
+            return self._send_request(request, on_line, is_canceled)
+        finally:
+            self._lock.release()
+
+
+    def _send_request(
+        self,
+        request: dict,
+        on_line: Callable[[str], None],
+        is_canceled: Callable[[], bool]
+    ) -> Optional[dict]:
+        self._start(is_canceled)
+
+        # Discard output produced between requests
+        while not self._events.empty():
+            self._events.get_nowait()
+
+        self._request_id += 1
+        request_id = self._request_id
+        try:
+            self.process.stdin.write(json.dumps({"id": request_id, **request}) + "\n")
+            self.process.stdin.flush()
+        except OSError as e:
+            self._kill()
+            raise WorkerException(f"Could not send request to EIS Toolkit worker: {e}")
+
+        while True:
+            if is_canceled():
+                self._kill()
+                return None
+            try:
+                event = self._events.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            event_type = event.get("event")
+            if event_type == "line":
+                on_line(event.get("text", ""))
+            elif event_type == "done" and event.get("id") == request_id:
+                return event
+            elif event_type == "exited":
+                on_line("EIS Toolkit worker exited unexpectedly, restarting it.")
+                self._kill()
+                self._restart_in_background()
+                return {"event": "done", "returncode": 1}
+
+
+    def shutdown(self) -> None:
+        """Asks the worker to exit and kills it if it does not comply."""
+        self._shutting_down = True
+        self._stop()
+
+
+    def _stop(self) -> None:
+        process = self.process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.write(json.dumps({"command": "shutdown"}) + "\n")
+            process.stdin.flush()
+            process.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            signal_process_group(process, force=True)
+            process.wait()
+
+
+    def _kill(self) -> None:
+        """Terminates the worker and the processes it started, escalating to SIGKILL after a timeout."""
+        if self.process is not None and self.process.poll() is None:
+            terminate_process_tree(self.process)
+
+
+    def _restart_in_background(self) -> None:
+        if self._shutting_down:
+            return
+
+        def restart():
+            try:
+                self.start()
+            except WorkerException as e:
+                logger.error(str(e))
+
+        threading.Thread(target=restart, daemon=True).start()
+
+
+    @staticmethod
+    def _read_events(pipe: TextIO, events: queue.Queue) -> None:
+        try:
+            for line in iter(pipe.readline, ''):
+                try:
+                    events.put(json.loads(line))
+                except json.JSONDecodeError:
+                    events.put({"event": "line", "stream": "stdout", "text": line.rstrip("\n")})
+        finally:
+            pipe.close()
+            events.put(EISToolkitWorker._EXITED)
+
+
+    @staticmethod
+    def _read_stderr(pipe: TextIO, events: queue.Queue) -> None:
+        try:
+            for line in iter(pipe.readline, ''):
+                events.put({"event": "line", "stream": "stderr", "text": line.rstrip("\n")})
+        finally:
+            pipe.close()
+
+
+_workers: Dict[str, List[EISToolkitWorker]] = {}
+_workers_lock = threading.Lock()
+
+
+def _retire_worker(worker: EISToolkitWorker) -> None:
+    """Shuts down a replaced worker once the request it may be running has finished."""
+    def retire():
+        with worker._lock:
+            worker.shutdown()
+
+    threading.Thread(target=retire, daemon=True).start()
+
+
+def get_toolkit_worker(python_path: str, env: Dict[str, str], max_workers: int = 1) -> EISToolkitWorker:
+    """
+    Returns a persistent worker of the given Python interpreter, creating it if needed.
+
+    Up to `max_workers` workers (one for each job that can run concurrently) are kept per interpreter,
+    so concurrent runs do not wait for each other. If all of them are busy, the first one is returned and
+    the run waits for it. Workers started with a different environment are replaced.
+    """
+    with _workers_lock:
+        pool = _workers.setdefault(python_path, [])
+        for worker in list(pool):
+            if worker.env != env:
+                # The process inherited the environment it was started with, e.g. an older thread budget
+                pool.remove(worker)
+                _retire_worker(worker)
+        for worker in pool:
+            if not worker.is_busy():
+                return worker
+        if len(pool) < max(1, max_workers):
+            worker = EISToolkitWorker(python_path, env)
+            pool.append(worker)
+            return worker
+        return pool[0]
+
+
+def shutdown_toolkit_workers() -> None:
+    """Shuts down all persistent workers. Called when the plugin is unloaded."""
+    with _workers_lock:
+        for worker in [worker for pool in _workers.values() for worker in pool]:
+            worker.shutdown()
+        _workers.clear()
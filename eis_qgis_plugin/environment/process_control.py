@@ -0,0 +1,82 @@
+import logging
+import os
+import signal
+import subprocess
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+TERMINATE_TIMEOUT = 5  # Seconds to wait after SIGTERM before killing the process group
+
+
+def get_popen_kwargs() -> Dict:
+    """
+    Returns Popen arguments that start the process in its own process group.
+
+    Signals can then be sent to the whole group, so that processes started by the child (such as
+    the Python of `poetry run` or the workers of joblib) are stopped as well.
+    """
+    if os.name == 'nt':  # If Windows, also prevent process window creation
+        return {"creationflags": subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def signal_process_group(process: subprocess.Popen, force: bool = False) -> None:
+    """
+    Sends SIGTERM (or SIGKILL if force is True) to the process group of the process.
+
+    On Windows the process tree is terminated with taskkill instead.
+    """
+    if os.name == 'nt':
+        if process.poll() is not None:
+            return
+        taskkill_cmd = ["taskkill", "/T", "/PID", str(process.pid)] + (["/F"] if force else [])
+        try:
+            subprocess.run(
+                taskkill_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW, timeout=TERMINATE_TIMEOUT
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error("Failed to terminate process tree %s: %s", process.pid, e)
+            process.kill()
+        return
+
+    # The process is the leader of its group, the group ID stays reserved while any member is alive
+    try:
+        os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except ProcessLookupError:
+        pass  # The whole group has exited
+    except PermissionError:
+        # Not a group leader (started without `get_popen_kwargs`), signal only the process itself
+        if process.poll() is None:
+            process.kill() if force else process.terminate()
+
+
+def terminate_process_tree(
+    process: subprocess.Popen,
+    timeout: float = TERMINATE_TIMEOUT,
+    signal_external: Optional[Callable[[bool], None]] = None
+) -> None:
+    """
+    Terminates the process and everything it started, escalating from SIGTERM to SIGKILL.
+
+    The process group gets SIGTERM first. If the process has not exited after the timeout, the group
+    gets SIGKILL. The group is killed in any case at the end, so no stray members remain.
+
+    Args:
+        process: Process started with `get_popen_kwargs`.
+        timeout: Seconds to wait for the process to exit after SIGTERM.
+        signal_external: Called with force=False and, on escalation, force=True to stop processes that
+            are not in the process group (e.g. a Docker container).
+    """
+    signal_process_group(process)
+    if signal_external is not None:
+        signal_external(False)
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        logger.warning("Process %s did not exit in %s s after SIGTERM, killing it", process.pid, timeout)
+        if signal_external is not None:
+            signal_external(True)
+    signal_process_group(process, force=True)
+    process.wait()
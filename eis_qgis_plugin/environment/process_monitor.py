@@ -0,0 +1,127 @@
+import logging
+import os
+import threading
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessMonitor:
+    """
+    Samples the resident memory (RSS) and CPU time of a process and its descendants from `/proc`.
+
+    Sampling runs in a daemon thread and reads only a few small files per process, so it does not
+    need psutil. On platforms without `/proc` the monitor does nothing and its values stay None.
+
+    If a memory limit is given, `on_limit_exceeded` is called once when the total RSS of the process
+    tree goes over it. CPU time is measured from the start of monitoring, so a reused process (such as
+    the persistent worker) is not charged for its earlier runs.
+    """
+
+    SAMPLE_INTERVAL = 0.5  # Seconds
+
+    def __init__(
+        self,
+        pid: int,
+        memory_limit: Optional[int] = None,
+        on_limit_exceeded: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Args:
+            pid: ID of the root process.
+            memory_limit: Memory limit in bytes. None or 0 for no limit.
+            on_limit_exceeded: Called from the sampling thread when the limit is exceeded.
+        """
+        self.pid = pid
+        self.memory_limit = memory_limit
+        self.on_limit_exceeded = on_limit_exceeded
+
+        self.peak_memory: Optional[int] = None
+        self.cpu_time: Optional[float] = None
+        self.limit_exceeded = False
+
+        self._cpu_time_baseline: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+
+    @staticmethod
+    def is_supported() -> bool:
+        return os.path.isdir("/proc/self/task")
+
+
+    def start(self) -> "ProcessMonitor":
+        if not self.is_supported():
+            return self
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+
+    def stop(self) -> "ProcessMonitor":
+        """Stops sampling. Takes a final sample if the process is still running."""
+        if self._thread is None:
+            return self
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._sample()
+        return self
+
+
+    def _run(self):
+        while not self._stop_event.wait(self.SAMPLE_INTERVAL):
+            self._sample()
+
+
+    def _get_process_tree(self) -> List[int]:
+        pids, index = [self.pid], 0
+        while index < len(pids):
+            task_dir = f"/proc/{pids[index]}/task"
+            index += 1
+            try:
+                tasks = os.listdir(task_dir)
+            except OSError:
+                continue
+            for task in tasks:
+                try:
+                    with open(os.path.join(task_dir, task, "children"), "r") as f:
+                        pids.extend(int(pid) for pid in f.read().split())
+                except (OSError, ValueError):
+                    continue
+        return pids
+
+
+    @staticmethod
+    def _read_process(pid: int) -> Optional[tuple]:
+        """Returns (RSS in bytes, CPU time in seconds including reaped children) of the process."""
+        try:
+            with open(f"/proc/{pid}/statm", "r") as f:
+                rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+            with open(f"/proc/{pid}/stat", "r") as f:
+                # The command name can contain spaces, fields are counted from its closing parenthesis
+                fields = f.read().rsplit(")", 1)[1].split()
+            ticks = sum(int(field) for field in fields[11:15])  # utime, stime, cutime, cstime
+        except (OSError, ValueError, IndexError):
+            return None
+        return rss, ticks / os.sysconf("SC_CLK_TCK")
+
+
+    def _sample(self):
+        samples = [sample for sample in map(self._read_process, self._get_process_tree()) if sample is not None]
+        if not samples:
+            return
+        rss = sum(sample[0] for sample in samples)
+        cpu_time = sum(sample[1] for sample in samples)
+
+        if self._cpu_time_baseline is None:
+            self._cpu_time_baseline = cpu_time
+        self.cpu_time = max(self.cpu_time or 0.0, cpu_time - self._cpu_time_baseline)
+        self.peak_memory = max(self.peak_memory or 0, rss)
+
+        if self.memory_limit and rss > self.memory_limit and not self.limit_exceeded:
+            self.limit_exceeded = True
+            logger.warning("Process %s exceeded the memory limit (%s > %s bytes)", self.pid, rss, self.memory_limit)
+            if self.on_limit_exceeded is not None:
+                self.on_limit_exceeded()
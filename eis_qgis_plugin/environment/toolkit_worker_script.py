@@ -0,0 +1,136 @@
+"""
+Persistent EIS Toolkit worker.
+
+This script is executed with the Python interpreter of the EIS Toolkit environment, *not* inside QGIS,
+so it must only depend on the standard library and EIS Toolkit itself.
+
+The worker imports `eis_toolkit.cli` once and then serves requests read from stdin, one JSON object per
+line. Each request is dispatched in-process to the same Typer commands that `python -m eis_toolkit.cli`
+would run. Everything the command prints is streamed back to stdout as JSON events tagged with the
+request ID, followed by a final `done` event carrying the exit code.
+
+Request:   {"id": 1, "args": ["log-transform-cli", "--input-raster", "...", ...]}
+Events:    {"event": "ready", "pid": 1234}
+           {"id": 1, "event": "line", "stream": "stdout", "text": "Input files read"}
+           {"id": 1, "event": "done", "returncode": 0}
+"""
+
+import io
+import json
+import os
+import sys
+import traceback
+
+PROTOCOL_VERSION = 1
+
+
+class _EventWriter(io.TextIOBase):
+    """File-like object that converts written text into line events of the current request."""
+
+    def __init__(self, emit, stream_name: str):
+        self._emit = emit
+        self._stream_name = stream_name
+        self._buffer = ""
+        self.request_id = None
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._emit_line(line)
+        return len(text)
+
+    def flush(self):
+        if self._buffer:
+            self._emit_line(self._buffer)
+            self._buffer = ""
+
+    def _emit_line(self, line: str):
+        self._emit({"id": self.request_id, "event": "line", "stream": self._stream_name, "text": line})
+
+
+def _open_protocol_channel():
+    """
+    Reserve the original stdout for protocol messages.
+
+    Native libraries (GDAL, BLAS, ...) write directly to file descriptor 1, which would corrupt the
+    JSON stream. The original stdout is duplicated for the protocol and descriptor 1 is pointed to stderr.
+    """
+    protocol_fd = os.dup(sys.stdout.fileno())
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return io.open(protocol_fd, "w", encoding="utf-8", errors="replace", buffering=1)
+
+
+def _run_command(command, args, stdout_writer, stderr_writer) -> int:
+    """Runs one CLI command with its output redirected to the event writers and returns the exit code."""
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = stdout_writer, stderr_writer
+    try:
+        command.main(args=args, prog_name="eis_toolkit.cli", standalone_mode=False)
+        returncode = 0
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        # Click usage errors know how to present themselves, everything else gets a traceback
+        if hasattr(e, "show"):
+            e.show(file=stderr_writer)
+            returncode = getattr(e, "exit_code", 1)
+        else:
+            traceback.print_exc(file=stderr_writer)
+            returncode = 1
+    finally:
+        stdout_writer.flush()
+        stderr_writer.flush()
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+    return returncode
+
+
+def main():
+    channel = _open_protocol_channel()
+
+    def emit(message: dict):
+        channel.write(json.dumps(message) + "\n")
+        channel.flush()
+
+    try:
+        import typer
+        from eis_toolkit.cli import app
+        command = typer.main.get_command(app)
+    except Exception:
+        traceback.print_exc(file=sys.stderr)
+        emit({"event": "failed", "error": traceback.format_exc(limit=1)})
+        return 1
+
+    emit({"event": "ready", "pid": os.getpid(), "version": PROTOCOL_VERSION})
+
+    stdout_writer = _EventWriter(emit, "stdout")
+    stderr_writer = _EventWriter(emit, "stderr")
+
+    for raw_request in sys.stdin:
+        raw_request = raw_request.strip()
+        if not raw_request:
+            continue
+        try:
+            request = json.loads(raw_request)
+        except json.JSONDecodeError:
+            emit({"event": "error", "error": f"Invalid request: {raw_request}"})
+            continue
+
+        if request.get("command") == "shutdown":
+            break
+
+        request_id = request.get("id")
+        stdout_writer.request_id = request_id
+        stderr_writer.request_id = request_id
+
+        returncode = _run_command(command, request.get("args", []), stdout_writer, stderr_writer)
+        emit({"id": request_id, "event": "done", "returncode": returncode})
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,11 +9,14 @@ from qgis.PyQt.QtWidgets import QAction, QMenu, QToolButton, QWidget
 from qgis.utils import iface
 
 from eis_qgis_plugin.eis_processing.eis_provider import EISProvider
+from eis_qgis_plugin.environment.eis_docker_session import shutdown_docker_sessions
+from eis_qgis_plugin.environment.eis_toolkit_prewarm import shutdown_prewarm
+from eis_qgis_plugin.environment.eis_toolkit_worker import shutdown_toolkit_workers
 from eis_qgis_plugin.qgis_plugin_tools.tools.custom_logging import setup_logger, teardown_logger
+from eis_qgis_plugin.utils.algorithm_execution import AlgorithmScheduler
 from eis_qgis_plugin.utils.misc_utils import PLUGIN_PATH
 from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
 
-from .eis_wizard.wizard_main import EISWizardDialog, EISWizardDocked
 from .qgis_plugin_tools.tools.i18n import setup_translation
 
 
@@ -163,7 +166,11 @@ class Plugin:
             self.iface.removeToolBarIcon(action)
         teardown_logger(Plugin.name)
 
+        AlgorithmScheduler.instance().cancel_all()
         QgsApplication.processingRegistry().removeProvider(self.provider)
+        shutdown_prewarm()
+        shutdown_toolkit_workers()
+        shutdown_docker_sessions()
 
     def open_wizard(self, page):
         if EISSettingsManager.get_dock_wizard_selection():
@@ -172,11 +179,17 @@ class Plugin:
             self.open_wizard_dialog(page)
 
     def open_wizard_dialog(self, page):
+        # Wizard pages import the plotting stack (matplotlib, pandas, seaborn), so the wizard is imported
+        # only when it is opened to keep plugin loading light
+        from eis_qgis_plugin.eis_wizard.wizard_main import EISWizardDialog
+
         self.wizard = EISWizardDialog()
         self.wizard.show()
         self.wizard.content.menu_widget.setCurrentRow(page)
 
     def open_wizard_dock(self, page):
+        from eis_qgis_plugin.eis_wizard.wizard_main import EISWizardDocked
+
         self.wizard = EISWizardDocked()
         self.iface.addDockWidget(Qt.RightDockWidgetArea, self.wizard)
         self.wizard.content.menu_widget.setCurrentRow(page)
@@ -1,5 +1,7 @@
+import heapq
+import itertools
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from qgis import processing
 from qgis.core import QgsProcessingFeedback
@@ -7,26 +9,97 @@ from qgis.PyQt.QtCore import QObject, QThread, pyqtSignal
 
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
 from eis_qgis_plugin.utils.model_feedback import EISProcessingFeedback
+from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+from eis_qgis_plugin.utils.temp_output_store import EISTempOutputStore
 
 
-class AlgorithmExecutor(QObject):
+class AlgorithmJob(QObject):
+    """One queued or running algorithm execution of the AlgorithmScheduler."""
+
     finished = pyqtSignal(dict, float)
     terminated = pyqtSignal()
     error = pyqtSignal(str)
+    done = pyqtSignal()  # Emitted after any of the above
+    progress = pyqtSignal(int)
 
-    def __init__(self) -> None:
+    LOW_PRIORITY = -1
+    NORMAL_PRIORITY = 0
+    HIGH_PRIORITY = 1
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        alg_name: str,
+        alg_parameters: Dict[str, Any],
+        feedback: EISProcessingFeedback,
+        priority: int = NORMAL_PRIORITY
+    ) -> None:
         super().__init__()
 
+        self.alg_name = alg_name
+        self.alg_parameters = alg_parameters
+        self.feedback = feedback
+        self.priority = priority
+
+        self.state = self.QUEUED
+        self.is_terminated = False
+        self.start_time = None
         self.worker = None
         self.worker_thread = None
-        self.is_running = False
-        self.is_terminated = False
 
-        self.alg_name = None
-        self.feedback = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.state in (self.QUEUED, self.RUNNING)
+
+
+    def cancel(self):
+        AlgorithmScheduler.instance().cancel(self)
+
+
+    def _start(self):
+        self.state = self.RUNNING
+        self.feedback.no_errors = True
+        self.start_time = time.perf_counter()
+
+        self.worker = AlgorithmWorker(self.alg_name, self.alg_parameters, self.feedback)
+        self.worker.finished.connect(self._on_worker_finished)
+        self.worker.error.connect(self._on_worker_error)
+
+        self.worker_thread = QThread()
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.run)
+
+        self.feedback.progress_signal.connect(self._on_progress)
+        self.feedback.setProgress(0)
+        self.worker_thread.start()
+
+
+    def _cancel(self):
+        if self.state == self.QUEUED:
+            self.state = self.CANCELLED
+            self.feedback.report_terminated_execution("Queued run cancelled.")
+            self.feedback.finish_run()
+            self.terminated.emit()
+            self.done.emit()
+        elif self.state == self.RUNNING:
+            # The worker thread returns once the toolkit processes have been terminated, which takes at most
+            # the SIGTERM timeout of the process group before they are killed
+            self.is_terminated = True
+            self.feedback.pushInfo("Cancelling, stopping EIS Toolkit processes...")
+            self.feedback.cancel()
 
 
     def _cleanup(self):
+        try:
+            self.feedback.progress_signal.disconnect(self._on_progress)
+        except TypeError:
+            pass  # Not connected
         if self.worker:
             self.worker.deleteLater()
             self.worker = None
@@ -35,39 +108,181 @@ class AlgorithmExecutor(QObject):
             self.worker_thread.wait()
             self.worker_thread.deleteLater()
             self.worker_thread = None
-        self.is_running = False
-        self.is_terminated = False
 
 
-    def cancel(self):
-        self.is_terminated = True
-        if self.is_running:
-            self.is_running = False
-            if self.feedback:
-                self.feedback.cancel()
-            if self.worker_thread and self.worker_thread.isRunning():
-                self.worker_thread.quit()
-                self.worker_thread.wait()
+    def _on_progress(self, progress: int):
+        if self.state == self.RUNNING:
+            self.progress.emit(progress)
 
 
-    def on_finished(self, result: dict | None):
-        end = time.perf_counter()
-        execution_time = end - self.start_time
+    def _on_worker_finished(self, result: dict):
+        execution_time = time.perf_counter() - self.start_time
+        self._cleanup()
+        self.feedback.finish_run()  # Deliver buffered log lines before the page reacts to the result
         if self.is_terminated:
+            self.state = self.CANCELLED
             self.terminated.emit()
         else:
+            self.state = self.FINISHED
+            EISTempOutputStore.register(result)
             self.finished.emit(result, execution_time)
+        self.done.emit()
+
+
+    def _on_worker_error(self, error_message: str):
         self._cleanup()
+        self.feedback.finish_run()
+        self.state = self.FAILED
+        self.error.emit(error_message)
+        self.done.emit()
+
+
+
+class AlgorithmScheduler(QObject):
+    """
+    Plugin-wide queue for the algorithm executions of EIS Wizard.
+
+    Jobs are started in priority order, FIFO within the same priority, on a bounded number of
+    worker threads. The number of slots is read from settings every time a slot frees up, so
+    changing it takes effect without restarting QGIS.
+
+    A singleton, i.e. it should be used like this: \n
+    `AlgorithmScheduler.instance().submit(job)`
+    """
+
+    queue_changed = pyqtSignal(int, int)  # Queued jobs, running jobs
+
+    _instance = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._queue: List[Tuple[int, int, AlgorithmJob]] = []
+        self._sequence = itertools.count()
+        self.running_jobs: List[AlgorithmJob] = []
+
+
+    @classmethod
+    def instance(cls) -> "AlgorithmScheduler":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+
+    @property
+    def queued_jobs(self) -> List[AlgorithmJob]:
+        return [job for _, _, job in sorted(self._queue)]
+
+
+    def submit(self, job: AlgorithmJob):
+        """Adds the job to the queue and starts it immediately if a slot is free."""
+        job.feedback.start_run()
+        heapq.heappush(self._queue, (-job.priority, next(self._sequence), job))
+        job.done.connect(lambda: self._on_job_done(job))
+        self.start_queued_jobs()
+
+        if job.state == AlgorithmJob.QUEUED:
+            position = self.queued_jobs.index(job)
+            job.feedback.pushInfo(
+                f"Waiting for a free processing slot, {len(self.running_jobs)} run(s) in progress "
+                f"and {position} queued before this one."
+            )
+
+
+    def cancel(self, job: AlgorithmJob):
+        """Removes a queued job from the queue or terminates a running job."""
+        if job.state == AlgorithmJob.QUEUED:
+            self._queue = [entry for entry in self._queue if entry[2] is not job]
+            heapq.heapify(self._queue)
+            self.queue_changed.emit(len(self._queue), len(self.running_jobs))
+        job._cancel()
+
+
+    def cancel_all(self):
+        for job in self.queued_jobs + self.running_jobs:
+            self.cancel(job)
+
+
+    def start_queued_jobs(self):
+        """Starts queued jobs until all slots are in use."""
+        max_jobs = max(1, EISSettingsManager.get_max_concurrent_jobs())
+        while self._queue and len(self.running_jobs) < max_jobs:
+            _, _, job = heapq.heappop(self._queue)
+            self.running_jobs.append(job)
+            job._start()
+        self.queue_changed.emit(len(self._queue), len(self.running_jobs))
+
+
+    def enforce_temp_output_quota(self, quota_bytes: Optional[int] = None) -> int:
+        """
+        Removes unused temporary outputs over the quota, keeping the inputs of queued and running jobs.
+
+        Returns:
+            Number of bytes freed.
+        """
+        protected_values = [
+            value for job in self.queued_jobs + self.running_jobs for value in job.alg_parameters.values()
+        ]
+        return EISTempOutputStore.enforce_quota(protected_values, quota_bytes)
+
+
+    def _on_job_done(self, job: AlgorithmJob):
+        if job in self.running_jobs:
+            self.running_jobs.remove(job)
+        self.start_queued_jobs()
+        # The page has loaded the outputs of the job as layers by now, so they are kept
+        self.enforce_temp_output_quota()
+
+
+
+class AlgorithmExecutor(QObject):
+    """
+    Runs the algorithms of one wizard page through the shared AlgorithmScheduler.
+
+    Each executor has at most one active (queued or running) job, since all runs of a page share
+    its feedback and the pages keep the state of a run (output paths, layer names) in their widgets.
+    """
+
+    finished = pyqtSignal(dict, float)
+    terminated = pyqtSignal()
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int)
+
+    def __init__(self, priority: int = AlgorithmJob.NORMAL_PRIORITY) -> None:
+        super().__init__()
+
+        self.priority = priority
+        self.job: Optional[AlgorithmJob] = None
+
+        self.alg_name = None
+        self.feedback = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self.job is not None and self.job.is_active
+
+
+    def cancel(self):
+        if self.job is not None:
+            self.job.cancel()
+
+
+    def on_finished(self, result: dict, execution_time: float):
+        self.finished.emit(result, execution_time)
+
+
+    def on_terminated(self):
+        self.terminated.emit()
 
 
     def on_error(self, error_message):
         EISMessageManager().show_message(error_message, "error")
         self.error.emit(error_message)
-        self._cleanup()
 
-    
+
     def update_feedback_progress(self, progress: int):
         self.feedback.progress_bar.setValue(progress)
+        self.progress.emit(progress)
 
 
     def update_feedback_text(self, text: str):
@@ -78,32 +293,21 @@ class AlgorithmExecutor(QObject):
         self.alg_name = alg_name
         if feedback is not self.feedback:
             self.feedback = feedback
-            self.feedback.progress_signal.connect(self.update_feedback_progress)
             if self.feedback.text_edit is not None:
                 self.feedback.text_signal.connect(self.update_feedback_text)
 
 
     def run(self, alg_parameters: Dict[str, Any]):
         if self.is_running:
+            EISMessageManager().show_message("Previous run of this page is still queued or running.", "invalid")
             return
-        
-        self._cleanup()
-        self.feedback.no_errors = True
-        self.is_running = True
-        self.start_time = time.perf_counter()
-
-        self.worker = AlgorithmWorker(self.alg_name, alg_parameters, self.feedback)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.error.connect(self.on_error)
 
-        self.worker_thread = QThread()
-        self.worker.moveToThread(self.worker_thread)
-
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-
-        self.feedback.setProgress(0)
-        self.worker_thread.start()
+        self.job = AlgorithmJob(self.alg_name, alg_parameters, self.feedback, self.priority)
+        self.job.finished.connect(self.on_finished)
+        self.job.terminated.connect(self.on_terminated)
+        self.job.error.connect(self.on_error)
+        self.job.progress.connect(self.update_feedback_progress)
+        AlgorithmScheduler.instance().submit(self.job)
 
 
 
@@ -0,0 +1,24 @@
+"""
+Files that belong together on disk, such as a shapefile and its .dbf or a raster and its .aux.xml.
+
+Only the known sidecar files of a path are included, so a file whose name merely starts with the same
+stem (e.g. out.b.tif next to out.tif) is never treated as part of the group.
+"""
+
+import os
+from typing import List
+
+RASTER_SIDECAR_SUFFIXES = [".aux.xml", ".ovr"]  # Appended to the file name, e.g. out.tif.aux.xml
+WORLD_FILE_EXTENSIONS = [".tfw"]
+SHAPEFILE_SIDECAR_EXTENSIONS = [".dbf", ".shx", ".prj", ".cpg"]
+
+
+def get_file_group(path: str) -> List[str]:
+    """Returns the file and its existing sidecar files (e.g. .dbf of a shapefile or .aux.xml of a raster)."""
+    stem, extension = os.path.splitext(path)
+    candidates = [path]
+    candidates += [path + suffix for suffix in RASTER_SIDECAR_SUFFIXES]
+    candidates += [stem + world_extension for world_extension in WORLD_FILE_EXTENSIONS]
+    if extension.lower() == ".shp":
+        candidates += [stem + sidecar_extension for sidecar_extension in SHAPEFILE_SIDECAR_EXTENSIONS]
+    return sorted(candidate for candidate in candidates if os.path.isfile(candidate))
@@ -0,0 +1,45 @@
+from typing import Callable, Optional
+
+from qgis.PyQt.QtCore import pyqtSignal
+from qgis.PyQt.QtWidgets import QVBoxLayout, QWidget
+
+
+class LazyPage(QWidget):
+    """
+    Placeholder page for a QStackedWidget or QTabWidget that builds the real page when first shown.
+
+    Pages with layer combo boxes fill their models from the project when they are created, which is slow
+    in projects with many layers. A placeholder is cheap, so a container of placeholders opens fast and
+    only the pages the user visits get built.
+    """
+
+    page_built = pyqtSignal(QWidget)
+
+    def __init__(self, factory: Callable[[QWidget], QWidget], parent: Optional[QWidget] = None) -> None:
+        """
+        Args:
+            factory: Creates the real page. Called once with the placeholder as the parent.
+            parent: Parent widget of the placeholder.
+        """
+        super().__init__(parent)
+        self.factory = factory
+        self.page: Optional[QWidget] = None
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+    def is_built(self) -> bool:
+        return self.page is not None
+
+    def build(self) -> QWidget:
+        """Builds the real page, if not built yet, and returns it."""
+        if self.page is None:
+            self.page = self.factory(self)
+            self.layout().addWidget(self.page)
+            self.page_built.emit(self.page)
+        return self.page
+
+    def showEvent(self, event):
+        self.build()
+        super().showEvent(event)
@@ -1,7 +1,7 @@
 import os
 import re
 from enum import Enum
-from typing import Any, Dict, Literal, Optional, Sequence
+from typing import Any, Dict, Literal, Optional, Sequence, Tuple
 
 from qgis.core import (
     QgsApplication,
@@ -22,6 +22,11 @@ from eis_qgis_plugin.eis_processing.eis_processing_algorithm import EISProcessin
 from eis_qgis_plugin.environment.eis_toolkit_invoker import EISToolkitInvoker
 from eis_qgis_plugin.qgis_plugin_tools.tools.resources import resources_path
 from eis_qgis_plugin.utils.message_manager import EISMessageManager
+from eis_qgis_plugin.utils.raster_statistics import (
+    RANGE_PROPERTY,
+    get_approximate_range,
+    refine_range_in_background,
+)
 
 TEMPORARY_OUTPUT = 'TEMPORARY_OUTPUT'
 CLASSIFIER_METRICS = ["Accuracy", "Precision", "Recall", "F1"]
@@ -112,15 +117,28 @@ def add_output_layer_to_group(layer, group_name: str, subgroup_name: Optional[st
         group.addLayer(layer)
 
 
-def apply_color_ramp_to_raster_layer(raster_layer: QgsRasterLayer, color_ramp: QgsColorRamp):
+def apply_color_ramp_to_raster_layer(
+    raster_layer: QgsRasterLayer,
+    color_ramp: QgsColorRamp,
+    value_range: Optional[Tuple[float, float]] = None
+):
+    """
+    Styles a single band raster layer with a color ramp.
+
+    If the value range is not given (e.g. reported by EIS Toolkit, see `get_reported_range`), an approximate
+    range is used so that the raster is not scanned fully here, and the exact range is computed in the
+    background if enabled in settings.
+    """
     # Don't apply color ramps for multiband raster
     if raster_layer.bandCount() > 1 or color_ramp is None:
         return
 
-    stats = raster_layer.dataProvider().bandStatistics(1)
+    is_exact = value_range is not None
+    if value_range is None:
+        value_range = get_approximate_range(raster_layer)
     shader = QgsColorRampShader(
-        minimumValue=stats.minimumValue,
-        maximumValue=stats.maximumValue,
+        minimumValue=value_range[0],
+        maximumValue=value_range[1],
         colorRamp=color_ramp
     )
     shader.classifyColorRamp()
@@ -130,7 +148,10 @@ def apply_color_ramp_to_raster_layer(raster_layer: QgsRasterLayer, color_ramp: Q
     
     renderer = QgsSingleBandPseudoColorRenderer(raster_layer.dataProvider(), 1, raster_shader)
     raster_layer.setRenderer(renderer)
+    raster_layer.setCustomProperty(RANGE_PROPERTY, "exact" if is_exact else "approximate")
     raster_layer.triggerRepaint()
+    if not is_exact:
+        refine_range_in_background(raster_layer)
 
 
 def parse_string_list_parameter_and_run_command(
@@ -155,8 +176,9 @@ def parse_string_list_parameter_and_run_command(
     typer_options += parameter_values  # Combine lists
 
     toolkit_invoker = EISToolkitInvoker()
-    toolkit_invoker.assemble_cli_command(algorithm.name(), typer_args, typer_options)
+    toolkit_invoker.assemble_cli_command(algorithm.name(), typer_args, typer_options, list(output_path.values()))
     results = toolkit_invoker.run_toolkit_command(feedback)
+    algorithm.apply_raster_output_profile(output_path, results, feedback)
 
     algorithm.get_results(results, parameters)
     results["output_path"] = output_path
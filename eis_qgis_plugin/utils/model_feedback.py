@@ -1,13 +1,37 @@
-from qgis.core import QgsProcessingFeedback
-from qgis.PyQt.QtCore import pyqtSignal
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Optional
+
+from qgis.core import QgsApplication, QgsProcessingFeedback
+from qgis.PyQt.QtCore import QPoint, Qt, QUrl, pyqtSignal
+from qgis.PyQt.QtGui import QDesktopServices
 from qgis.PyQt.QtWidgets import QProgressBar, QTextEdit
 
 
 class EISProcessingFeedback(QgsProcessingFeedback):
+    """
+    Feedback that delivers the log and progress of a run to a text edit and a progress bar.
+
+    Log lines are buffered and delivered to the text edit in batches, at most once per FLUSH_INTERVAL,
+    so that verbose runs do not stall the GUI thread. Progress is delivered only when its integer value
+    changes. The text edit keeps only the latest MAX_LOG_LINES lines, the full log of each run is written
+    to a file that can be opened from the context menu of the text edit. Runs are delimited by
+    `start_run` and `finish_run`.
+    """
 
     PROGRESS_PREFIX = "Progress:"  # Should be same as in EISToolkitInvoker
     ERROR_PREFIX = "ValueError:"
 
+    FLUSH_INTERVAL = 0.1  # Seconds
+    MAX_LOG_LINES = 5000  # Lines kept in the text edit and in the buffer of undelivered lines
+    MAX_LOG_FILES = 20  # Full logs of this many latest runs are kept
+
+    FULL_LOG_PATH_PROPERTY = "eis_full_log_path"
+    FULL_LOG_MENU_PROPERTY = "eis_full_log_menu"
+
     text_signal = pyqtSignal(str)
     progress_signal = pyqtSignal(int)
 
@@ -17,42 +41,148 @@ class EISProcessingFeedback(QgsProcessingFeedback):
         self.text_edit = text_edit
         self.progress_bar = progress_bar
 
+        self.full_log_path: Optional[str] = None
+        self._full_log_file = None
+        self._pending_lines = deque(maxlen=self.MAX_LOG_LINES)
+        self._dropped_lines = 0
+        self._last_progress: Optional[int] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+        if self.text_edit is not None:
+            self.text_edit.document().setMaximumBlockCount(self.MAX_LOG_LINES)
+            self._add_full_log_menu(self.text_edit)
+            self.start_run()
+
+    def start_run(self):
+        """Starts a new full log file for the next run. The file is created when the first line is logged."""
+        self._close_full_log()
+        if self.text_edit is not None:
+            file_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}.log"
+            self.full_log_path = os.path.join(self.get_log_directory(), file_name)
+            self.text_edit.setProperty(self.FULL_LOG_PATH_PROPERTY, self.full_log_path)
+
+    def finish_run(self):
+        """Delivers the remaining lines and closes the full log file of the run."""
+        self.flush()
+        self._close_full_log()
+
     def setProgress(self, progress: int):
-        if self.progress_bar is not None:
-            self.progress_signal.emit(progress)
+        if self.progress_bar is not None and int(progress) != self._last_progress:
+            self._last_progress = int(progress)
+            self.progress_signal.emit(int(progress))
 
     def pushInfo(self, info):
         if self.text_edit is not None:
             if self.PROGRESS_PREFIX in info:
                 progress = int(info.split(":")[1].strip()[:-1])
                 self.setProgress(progress)
-                self.text_signal.emit(f"Progress: {progress}%")
+                self._push_line(f"Progress: {progress}%")
             elif self.ERROR_PREFIX in info:
                 self.reportError(info)
             else:
-                self.text_signal.emit(info)
+                self._push_line(info)
 
     def pushCommandInfo(self, info):
         if self.text_edit is not None:
-            self.text_signal.emit(f"Command: {info}")
+            self._push_line(f"Command: {info}")
 
     def pushDebugInfo(self, info):
         if self.text_edit is not None:
-            self.text_signal.emit(f"Debug: {info}")
+            self._push_line(f"Debug: {info}")
 
     def pushConsoleInfo(self, info):
         if self.text_edit is not None:
-            self.text_signal.emit(f"Console: {info}")
+            self._push_line(f"Console: {info}")
 
     def reportError(self, error, fatalError=False):
         if self.text_edit is not None:
             self.no_errors = False
-            self.text_signal.emit(f"Error: {error}")
+            self._push_line(f"Error: {error}")
 
     def report_terminated_execution(self, msg = ""):
         if self.text_edit is not None:
-            self.text_signal.emit(str(msg))
+            self._push_line(str(msg))
 
     def report_failed_run(self):
         if self.text_edit is not None:
-            self.text_signal.emit("Model training failed, not saving to history")
+            self._push_line("Model training failed, not saving to history")
+
+    def _push_line(self, line: str):
+        """Buffers the line and schedules a flush, unless one is scheduled already."""
+        with self._lock:
+            if len(self._pending_lines) == self._pending_lines.maxlen:
+                self._dropped_lines += 1
+            self._pending_lines.append(line)
+            self._write_full_log(line)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Delivers all buffered lines to the text edit with one signal."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._full_log_file is not None:
+                self._full_log_file.flush()
+            if not self._pending_lines:
+                return
+            lines = list(self._pending_lines)
+            if self._dropped_lines:
+                lines.insert(0, f"... {self._dropped_lines} lines omitted, right-click to open the full log")
+            self._pending_lines.clear()
+            self._dropped_lines = 0
+            # Emitted while holding the lock, so that concurrent flushes cannot reorder lines
+            self.text_signal.emit("\n".join(lines))
+
+    @staticmethod
+    def get_log_directory() -> str:
+        log_dir = os.path.join(QgsApplication.qgisSettingsDirPath(), "eis_plugin_user_data", "logs")
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+        return log_dir
+
+    def _open_full_log(self):
+        log_dir = self.get_log_directory()
+        log_files = sorted((os.path.join(log_dir, name) for name in os.listdir(log_dir)), key=os.path.getmtime)
+        for old_file in log_files[:max(0, len(log_files) - self.MAX_LOG_FILES + 1)]:
+            try:
+                os.remove(old_file)
+            except OSError:
+                continue  # Still open (on Windows)
+        self._full_log_file = open(self.full_log_path, "a", encoding="utf-8")
+
+    def _close_full_log(self):
+        with self._lock:
+            if self._full_log_file is not None:
+                self._full_log_file.close()
+                self._full_log_file = None
+
+    def _write_full_log(self, line: str):
+        try:
+            if self._full_log_file is None:
+                self._open_full_log()
+            self._full_log_file.write(line + "\n")  # Written to disk on flush
+        except OSError:
+            pass  # The full log is a convenience, failing to write it must not fail the run
+
+    @classmethod
+    def _add_full_log_menu(cls, text_edit: QTextEdit):
+        """Adds "Open full log" to the context menu of the text edit. Done only once per text edit."""
+        if text_edit.property(cls.FULL_LOG_MENU_PROPERTY):
+            return
+        text_edit.setProperty(cls.FULL_LOG_MENU_PROPERTY, True)
+        text_edit.setContextMenuPolicy(Qt.CustomContextMenu)
+
+        def show_menu(position: QPoint):
+            menu = text_edit.createStandardContextMenu()
+            full_log_path = text_edit.property(cls.FULL_LOG_PATH_PROPERTY)
+            action = menu.addAction("Open full log")
+            action.setEnabled(bool(full_log_path) and os.path.exists(full_log_path))
+            action.triggered.connect(lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(full_log_path)))
+            menu.exec_(text_edit.mapToGlobal(position))
+
+        text_edit.customContextMenuRequested.connect(show_menu)
@@ -0,0 +1,274 @@
+"""
+Tiled reading of raster bands into NumPy arrays.
+
+A band is read in windows of whole rows with `QgsRasterDataProvider.block`, so memory use is bounded by
+the memory limit in the EIS settings (or given by the caller) regardless of the raster size. Rasters can
+be read at a reduced resolution to get a sample of their pixels, which GDAL serves from overviews when
+the raster has them. Complex values are read as their magnitudes, like in GDAL statistics.
+"""
+
+import logging
+import math
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from qgis.core import Qgis, QgsFeedback, QgsRasterBlock, QgsRasterLayer, QgsRectangle
+
+from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+
+logger = logging.getLogger(__name__)
+
+MAX_BLOCK_PIXELS = 4 * 1024 * 1024  # Pixels read at once, 32 MB for a Float64 band
+
+# QGIS data type -> NumPy data type. Int8 exists since QGIS 3.30
+QGIS_TO_NUMPY_DTYPES = {
+    Qgis.Byte: np.uint8,
+    Qgis.UInt16: np.uint16,
+    Qgis.Int16: np.int16,
+    Qgis.UInt32: np.uint32,
+    Qgis.Int32: np.int32,
+    Qgis.Float32: np.float32,
+    Qgis.Float64: np.float64,
+    Qgis.ARGB32: np.uint32,
+    Qgis.ARGB32_Premultiplied: np.uint32,
+}
+if hasattr(Qgis, "Int8"):
+    QGIS_TO_NUMPY_DTYPES[Qgis.Int8] = np.int8
+
+# Complex QGIS data type -> NumPy data type of the real and imaginary parts
+QGIS_TO_NUMPY_COMPLEX_DTYPES = {
+    Qgis.CInt16: np.int16,
+    Qgis.CInt32: np.int32,
+    Qgis.CFloat32: np.float32,
+    Qgis.CFloat64: np.float64,
+}
+
+
+def get_numpy_dtype(qgis_dtype) -> np.dtype:
+    """Returns the NumPy data type of the values read from a raster with the given QGIS data type."""
+    if qgis_dtype in QGIS_TO_NUMPY_DTYPES:
+        return np.dtype(QGIS_TO_NUMPY_DTYPES[qgis_dtype])
+    if qgis_dtype in QGIS_TO_NUMPY_COMPLEX_DTYPES:
+        # Magnitudes of complex values
+        part_size = np.dtype(QGIS_TO_NUMPY_COMPLEX_DTYPES[qgis_dtype]).itemsize
+        return np.dtype(np.float32 if part_size < 8 else np.float64)
+    raise ValueError(f"Datatype conversion to Numpy failed. QGIS datatype: {qgis_dtype}")
+
+
+def block_to_array(block: QgsRasterBlock) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the values of a raster block as a 2D array and a mask of its valid (not nodata or NaN) pixels.
+    """
+    qgis_dtype = block.dataType()
+    shape = (block.height(), block.width())
+    if qgis_dtype in QGIS_TO_NUMPY_COMPLEX_DTYPES:
+        parts = np.frombuffer(block.data(), dtype=QGIS_TO_NUMPY_COMPLEX_DTYPES[qgis_dtype]).reshape(*shape, 2)
+        array = parts[..., 0] + 1j * parts[..., 1]
+    else:
+        array = np.frombuffer(block.data(), dtype=get_numpy_dtype(qgis_dtype)).reshape(shape)
+
+    if np.issubdtype(array.dtype, np.inexact):
+        valid = ~np.isnan(array)
+    else:
+        valid = np.ones(shape, dtype=bool)
+
+    if block.hasNoDataValue():
+        nodata = block.noDataValue()
+        if not np.isnan(nodata):
+            valid &= array != nodata
+    elif block.hasNoData():
+        # Nodata given only as a bitmap (e.g. user defined nodata ranges), which is not exposed to Python
+        # as an array, so it is read pixel by pixel
+        bitmap = np.fromiter(
+            (block.isNoData(i) for i in range(block.width() * block.height())), dtype=bool, count=array.size
+        )
+        valid &= ~bitmap.reshape(shape)
+
+    if np.iscomplexobj(array):
+        array = np.abs(array).astype(get_numpy_dtype(qgis_dtype))
+    return array, valid
+
+
+def get_memory_limit(max_memory_mb: Optional[float] = None) -> int:
+    """Returns the memory limit in bytes, from the EIS settings unless given in megabytes."""
+    if max_memory_mb is None:
+        max_memory_mb = EISSettingsManager.get_raster_read_memory()
+    return int(max_memory_mb * 1024 * 1024)
+
+
+def get_read_size(layer: QgsRasterLayer, max_pixels: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Returns the width and height in which a raster is read to get at most `max_pixels` pixels.
+
+    The full size of the raster if it is small enough (or no limit is given), otherwise the size is reduced
+    keeping the aspect ratio.
+    """
+    width, height = layer.width(), layer.height()
+    if max_pixels is None or width * height <= max_pixels:
+        return width, height
+    scale = math.sqrt(max_pixels / (width * height))
+    return max(1, min(width, math.floor(width * scale))), max(1, min(height, math.floor(height * scale)))
+
+
+def _iter_tiles(
+    layer: QgsRasterLayer,
+    band: int,
+    size: Tuple[int, int],
+    max_block_pixels: int,
+    feedback: Optional[QgsFeedback],
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    provider = layer.dataProvider()
+    width, height = size
+    extent = layer.extent()
+    x_res = extent.width() / width
+    y_res = extent.height() / height
+
+    tile_width = min(width, max_block_pixels)
+    tile_height = max(1, min(height, max_block_pixels // tile_width))
+    n_tiles = math.ceil(height / tile_height) * math.ceil(width / tile_width)
+
+    done = 0
+    for row in range(0, height, tile_height):
+        rows = min(tile_height, height - row)
+        for col in range(0, width, tile_width):
+            if feedback is not None and feedback.isCanceled():
+                return
+            cols = min(tile_width, width - col)
+            tile_extent = QgsRectangle(
+                extent.xMinimum() + col * x_res,
+                extent.yMaximum() - (row + rows) * y_res,
+                extent.xMinimum() + (col + cols) * x_res,
+                extent.yMaximum() - row * y_res,
+            )
+            yield block_to_array(provider.block(band, tile_extent, cols, rows))
+
+            done += 1
+            if feedback is not None:
+                feedback.setProgress(100 * done / n_tiles)
+
+
+def iter_raster_blocks(
+    layer: QgsRasterLayer,
+    band: int = 1,
+    size: Optional[Tuple[int, int]] = None,
+    max_memory_mb: Optional[float] = None,
+    feedback: Optional[QgsFeedback] = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Reads a raster band in tiles that fit in the memory limit.
+
+    Tiles are strips of whole rows unless a single row is larger than the limit. Progress is reported to
+    the feedback after each tile and reading stops if the feedback is canceled.
+
+    Args:
+        layer: Raster layer to read.
+        band: Band number, starting from 1.
+        size: Width and height in which the raster is read, see `get_read_size`. Full size by default.
+        max_memory_mb: Memory limit of a tile. From the EIS settings by default.
+        feedback: Feedback for progress and canceling.
+
+    Yields:
+        Values of a tile as a 2D array and a mask of its valid pixels, see `block_to_array`.
+    """
+    if size is None:
+        size = (layer.width(), layer.height())
+    bytes_per_pixel = get_numpy_dtype(layer.dataProvider().dataType(band)).itemsize + 1  # Values and valid mask
+    max_block_pixels = max(1, min(MAX_BLOCK_PIXELS, get_memory_limit(max_memory_mb) // bytes_per_pixel))
+    yield from _iter_tiles(layer, band, size, max_block_pixels, feedback)
+
+
+def iter_masked_raster_blocks(
+    layer: QgsRasterLayer,
+    band: int = 1,
+    size: Optional[Tuple[int, int]] = None,
+    max_memory_mb: Optional[float] = None,
+    feedback: Optional[QgsFeedback] = None,
+) -> Iterator[np.ma.MaskedArray]:
+    """Like `iter_raster_blocks`, but yields the tiles as masked arrays with nodata and NaN pixels masked."""
+    for array, valid in iter_raster_blocks(layer, band, size, max_memory_mb, feedback):
+        yield np.ma.MaskedArray(array, mask=~valid)
+
+
+def read_raster_values(
+    layer: QgsRasterLayer,
+    band: int = 1,
+    sample_size: Optional[int] = None,
+    filter_nodata: bool = True,
+    max_memory_mb: Optional[float] = None,
+    feedback: Optional[QgsFeedback] = None,
+) -> np.ndarray:
+    """
+    Reads the values of a raster band into a 1D array.
+
+    If the band has more pixels than `sample_size` or than fit in the memory limit (together with the tile
+    being read), the raster is read at a reduced resolution, i.e. the values are a regular sample of the
+    pixels.
+
+    Args:
+        layer: Raster layer to read.
+        band: Band number, starting from 1.
+        sample_size: Maximum number of pixels to read. All pixels that fit in the memory limit by default.
+        filter_nodata: Whether nodata and NaN pixels are left out.
+        max_memory_mb: Memory limit. From the EIS settings by default.
+        feedback: Feedback for progress and canceling.
+    """
+    return read_aligned_raster_values([layer], [band], sample_size, filter_nodata, max_memory_mb, feedback)[:, 0]
+
+
+def read_aligned_raster_values(
+    layers: Sequence[QgsRasterLayer],
+    bands: Optional[Sequence[int]] = None,
+    sample_size: Optional[int] = None,
+    filter_nodata: bool = True,
+    max_memory_mb: Optional[float] = None,
+    feedback: Optional[QgsFeedback] = None,
+) -> np.ndarray:
+    """
+    Reads bands of rasters on the same grid into a 2D array with a column for each raster.
+
+    The rasters are read tile by tile in lockstep, so the values on each row come from the same pixel. With
+    `filter_nodata`, pixels that are nodata or NaN in any of the rasters are left out. Sampling and the
+    memory limit work like in `read_raster_values`.
+
+    Args:
+        layers: Raster layers to read. Their grids should match, see `misc_utils.check_raster_grids`.
+        bands: Band number for each layer. Band 1 of every layer by default.
+    """
+    if bands is None:
+        bands = [1] * len(layers)
+    dtypes = [get_numpy_dtype(layer.dataProvider().dataType(band)) for layer, band in zip(layers, bands)]
+    dtype = np.result_type(*dtypes)
+
+    # The output takes at most half of the memory limit and the tiles of all layers the other half
+    memory_limit = get_memory_limit(max_memory_mb)
+    max_pixels = memory_limit // (2 * dtype.itemsize * len(layers))
+    if sample_size is not None:
+        max_pixels = min(max_pixels, sample_size)
+    size = get_read_size(layers[0], max_pixels)
+    if size != (layers[0].width(), layers[0].height()):
+        logger.info(
+            "Reading %s at %d x %d pixels instead of %d x %d",
+            ", ".join(layer.name() for layer in layers), *size, layers[0].width(), layers[0].height()
+        )
+
+    # Tiles of the same size for all layers, so that they cover the same pixels
+    bytes_per_pixel = sum(layer_dtype.itemsize + 1 for layer_dtype in dtypes)
+    max_block_pixels = max(1, min(MAX_BLOCK_PIXELS, memory_limit // 2 // bytes_per_pixel))
+    iterators = [
+        _iter_tiles(layer, band, size, max_block_pixels, feedback if i == 0 else None)
+        for i, (layer, band) in enumerate(zip(layers, bands))
+    ]
+    values = np.empty((size[0] * size[1], len(layers)), dtype=dtype)
+    n_values = 0
+    for tiles in zip(*iterators):
+        if filter_nodata:
+            valid = np.logical_and.reduce([tile_valid for _, tile_valid in tiles])
+            columns: List[np.ndarray] = [array[valid] for array, _ in tiles]
+        else:
+            columns = [array.ravel() for array, _ in tiles]
+        n_tile_values = columns[0].size
+        for i, column in enumerate(columns):
+            values[n_values:n_values + n_tile_values, i] = column
+        n_values += n_tile_values
+
+    return values[:n_values]
@@ -0,0 +1,136 @@
+import logging
+import os
+import uuid
+from typing import Dict, List, Tuple
+
+from osgeo import gdal
+
+from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+
+logger = logging.getLogger(__name__)
+
+
+class EISRasterOutputProfile:
+    """
+    Layout and compression of the GeoTIFF outputs of EIS Toolkit algorithms.
+
+    EIS Toolkit CLI writes plain (striped, uncompressed) GeoTIFFs and has no option for creation options,
+    so a selected profile is applied to the raster outputs after the run by rewriting them with GDAL.
+    Tiled and compressed outputs are smaller on disk and faster to pan and to read by windows, which
+    also speeds up the EDA raster readers. Outputs that already match the profile are left as they are.
+
+    A static class that does not need instantiation, i.e. it should be used like this: \n
+    `EISRasterOutputProfile.apply(output_path)`
+    """
+
+    DEFAULT = "default"
+
+    # Profile name -> label in settings
+    PROFILES = {
+        DEFAULT: "Plain GeoTIFF (as written by EIS Toolkit)",
+        "tiled_deflate": "Tiled GeoTIFF, DEFLATE compression",
+        "tiled_zstd": "Tiled GeoTIFF, ZSTD compression",
+        "cog": "Cloud Optimized GeoTIFF (COG)",
+    }
+
+    BLOCK_SIZE = 256
+    GEOTIFF_EXTENSIONS = (".tif", ".tiff")
+
+
+    @classmethod
+    def get_profile(cls) -> str:
+        profile = EISSettingsManager.get_raster_output_profile()
+        return profile if profile in cls.PROFILES else cls.DEFAULT
+
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.get_profile() != cls.DEFAULT
+
+
+    @staticmethod
+    def _get_compression(driver_name: str, profile: str) -> str:
+        """Returns the compression of the profile, DEFLATE if GDAL was built without ZSTD."""
+        if profile != "tiled_zstd":
+            return "DEFLATE"
+        option_list = gdal.GetDriverByName(driver_name).GetMetadataItem("DMD_CREATIONOPTIONLIST") or ""
+        return "ZSTD" if "ZSTD" in option_list else "DEFLATE"
+
+
+    @classmethod
+    def _get_creation_options(cls, dataset: gdal.Dataset, profile: str) -> Tuple[str, List[str]]:
+        """Returns the driver name and creation options of the profile for the dataset."""
+        data_type = dataset.GetRasterBand(1).DataType
+        is_float = data_type in (gdal.GDT_Float32, gdal.GDT_Float64)
+        # Neither the horizontal nor the floating point predictor supports complex data types
+        predictor_options = [] if gdal.DataTypeIsComplex(data_type) else [f"PREDICTOR={3 if is_float else 2}"]
+
+        if profile == "cog" and gdal.GetDriverByName("COG") is not None:
+            return "COG", [
+                "COMPRESS=DEFLATE", *predictor_options, f"BLOCKSIZE={cls.BLOCK_SIZE}", "BIGTIFF=IF_SAFER"
+            ]
+        # COG driver needs GDAL 3.1, older versions get a tiled GeoTIFF instead
+        compression = cls._get_compression("GTiff", profile)
+        return "GTiff", [
+            "TILED=YES",
+            f"BLOCKXSIZE={cls.BLOCK_SIZE}",
+            f"BLOCKYSIZE={cls.BLOCK_SIZE}",
+            f"COMPRESS={compression}",
+            *predictor_options,
+            "BIGTIFF=IF_SAFER",
+        ]
+
+
+    @classmethod
+    def _matches_profile(cls, dataset: gdal.Dataset, profile: str) -> bool:
+        """Whether the dataset is already tiled and compressed (and a COG, for the COG profile)."""
+        image_structure: Dict[str, str] = dataset.GetMetadata("IMAGE_STRUCTURE") or {}
+        if profile == "cog":
+            return image_structure.get("LAYOUT", "").upper() == "COG"
+        block_width, _ = dataset.GetRasterBand(1).GetBlockSize()
+        # A raster at most one tile wide is read by whole rows in any layout (and GDAL reports the full tile
+        # width for it if tiled), so it only needs to be compressed
+        is_tiled = block_width < dataset.RasterXSize or dataset.RasterXSize <= cls.BLOCK_SIZE
+        return is_tiled and image_structure.get("COMPRESSION") is not None
+
+
+    @classmethod
+    def apply(cls, path: str) -> bool:
+        """
+        Rewrites a GeoTIFF output with the selected profile.
+
+        Returns:
+            True if the file was rewritten.
+        """
+        profile = cls.get_profile()
+        if profile == cls.DEFAULT or not path.lower().endswith(cls.GEOTIFF_EXTENSIONS) or not os.path.isfile(path):
+            return False
+
+        dataset = gdal.Open(path)
+        if dataset is None or cls._matches_profile(dataset, profile):
+            return False
+
+        tmp_path = os.path.join(os.path.dirname(path), f".{uuid.uuid4().hex[:8]}-{os.path.basename(path)}")
+        driver_name, creation_options = cls._get_creation_options(dataset, profile)
+        translated = gdal.Translate(tmp_path, dataset, format=driver_name, creationOptions=creation_options)
+        succeeded = translated is not None
+        # Closing the datasets writes the output and releases the input, so that it can be replaced
+        translated = dataset = None
+        try:
+            if succeeded:
+                os.replace(tmp_path, path)
+                return True
+            logger.error("Failed to apply raster output profile %s to %s: %s", profile, path, gdal.GetLastErrorMsg())
+        except OSError as e:
+            logger.error("Failed to apply raster output profile %s to %s: %s", profile, path, e)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+    @classmethod
+    def apply_all(cls, paths: List[str]) -> int:
+        """Applies the selected profile to the given outputs. Returns the number of rewritten files."""
+        if not cls.is_enabled():
+            return 0
+        return sum(cls.apply(path) for path in paths)
@@ -0,0 +1,122 @@
+import logging
+import os
+from typing import List
+
+from osgeo import gdal
+from qgis.core import QgsApplication, QgsLayerTreeLayer, QgsProject, QgsRasterLayer, QgsTask
+from qgis.gui import QgsLayerTreeViewIndicator
+from qgis.utils import iface
+
+from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+
+logger = logging.getLogger(__name__)
+
+OVERVIEWS_PROPERTY = "eis_qgis_plugin/overviews"  # Custom property set to "built" on optimized layers
+MIN_OVERVIEW_SIZE = 256  # Pixels, the coarsest overview is the first one smaller than this
+
+_tasks: List[QgsTask] = []  # Running tasks, QgsTaskManager does not keep Python objects alive
+
+
+def get_overview_levels(width: int, height: int) -> List[int]:
+    """Returns overview decimation factors 2, 4, 8, ... until the overview is smaller than MIN_OVERVIEW_SIZE."""
+    levels = []
+    level = 2
+    while max(width, height) / (level / 2) > MIN_OVERVIEW_SIZE:
+        levels.append(level)
+        level *= 2
+    return levels
+
+
+class EISOverviewBuildTask(QgsTask):
+    """
+    Builds external overviews (.ovr) of an output raster in the background.
+
+    The raster is opened read-only, so the overviews go to a sidecar file and the raster itself is not
+    modified while QGIS renders it. Integer rasters, typically classified or binary outputs, are resampled
+    with the nearest value and other rasters with the average. When the task finishes, the layer is
+    reloaded to use the overviews and marked as optimized in the layer tree.
+    """
+
+    def __init__(self, layer: QgsRasterLayer) -> None:
+        super().__init__(f"Building overviews for {layer.name()}", QgsTask.CanCancel)
+        self.layer_id = layer.id()
+        self.path = layer.source().split("|")[0]
+        self.error = None
+
+
+    def run(self) -> bool:
+        dataset = gdal.Open(self.path, gdal.GA_ReadOnly)
+        if dataset is None:
+            self.error = gdal.GetLastErrorMsg()
+            return False
+        band = dataset.GetRasterBand(1)
+        if band.GetOverviewCount() > 0:
+            return True  # Written with overviews already, e.g. a COG
+
+        levels = get_overview_levels(dataset.RasterXSize, dataset.RasterYSize)
+        resampling = "AVERAGE" if band.DataType in (gdal.GDT_Float32, gdal.GDT_Float64) else "NEAREST"
+
+        def on_progress(complete: float, message, data) -> int:
+            self.setProgress(complete * 100)
+            return 0 if self.isCanceled() else 1
+
+        result = dataset.BuildOverviews(resampling, levels, callback=on_progress)
+        dataset = None
+        if result != 0:
+            self.error = gdal.GetLastErrorMsg()
+            if os.path.exists(self.path + ".ovr"):
+                os.remove(self.path + ".ovr")  # Partial overviews after cancel or failure
+            return False
+        return True
+
+
+    def finished(self, result: bool):
+        if self in _tasks:
+            _tasks.remove(self)
+        layer = QgsProject.instance().mapLayer(self.layer_id)
+        if not result:
+            if not self.isCanceled():
+                logger.warning("Failed to build overviews for %s: %s", self.path, self.error)
+            return
+        if layer is None:
+            return  # Removed from the project meanwhile
+
+        layer.dataProvider().reloadData()
+        layer.setCustomProperty(OVERVIEWS_PROPERTY, "built")
+        layer.triggerRepaint()
+        _add_optimized_indicator(layer)
+
+
+def _add_optimized_indicator(layer: QgsRasterLayer):
+    """Shows an icon next to the layer in the layer tree telling that overviews have been built."""
+    if iface is None:
+        return
+    node = QgsProject.instance().layerTreeRoot().findLayer(layer.id())
+    view = iface.layerTreeView()
+    if not isinstance(node, QgsLayerTreeLayer) or view is None:
+        return
+    indicator = QgsLayerTreeViewIndicator(view)
+    indicator.setIcon(QgsApplication.getThemeIcon("/propertyicons/pyramids.svg"))
+    indicator.setToolTip("Optimized: overviews built by EIS QGIS plugin")
+    view.addIndicator(node, indicator)
+
+
+def build_overviews_in_background(layer: QgsRasterLayer) -> bool:
+    """
+    Starts building overviews for an output raster layer, if enabled in settings and the raster is
+    larger than the size threshold.
+
+    Returns:
+        True if a task was started.
+    """
+    if not EISSettingsManager.get_overview_selection() or not layer.isValid():
+        return False
+    if layer.providerType() != "gdal" or layer.customProperty(OVERVIEWS_PROPERTY) == "built":
+        return False
+    if layer.width() * layer.height() < EISSettingsManager.get_overview_threshold() * 1_000_000:
+        return False
+
+    task = EISOverviewBuildTask(layer)
+    _tasks.append(task)
+    QgsApplication.taskManager().addTask(task)
+    return True
@@ -0,0 +1,142 @@
+import logging
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+from osgeo import gdal
+from qgis.core import (
+    QgsApplication,
+    QgsProject,
+    QgsRasterBandStats,
+    QgsRasterLayer,
+    QgsRectangle,
+    QgsSingleBandPseudoColorRenderer,
+    QgsTask,
+)
+
+from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+
+logger = logging.getLogger(__name__)
+
+APPROXIMATE_SAMPLE_SIZE = 250_000  # Pixels read at most for approximate statistics
+STRIP_PIXELS = 4 * 1024 * 1024  # Pixels read at once for the exact range
+RANGE_PROPERTY = "eis_qgis_plugin/color_ramp_range"  # "approximate" or "exact", set on styled layers
+
+_tasks: List[QgsTask] = []  # Running tasks, QgsTaskManager does not keep Python objects alive
+
+
+def get_reported_range(results: Optional[dict], path: str) -> Optional[Tuple[float, float]]:
+    """Returns the value range of an output raster reported by EIS Toolkit in the results, if any."""
+    if not results:
+        return None
+    value_range = results.get("output_raster_ranges", {}).get(path)
+    return tuple(value_range) if value_range is not None else None
+
+
+def get_approximate_range(layer: QgsRasterLayer, band: int = 1) -> Tuple[float, float]:
+    """
+    Returns the minimum and maximum of a raster band without reading the whole raster.
+
+    Statistics already computed for the full raster are used if the provider has them. Otherwise the
+    band is read at a reduced resolution of at most APPROXIMATE_SAMPLE_SIZE pixels, which GDAL serves
+    from overviews when the raster has them. Extreme values of single pixels can be missed.
+    """
+    provider = layer.dataProvider()
+    stats_flags = QgsRasterBandStats.Min | QgsRasterBandStats.Max
+    if provider.hasStatistics(band, stats_flags, QgsRectangle(), 0):
+        stats = provider.bandStatistics(band, stats_flags)
+    else:
+        stats = provider.bandStatistics(band, stats_flags, QgsRectangle(), APPROXIMATE_SAMPLE_SIZE)
+    return stats.minimumValue, stats.maximumValue
+
+
+class EISExactRangeTask(QgsTask):
+    """
+    Computes the exact minimum and maximum of an output raster in the background and updates the
+    colour ramp of its layer, which was styled with an approximate range.
+    """
+
+    def __init__(self, layer: QgsRasterLayer, band: int = 1) -> None:
+        super().__init__(f"Computing statistics for {layer.name()}", QgsTask.CanCancel)
+        self.layer_id = layer.id()
+        self.path = layer.source().split("|")[0]
+        self.band = band
+        self.value_range = None
+        self.error = None
+
+
+    def run(self) -> bool:
+        # Read in strips instead of band.ComputeStatistics, which would write the statistics to an .aux.xml
+        # file next to the output raster
+        dataset = gdal.Open(self.path, gdal.GA_ReadOnly)
+        if dataset is None:
+            self.error = gdal.GetLastErrorMsg()
+            return False
+        band = dataset.GetRasterBand(self.band)
+        nodata = band.GetNoDataValue()
+        width, height = band.XSize, band.YSize
+        strip_height = max(1, min(height, STRIP_PIXELS // max(width, 1)))
+
+        minimum, maximum = math.inf, -math.inf
+        for row in range(0, height, strip_height):
+            if self.isCanceled():
+                return False
+            values = band.ReadAsArray(0, row, width, min(strip_height, height - row))
+            if values is None:
+                self.error = gdal.GetLastErrorMsg()
+                return False
+            if np.iscomplexobj(values):
+                values = np.abs(values)
+            valid = np.isfinite(values) if np.issubdtype(values.dtype, np.inexact) else np.ones(values.shape, bool)
+            if nodata is not None and not math.isnan(nodata):
+                valid &= values != nodata
+            if valid.any():
+                minimum = min(minimum, float(values[valid].min()))
+                maximum = max(maximum, float(values[valid].max()))
+            self.setProgress(100 * min(row + strip_height, height) / height)
+        dataset = None
+
+        if minimum > maximum:
+            self.error = "The raster has no valid pixels."
+            return False
+        self.value_range = (minimum, maximum)
+        return True
+
+
+    def finished(self, result: bool):
+        if self in _tasks:
+            _tasks.remove(self)
+        if not result:
+            if not self.isCanceled():
+                logger.warning("Failed to compute statistics for %s: %s", self.path, self.error)
+            return
+
+        layer = QgsProject.instance().mapLayer(self.layer_id)
+        # Skip layers removed meanwhile or restyled by the user
+        if layer is None or layer.customProperty(RANGE_PROPERTY) != "approximate":
+            return
+        renderer = layer.renderer()
+        if not isinstance(renderer, QgsSingleBandPseudoColorRenderer) or renderer.shader() is None:
+            return
+
+        shader_function = renderer.shader().rasterShaderFunction()
+        shader_function.setMinimumValue(self.value_range[0])
+        shader_function.setMaximumValue(self.value_range[1])
+        shader_function.classifyColorRamp()
+        layer.setCustomProperty(RANGE_PROPERTY, "exact")
+        layer.triggerRepaint()
+
+
+def refine_range_in_background(layer: QgsRasterLayer) -> bool:
+    """
+    Starts computing the exact range for a layer styled with an approximate range, if enabled in settings.
+
+    Returns:
+        True if a task was started.
+    """
+    if not EISSettingsManager.get_exact_statistics_selection() or layer.providerType() != "gdal":
+        return False
+    task = EISExactRangeTask(layer)
+    _tasks.append(task)
+    QgsApplication.taskManager().addTask(task)
+    return True
@@ -0,0 +1,284 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from qgis.core import QgsApplication
+
+from eis_qgis_plugin.utils.file_groups import get_file_group
+from eis_qgis_plugin.utils.raster_output_profile import EISRasterOutputProfile
+from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+
+logger = logging.getLogger(__name__)
+
+
+class EISResultCache:
+    """
+    Content-addressed cache of EIS Toolkit algorithm outputs.
+
+    An entry is keyed by the algorithm name, its CLI arguments with the output paths replaced by
+    placeholders, the active EIS Toolkit environment, the raster output profile and the size and
+    modification time of every input file (optionally also a hash of their content). On a hit the stored
+    outputs are hard linked, or copied if linking is not possible, to the requested output paths, and the
+    output paths of the cached run in its results are replaced with the requested ones.
+
+    Entries are evicted in least recently used order when the cache grows over the size quota. An
+    entry whose files have been modified after storing (for example through a hard link) is discarded.
+
+    A static class that does not need instantiation, i.e. it should be used like this: \n
+    `results = EISResultCache.restore(key, output_paths)`
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    HASH_CHUNK_SIZE = 1024 * 1024
+    MTIME_TOLERANCE = 1  # Seconds, coarse file system timestamps can be rounded down
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_cache_directory() -> str:
+        cache_dir = os.path.join(QgsApplication.qgisSettingsDirPath(), "eis_plugin_user_data", "result_cache")
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        return cache_dir
+
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        return os.path.normcase(os.path.normpath(path))
+
+
+    @classmethod
+    def _rewrite_paths(cls, value: Any, path_mapping: Dict[str, str]) -> Any:
+        """Replaces the paths of the cached run in results (values, dictionary keys and lists) with new paths."""
+        if isinstance(value, str):
+            return path_mapping.get(cls._normalize_path(value), value) if value else value
+        if isinstance(value, dict):
+            return {
+                cls._rewrite_paths(key, path_mapping): cls._rewrite_paths(item, path_mapping)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [cls._rewrite_paths(item, path_mapping) for item in value]
+        return value
+
+
+    @classmethod
+    def _hash_file(cls, path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(cls.HASH_CHUNK_SIZE), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+
+    @staticmethod
+    def _get_environment_id() -> str:
+        env_type = EISSettingsManager.get_environment_selection()
+        if env_type == "venv":
+            return f"venv:{EISSettingsManager.get_venv_directory()}"
+        return f"docker:{EISSettingsManager.get_docker_image_name()}"
+
+
+    @classmethod
+    def make_key(
+        cls,
+        alg_name: str,
+        cli_args: List[str],
+        output_paths: Dict[str, str],
+        input_files: List[str]
+    ) -> str:
+        """
+        Creates the cache key of an algorithm run.
+
+        Args:
+            alg_name: Name of the processing algorithm.
+            cli_args: Typer arguments and options of the run.
+            output_paths: Output parameter names mapped to output file paths.
+            input_files: Paths of all input files of the run.
+
+        Returns:
+            Hex digest identifying the run.
+        """
+        placeholders = {path: f"<output:{name}>" for name, path in output_paths.items()}
+        inputs = []
+        for input_file in sorted(set(input_files)):
+            for path in get_file_group(input_file):
+                stat = os.stat(path)
+                fingerprint = [os.path.normcase(os.path.abspath(path)), stat.st_size, stat.st_mtime_ns]
+                if EISSettingsManager.get_result_cache_hash_selection():
+                    fingerprint.append(cls._hash_file(path))
+                inputs.append(fingerprint)
+
+        key_data = {
+            "algorithm": alg_name,
+            "environment": cls._get_environment_id(),
+            "arguments": [placeholders.get(arg, arg) for arg in cli_args],
+            "inputs": inputs,
+            # Outputs are stored after the raster output profile has been applied to them
+            "raster_output_profile": EISRasterOutputProfile.get_profile(),
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+    @staticmethod
+    def _link_or_copy(source: str, destination: str):
+        if os.path.lexists(destination):
+            os.remove(destination)
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+
+
+    @classmethod
+    def restore(cls, key: str, output_paths: Dict[str, str]) -> Optional[dict]:
+        """
+        Restores the outputs of a cached run to the given output paths.
+
+        Returns:
+            Results of the cached run or None if there is no valid entry for the key.
+        """
+        entry_dir = os.path.join(cls.get_cache_directory(), key)
+        manifest_path = os.path.join(entry_dir, cls.MANIFEST_FILE)
+        with cls._lock:
+            try:
+                with open(manifest_path, "r") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                return None
+
+            outputs = manifest["outputs"]
+            if set(outputs.keys()) != set(output_paths.keys()):
+                return None
+
+            for output in outputs.values():
+                for name, (size, mtime_ns) in output["files"].items():
+                    path = os.path.join(entry_dir, output["param"], name)
+                    stat = os.stat(path) if os.path.isfile(path) else None
+                    if stat is None or stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                        logger.warning("Cached result %s has been modified, discarding it", key)
+                        shutil.rmtree(entry_dir, ignore_errors=True)
+                        return None
+
+            path_mapping = {}  # Normalized output paths of the cached run -> restored paths
+            try:
+                for param_name, output_path in output_paths.items():
+                    output = outputs[param_name]
+                    stored_stem = os.path.splitext(output["file"])[0]
+                    stored_dir = os.path.dirname(output.get("path", ""))
+                    output_dir, output_file_name = os.path.split(output_path)
+                    output_stem = os.path.splitext(output_file_name)[0]
+                    if output_dir and not os.path.exists(output_dir):
+                        os.makedirs(output_dir)
+                    for name in output["files"]:
+                        restored_path = os.path.join(output_dir, output_stem + name[len(stored_stem):])
+                        cls._link_or_copy(os.path.join(entry_dir, output["param"], name), restored_path)
+                        if "path" in output:
+                            path_mapping[cls._normalize_path(os.path.join(stored_dir, name))] = restored_path
+            except OSError as e:
+                logger.error("Failed to restore cached result %s: %s", key, e)
+                return None
+
+            os.utime(manifest_path)  # Mark as recently used
+            return cls._rewrite_paths(manifest["results"], path_mapping)
+
+
+    @classmethod
+    def store(cls, key: str, alg_name: str, results: dict, output_paths: Dict[str, str], run_started: float):
+        """
+        Stores the outputs of a finished run.
+
+        Nothing is stored if some output was not written during the run (the run failed) or if the
+        results are not JSON serializable. Runs without output files are not cached, since their success
+        cannot be verified.
+        """
+        if not output_paths:
+            return
+        for output_path in output_paths.values():
+            if not os.path.isfile(output_path) or os.path.getmtime(output_path) < run_started - cls.MTIME_TOLERANCE:
+                return
+        try:
+            results_json = json.loads(json.dumps(results))
+        except (TypeError, ValueError):
+            return
+
+        cache_dir = cls.get_cache_directory()
+        entry_dir = os.path.join(cache_dir, key)
+        tmp_dir = os.path.join(cache_dir, f"{key}.tmp-{uuid.uuid4().hex[:8]}")
+        manifest = {"algorithm": alg_name, "created": time.time(), "results": results_json, "outputs": {}}
+        size = 0
+        try:
+            for param_name, output_path in output_paths.items():
+                param_dir = os.path.join(tmp_dir, param_name)
+                os.makedirs(param_dir)
+                files = {}
+                for path in get_file_group(output_path):
+                    stored_path = os.path.join(param_dir, os.path.basename(path))
+                    cls._link_or_copy(path, stored_path)
+                    stat = os.stat(stored_path)
+                    files[os.path.basename(path)] = [stat.st_size, stat.st_mtime_ns]
+                    size += stat.st_size
+                manifest["outputs"][param_name] = {
+                    "param": param_name, "file": os.path.basename(output_path), "path": output_path, "files": files
+                }
+            manifest["size"] = size
+            with open(os.path.join(tmp_dir, cls.MANIFEST_FILE), "w") as f:
+                json.dump(manifest, f)
+
+            with cls._lock:
+                if os.path.exists(entry_dir):
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                os.rename(tmp_dir, entry_dir)
+                cls._evict(EISSettingsManager.get_result_cache_quota() * 1024 * 1024)
+        except OSError as e:
+            logger.error("Failed to store result of %s to cache: %s", alg_name, e)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+    @classmethod
+    def _get_entries(cls) -> List[tuple]:
+        """Returns (last used, size, entry directory) of all cache entries."""
+        cache_dir = cls.get_cache_directory()
+        entries = []
+        for name in os.listdir(cache_dir):
+            manifest_path = os.path.join(cache_dir, name, cls.MANIFEST_FILE)
+            try:
+                with open(manifest_path, "r") as f:
+                    size = json.load(f).get("size", 0)
+                entries.append((os.path.getmtime(manifest_path), size, os.path.join(cache_dir, name)))
+            except (OSError, ValueError):
+                continue
+        return entries
+
+
+    @classmethod
+    def _evict(cls, quota_bytes: int):
+        entries = sorted(cls._get_entries())
+        total_size = sum(size for _, size, _ in entries)
+        while entries and total_size > quota_bytes:
+            _, size, entry_dir = entries.pop(0)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+
+
+    @classmethod
+    def get_size(cls) -> int:
+        """Returns the total size of the cache in bytes."""
+        with cls._lock:
+            return sum(size for _, size, _ in cls._get_entries())
+
+
+    @classmethod
+    def clear(cls):
+        """Removes all cache entries."""
+        with cls._lock:
+            cache_dir = cls.get_cache_directory()
+            for name in os.listdir(cache_dir):
+                shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
@@ -0,0 +1,155 @@
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+from qgis.core import QgsApplication
+
+logger = logging.getLogger(__name__)
+
+
+class EISRunLog:
+    """
+    Local SQLite log of EIS Toolkit algorithm runs.
+
+    Every run is stored with the algorithm, the size of its inputs, its wall time split into phases,
+    the exit code and the peak memory and CPU time of the toolkit process. The log is used to find out which
+    algorithms dominate the processing time.
+
+    Phase times are derived from the progress messages of EIS Toolkit: spawn time lasts until the
+    first output line (process start and imports), read time until "Input files read", compute time
+    until "Algorithm run succesfully" and write time until "Output file(s) saved". A phase is None
+    if its message was not seen.
+
+    A static class that does not need instantiation, i.e. it should be used like this: \n
+    `EISRunLog.record(algorithm="eis:log_transform", status="success", wall_time=1.2)`
+    """
+
+    DATABASE_FILE = "run_log.sqlite"
+
+    # Column names and SQLite types. Columns added later are appended to existing databases on connect.
+    COLUMN_TYPES = {
+        "started_at": "REAL",
+        "algorithm": "TEXT",
+        "execution_mode": "TEXT",
+        "status": "TEXT",
+        "exit_code": "INTEGER",
+        "input_pixels": "INTEGER",
+        "input_bands": "INTEGER",
+        "input_features": "INTEGER",
+        "wall_time": "REAL",
+        "spawn_time": "REAL",
+        "read_time": "REAL",
+        "compute_time": "REAL",
+        "write_time": "REAL",
+        "peak_memory": "INTEGER",
+        "cpu_time": "REAL",
+    }
+    COLUMNS = list(COLUMN_TYPES.keys())
+
+    @staticmethod
+    def get_database_path() -> str:
+        user_data_dir = os.path.join(QgsApplication.qgisSettingsDirPath(), "eis_plugin_user_data")
+        if not os.path.exists(user_data_dir):
+            os.makedirs(user_data_dir)
+        return os.path.join(user_data_dir, EISRunLog.DATABASE_FILE)
+
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        # Runs are recorded from worker threads, so every call uses its own connection
+        connection = sqlite3.connect(cls.get_database_path(), timeout=5)
+        connection.row_factory = sqlite3.Row
+        column_definitions = ", ".join(f"{name} {sql_type}" for name, sql_type in cls.COLUMN_TYPES.items())
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY AUTOINCREMENT, {column_definitions})"
+        )
+        existing_columns = {row["name"] for row in connection.execute("PRAGMA table_info(runs)")}
+        for name, sql_type in cls.COLUMN_TYPES.items():
+            if name not in existing_columns:
+                connection.execute(f"ALTER TABLE runs ADD COLUMN {name} {sql_type}")
+        return connection
+
+
+    @classmethod
+    def record(cls, **fields: Any):
+        """
+        Stores one run. Unknown fields are ignored and missing fields are stored as NULL.
+
+        Failing to write the log never fails the run itself, errors are only logged.
+        """
+        values = [fields.get(column) for column in cls.COLUMNS]
+        if values[0] is None:
+            values[0] = time.time()
+        try:
+            connection = cls._connect()
+            with connection:
+                connection.execute(
+                    f"INSERT INTO runs ({', '.join(cls.COLUMNS)}) VALUES ({', '.join('?' * len(cls.COLUMNS))})",
+                    values
+                )
+            connection.close()
+        except sqlite3.Error as e:
+            logger.error("Failed to record algorithm run: %s", e)
+
+
+    @staticmethod
+    def _where(algorithm_filter: str, status: Optional[str]):
+        conditions, parameters = [], []
+        if algorithm_filter:
+            conditions.append("algorithm LIKE ?")
+            parameters.append(f"%{algorithm_filter}%")
+        if status:
+            conditions.append("status = ?")
+            parameters.append(status)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, parameters
+
+
+    @classmethod
+    def get_runs(cls, algorithm_filter: str = "", status: Optional[str] = None, limit: int = 1000) -> List[Dict]:
+        """Returns the latest runs, optionally filtered by algorithm name (substring) and status."""
+        where, parameters = cls._where(algorithm_filter, status)
+        connection = cls._connect()
+        rows = connection.execute(
+            f"SELECT {', '.join(cls.COLUMNS)} FROM runs {where} ORDER BY started_at DESC LIMIT ?",
+            [*parameters, limit]
+        ).fetchall()
+        connection.close()
+        return [dict(row) for row in rows]
+
+
+    @classmethod
+    def get_summary(cls, algorithm_filter: str = "", status: Optional[str] = None) -> List[Dict]:
+        """Returns run count and time statistics per algorithm, the most time consuming algorithm first."""
+        where, parameters = cls._where(algorithm_filter, status)
+        connection = cls._connect()
+        rows = connection.execute(
+            f"""
+            SELECT
+                algorithm,
+                COUNT(*) AS runs,
+                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) AS failed_runs,
+                SUM(wall_time) AS total_time,
+                AVG(wall_time) AS mean_time,
+                MAX(wall_time) AS max_time,
+                AVG(compute_time) AS mean_compute_time,
+                MAX(peak_memory) AS max_peak_memory,
+                AVG(cpu_time) AS mean_cpu_time
+            FROM runs {where}
+            GROUP BY algorithm
+            ORDER BY total_time DESC
+            """,
+            parameters
+        ).fetchall()
+        connection.close()
+        return [dict(row) for row in rows]
+
+
+    @classmethod
+    def clear(cls):
+        connection = cls._connect()
+        with connection:
+            connection.execute("DELETE FROM runs")
+        connection.close()
@@ -75,6 +75,24 @@ class EISSettingsManager:
     RASTER_COLOR_RAMP_SETTING = "eis_qgis_plugin/raster_color_ramp_setting"
     COLOR_SETTING = "eis_qgis_plugin/default_color_setting"
     DEFAULT_BASE_RASTER = "eis_qgis_plugin/default_base_raster"
+    PERSISTENT_WORKER_SETTING = "eis_qgis_plugin/persistent_worker_setting"
+    DOCKER_SESSION_SETTING = "eis_qgis_plugin/docker_session_setting"
+    MAX_CONCURRENT_JOBS_SETTING = "eis_qgis_plugin/max_concurrent_jobs_setting"
+    RESULT_CACHE_SETTING = "eis_qgis_plugin/result_cache_setting"
+    RESULT_CACHE_HASH_SETTING = "eis_qgis_plugin/result_cache_hash_setting"
+    RESULT_CACHE_QUOTA_SETTING = "eis_qgis_plugin/result_cache_quota_setting"
+    TOOLKIT_VERIFICATION_CACHE_SETTING = "eis_qgis_plugin/toolkit_verification_cache_setting"
+    RUN_LOG_SETTING = "eis_qgis_plugin/run_log_setting"
+    MEMORY_LIMIT_SETTING = "eis_qgis_plugin/memory_limit_setting"
+    THREAD_BUDGET_SETTING = "eis_qgis_plugin/thread_budget_setting"
+    PREWARM_SETTING = "eis_qgis_plugin/prewarm_setting"
+    TEMP_OUTPUT_QUOTA_SETTING = "eis_qgis_plugin/temp_output_quota_setting"
+    RASTER_OUTPUT_PROFILE_SETTING = "eis_qgis_plugin/raster_output_profile_setting"
+    OVERVIEW_SETTING = "eis_qgis_plugin/overview_setting"
+    OVERVIEW_THRESHOLD_SETTING = "eis_qgis_plugin/overview_threshold_setting"
+    EXACT_STATISTICS_SETTING = "eis_qgis_plugin/exact_statistics_setting"
+    RASTER_READ_MEMORY_SETTING = "eis_qgis_plugin/raster_read_memory_setting"
+    TEMP_OUTPUT_EVICTION_SETTING = "eis_qgis_plugin/temp_output_eviction_setting"
 
     DEFAULTS = {
         ENVIRONMENT_SELECTION_SETTING: "venv",
@@ -90,7 +108,25 @@ class EISSettingsManager:
         CONTINUOUS_PALETTE_SETTING: "viridis",
         RASTER_COLOR_RAMP_SETTING: default_ramp(),
         COLOR_SETTING: QColor(72, 172, 50),
-        DEFAULT_BASE_RASTER: None
+        DEFAULT_BASE_RASTER: None,
+        PERSISTENT_WORKER_SETTING: "false",
+        DOCKER_SESSION_SETTING: "false",
+        MAX_CONCURRENT_JOBS_SETTING: "2",
+        RESULT_CACHE_SETTING: "false",
+        RESULT_CACHE_HASH_SETTING: "false",
+        RESULT_CACHE_QUOTA_SETTING: "2048",
+        TOOLKIT_VERIFICATION_CACHE_SETTING: "{}",
+        RUN_LOG_SETTING: "true",
+        MEMORY_LIMIT_SETTING: "0",
+        THREAD_BUDGET_SETTING: "0",
+        PREWARM_SETTING: "true",
+        TEMP_OUTPUT_QUOTA_SETTING: "10240",
+        RASTER_OUTPUT_PROFILE_SETTING: "default",
+        OVERVIEW_SETTING: "false",
+        OVERVIEW_THRESHOLD_SETTING: "25",
+        EXACT_STATISTICS_SETTING: "false",
+        RASTER_READ_MEMORY_SETTING: "256",
+        TEMP_OUTPUT_EVICTION_SETTING: "false",
     }
 
 
@@ -187,6 +223,99 @@ class EISSettingsManager:
                 return layer
         return None
 
+    @classmethod
+    def get_persistent_worker_selection(self) -> bool:
+        key = self.PERSISTENT_WORKER_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
+    @classmethod
+    def get_docker_session_selection(self) -> bool:
+        key = self.DOCKER_SESSION_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
+    @classmethod
+    def get_max_concurrent_jobs(self) -> int:
+        key = self.MAX_CONCURRENT_JOBS_SETTING
+        return int(QgsSettings().value(key, self.DEFAULTS[key]))
+
+    @classmethod
+    def get_result_cache_selection(self) -> bool:
+        key = self.RESULT_CACHE_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
+    @classmethod
+    def get_result_cache_hash_selection(self) -> bool:
+        key = self.RESULT_CACHE_HASH_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
+    @classmethod
+    def get_result_cache_quota(self) -> int:
+        key = self.RESULT_CACHE_QUOTA_SETTING
+        return int(QgsSettings().value(key, self.DEFAULTS[key]))
+
+    @classmethod
+    def get_toolkit_verification_cache(self) -> dict:
+        key = self.TOOLKIT_VERIFICATION_CACHE_SETTING
+        try:
+            return json.loads(QgsSettings().value(key, self.DEFAULTS[key]))
+        except ValueError:
+            return {}
+
+    @classmethod
+    def get_run_log_selection(self) -> bool:
+        key = self.RUN_LOG_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
+    @classmethod
+    def get_memory_limit(self) -> int:
+        key = self.MEMORY_LIMIT_SETTING
+        return int(QgsSettings().value(key, self.DEFAULTS[key]))
+
+    @classmethod
+    def get_thread_budget(self) -> int:
+        key = self.THREAD_BUDGET_SETTING
+        return int(QgsSettings().value(key, self.DEFAULTS[key]))
+
+    @classmethod
+    def get_prewarm_selection(self) -> bool:
+        key = self.PREWARM_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
+    @classmethod
+    def get_temp_output_quota(self) -> int:
+        key = self.TEMP_OUTPUT_QUOTA_SETTING
+        return int(QgsSettings().value(key, self.DEFAULTS[key]))
+
+    @classmethod
+    def get_raster_output_profile(self) -> str:
+        key = self.RASTER_OUTPUT_PROFILE_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key])
+
+    @classmethod
+    def get_overview_selection(self) -> bool:
+        key = self.OVERVIEW_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
+    @classmethod
+    def get_overview_threshold(self) -> int:
+        key = self.OVERVIEW_THRESHOLD_SETTING
+        return int(QgsSettings().value(key, self.DEFAULTS[key]))
+
+    @classmethod
+    def get_exact_statistics_selection(self) -> bool:
+        key = self.EXACT_STATISTICS_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
+    @classmethod
+    def get_raster_read_memory(self) -> int:
+        key = self.RASTER_READ_MEMORY_SETTING
+        return int(QgsSettings().value(key, self.DEFAULTS[key]))
+
+    @classmethod
+    def get_temp_output_eviction_selection(self) -> bool:
+        key = self.TEMP_OUTPUT_EVICTION_SETTING
+        return QgsSettings().value(key, self.DEFAULTS[key]).lower() == "true"
+
 
     # SETTERS
     @classmethod
@@ -251,6 +380,78 @@ class EISSettingsManager:
         else:
             QgsSettings().setValue(self.DEFAULT_BASE_RASTER, self.DEFAULTS[self.DEFAULT_BASE_RASTER])
 
+    @classmethod
+    def set_persistent_worker_selection(self, selection: bool):
+        QgsSettings().setValue(self.PERSISTENT_WORKER_SETTING, "true" if selection else "false")
+
+    @classmethod
+    def set_docker_session_selection(self, selection: bool):
+        QgsSettings().setValue(self.DOCKER_SESSION_SETTING, "true" if selection else "false")
+
+    @classmethod
+    def set_max_concurrent_jobs(self, value: int):
+        QgsSettings().setValue(self.MAX_CONCURRENT_JOBS_SETTING, value)
+
+    @classmethod
+    def set_result_cache_selection(self, selection: bool):
+        QgsSettings().setValue(self.RESULT_CACHE_SETTING, "true" if selection else "false")
+
+    @classmethod
+    def set_result_cache_hash_selection(self, selection: bool):
+        QgsSettings().setValue(self.RESULT_CACHE_HASH_SETTING, "true" if selection else "false")
+
+    @classmethod
+    def set_result_cache_quota(self, value: int):
+        QgsSettings().setValue(self.RESULT_CACHE_QUOTA_SETTING, value)
+
+    @classmethod
+    def set_toolkit_verification_cache(self, cache: dict):
+        QgsSettings().setValue(self.TOOLKIT_VERIFICATION_CACHE_SETTING, json.dumps(cache))
+
+    @classmethod
+    def set_run_log_selection(self, selection: bool):
+        QgsSettings().setValue(self.RUN_LOG_SETTING, "true" if selection else "false")
+
+    @classmethod
+    def set_memory_limit(self, value: int):
+        QgsSettings().setValue(self.MEMORY_LIMIT_SETTING, value)
+
+    @classmethod
+    def set_thread_budget(self, value: int):
+        QgsSettings().setValue(self.THREAD_BUDGET_SETTING, value)
+
+    @classmethod
+    def set_prewarm_selection(self, selection: bool):
+        QgsSettings().setValue(self.PREWARM_SETTING, "true" if selection else "false")
+
+    @classmethod
+    def set_temp_output_quota(self, value: int):
+        QgsSettings().setValue(self.TEMP_OUTPUT_QUOTA_SETTING, value)
+
+    @classmethod
+    def set_raster_output_profile(self, value: str):
+        QgsSettings().setValue(self.RASTER_OUTPUT_PROFILE_SETTING, value)
+
+    @classmethod
+    def set_overview_selection(self, selection: bool):
+        QgsSettings().setValue(self.OVERVIEW_SETTING, "true" if selection else "false")
+
+    @classmethod
+    def set_overview_threshold(self, value: int):
+        QgsSettings().setValue(self.OVERVIEW_THRESHOLD_SETTING, value)
+
+    @classmethod
+    def set_exact_statistics_selection(self, selection: bool):
+        QgsSettings().setValue(self.EXACT_STATISTICS_SETTING, "true" if selection else "false")
+
+    @classmethod
+    def set_raster_read_memory(self, value: int):
+        QgsSettings().setValue(self.RASTER_READ_MEMORY_SETTING, value)
+
+    @classmethod
+    def set_temp_output_eviction_selection(self, selection: bool):
+        QgsSettings().setValue(self.TEMP_OUTPUT_EVICTION_SETTING, "true" if selection else "false")
+
 
     # RESETS
     @classmethod
@@ -309,6 +510,79 @@ class EISSettingsManager:
     def reset_default_base_raster(self):
         QgsSettings().setValue(self.DEFAULT_BASE_RASTER, self.DEFAULTS[self.DEFAULT_BASE_RASTER])
 
+    @classmethod
+    def reset_persistent_worker_selection(self):
+        QgsSettings().setValue(self.PERSISTENT_WORKER_SETTING, self.DEFAULTS[self.PERSISTENT_WORKER_SETTING])
+
+    @classmethod
+    def reset_docker_session_selection(self):
+        QgsSettings().setValue(self.DOCKER_SESSION_SETTING, self.DEFAULTS[self.DOCKER_SESSION_SETTING])
+
+    @classmethod
+    def reset_max_concurrent_jobs(self):
+        QgsSettings().setValue(self.MAX_CONCURRENT_JOBS_SETTING, self.DEFAULTS[self.MAX_CONCURRENT_JOBS_SETTING])
+
+    @classmethod
+    def reset_result_cache_selection(self):
+        QgsSettings().setValue(self.RESULT_CACHE_SETTING, self.DEFAULTS[self.RESULT_CACHE_SETTING])
+
+    @classmethod
+    def reset_result_cache_hash_selection(self):
+        QgsSettings().setValue(self.RESULT_CACHE_HASH_SETTING, self.DEFAULTS[self.RESULT_CACHE_HASH_SETTING])
+
+    @classmethod
+    def reset_result_cache_quota(self):
+        QgsSettings().setValue(self.RESULT_CACHE_QUOTA_SETTING, self.DEFAULTS[self.RESULT_CACHE_QUOTA_SETTING])
+
+    @classmethod
+    def reset_toolkit_verification_cache(self):
+        key = self.TOOLKIT_VERIFICATION_CACHE_SETTING
+        QgsSettings().setValue(key, self.DEFAULTS[key])
+
+    @classmethod
+    def reset_run_log_selection(self):
+        QgsSettings().setValue(self.RUN_LOG_SETTING, self.DEFAULTS[self.RUN_LOG_SETTING])
+
+    @classmethod
+    def reset_memory_limit(self):
+        QgsSettings().setValue(self.MEMORY_LIMIT_SETTING, self.DEFAULTS[self.MEMORY_LIMIT_SETTING])
+
+    @classmethod
+    def reset_thread_budget(self):
+        QgsSettings().setValue(self.THREAD_BUDGET_SETTING, self.DEFAULTS[self.THREAD_BUDGET_SETTING])
+
+    @classmethod
+    def reset_prewarm_selection(self):
+        QgsSettings().setValue(self.PREWARM_SETTING, self.DEFAULTS[self.PREWARM_SETTING])
+
+    @classmethod
+    def reset_temp_output_quota(self):
+        QgsSettings().setValue(self.TEMP_OUTPUT_QUOTA_SETTING, self.DEFAULTS[self.TEMP_OUTPUT_QUOTA_SETTING])
+
+    @classmethod
+    def reset_raster_output_profile(self):
+        QgsSettings().setValue(self.RASTER_OUTPUT_PROFILE_SETTING, self.DEFAULTS[self.RASTER_OUTPUT_PROFILE_SETTING])
+
+    @classmethod
+    def reset_overview_selection(self):
+        QgsSettings().setValue(self.OVERVIEW_SETTING, self.DEFAULTS[self.OVERVIEW_SETTING])
+
+    @classmethod
+    def reset_overview_threshold(self):
+        QgsSettings().setValue(self.OVERVIEW_THRESHOLD_SETTING, self.DEFAULTS[self.OVERVIEW_THRESHOLD_SETTING])
+
+    @classmethod
+    def reset_exact_statistics_selection(self):
+        QgsSettings().setValue(self.EXACT_STATISTICS_SETTING, self.DEFAULTS[self.EXACT_STATISTICS_SETTING])
+
+    @classmethod
+    def reset_raster_read_memory(self):
+        QgsSettings().setValue(self.RASTER_READ_MEMORY_SETTING, self.DEFAULTS[self.RASTER_READ_MEMORY_SETTING])
+
+    @classmethod
+    def reset_temp_output_eviction_selection(self):
+        QgsSettings().setValue(self.TEMP_OUTPUT_EVICTION_SETTING, self.DEFAULTS[self.TEMP_OUTPUT_EVICTION_SETTING])
+
 
     @classmethod
     def reset_all(self):
@@ -326,3 +600,21 @@ class EISSettingsManager:
         self.reset_continuous_palette_selection()
         self.reset_layer_group_selection()
         self.reset_default_base_raster()
+        self.reset_persistent_worker_selection()
+        self.reset_docker_session_selection()
+        self.reset_max_concurrent_jobs()
+        self.reset_result_cache_selection()
+        self.reset_result_cache_hash_selection()
+        self.reset_result_cache_quota()
+        self.reset_toolkit_verification_cache()
+        self.reset_run_log_selection()
+        self.reset_memory_limit()
+        self.reset_thread_budget()
+        self.reset_prewarm_selection()
+        self.reset_temp_output_quota()
+        self.reset_raster_output_profile()
+        self.reset_overview_selection()
+        self.reset_overview_threshold()
+        self.reset_exact_statistics_selection()
+        self.reset_raster_read_memory()
+        self.reset_temp_output_eviction_selection()
@@ -0,0 +1,300 @@
+"""
+One-pass descriptive statistics over raster tiles and feature batches.
+
+Values are fed to StreamingStatistics in batches (a tile of a raster band or a batch of attribute values),
+so memory use does not depend on the size of the data. Moments are combined with the pairwise update of
+Welford's algorithm (Chan et al., Pébay), which stays accurate for large counts. Quantiles are exact while
+the number of values is at most `exact_limit`, after that they come from a QuantileSketch.
+
+Standard deviation and variance are population values (ddof=0) and skewness is the biased sample skewness,
+like in the descriptive statistics tools of EIS Toolkit.
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from qgis.core import NULL, QgsFeatureRequest, QgsFeedback, QgsRasterLayer, QgsVectorLayer
+
+from eis_qgis_plugin.utils.raster_blocks import iter_raster_blocks
+
+EXACT_QUANTILE_LIMIT = 1_000_000  # Values kept in memory for exact quantiles, 8 MB
+SKETCH_RELATIVE_ACCURACY = 0.005  # Relative error of sketched quantile values
+FEATURE_BATCH_SIZE = 65_536
+
+QUANTILES = {"25%": 0.25, "50%": 0.5, "75%": 0.75}
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with a relative error guarantee (DDSketch, Masson et al. 2019).
+
+    Values are counted in logarithmic buckets, separately for positive and negative values. A quantile
+    is returned as the representative value of the bucket holding its rank, which is within
+    `relative_accuracy` of the exact quantile value. Values closer to zero than `min_indexable` are
+    counted as zeros. The number of buckets grows with the logarithm of the value range only, e.g. about
+    5 000 buckets for values between 1e-6 and 1e6 with the default accuracy.
+    """
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY, min_indexable: float = 1e-12) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.min_indexable = min_indexable
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+
+        self.positive: Dict[int, int] = {}  # Bucket key -> count
+        self.negative: Dict[int, int] = {}  # Bucket key of the absolute value -> count
+        self.zero_count = 0
+        self.count = 0
+
+
+    def _add_to_store(self, store: Dict[int, int], magnitudes: np.ndarray):
+        if magnitudes.size == 0:
+            return
+        keys = np.ceil(np.log(magnitudes) / self.log_gamma).astype(np.int64)
+        offset = int(keys.min())
+        counts = np.bincount(keys - offset)
+        for key in np.flatnonzero(counts).tolist():
+            store[key + offset] = store.get(key + offset, 0) + int(counts[key])
+
+
+    def update(self, values: np.ndarray):
+        """Adds finite values to the sketch."""
+        positive = values[values > self.min_indexable]
+        negative = values[values < -self.min_indexable]
+        self._add_to_store(self.positive, positive)
+        self._add_to_store(self.negative, -negative)
+        self.zero_count += values.size - positive.size - negative.size
+        self.count += values.size
+
+
+    def merge(self, other: "QuantileSketch"):
+        """Adds the counts of another sketch with the same accuracy to this sketch."""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge quantile sketches with different accuracies.")
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Returns the approximate q-quantile (0 <= q <= 1), or None if the sketch is empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+
+        cumulative = 0
+        for key in sorted(self.negative, reverse=True):
+            cumulative += self.negative[key]
+            if cumulative > rank:
+                return -self._bucket_value(key)
+        cumulative += self.zero_count
+        if cumulative > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            cumulative += self.positive[key]
+            if cumulative > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self.positive))
+
+
+class StreamingStatistics:
+    """
+    Descriptive statistics accumulated in one pass over batches of values.
+
+    Statistics of separately processed parts of the data can be combined with `merge`.
+    """
+
+    def __init__(self, exact_limit: int = EXACT_QUANTILE_LIMIT) -> None:
+        """
+        Args:
+            exact_limit: Number of values up to which they are kept for exact quantiles.
+        """
+        self.exact_limit = exact_limit
+
+        self.count = 0
+        self.n_null = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean
+        self._m3 = 0.0  # Sum of cubed deviations from the mean
+
+        self.sketch = QuantileSketch()
+        self._exact_values: Optional[List[np.ndarray]] = []
+
+
+    @property
+    def n_total(self) -> int:
+        return self.count + self.n_null
+
+
+    @property
+    def has_exact_quantiles(self) -> bool:
+        return self._exact_values is not None
+
+
+    def add_nulls(self, n: int):
+        self.n_null += n
+
+
+    def _add_moments(self, n: int, mean: float, m2: float, m3: float):
+        n_a = self.count
+        n_total = n_a + n
+        delta = mean - self.mean
+
+        self._m3 += (
+            m3
+            + delta ** 3 * n_a * n * (n_a - n) / n_total ** 2
+            + 3 * delta * (n_a * m2 - n * self._m2) / n_total
+        )
+        self._m2 += m2 + delta ** 2 * n_a * n / n_total
+        self.mean += delta * n / n_total
+        self.count = n_total
+
+
+    def update(self, values: np.ndarray):
+        """
+        Adds a batch of values. NaN and infinite values are counted as nulls.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        finite = np.isfinite(values)
+        if not finite.all():
+            self.n_null += int(values.size - np.count_nonzero(finite))
+            values = values[finite]
+        if values.size == 0:
+            return
+
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        batch_mean = float(values.mean())
+        deviations = values - batch_mean
+        squared = deviations * deviations
+        self._add_moments(values.size, batch_mean, float(squared.sum()), float((squared * deviations).sum()))
+
+        self.sketch.update(values)
+        if self._exact_values is not None:
+            if self.count <= self.exact_limit:
+                self._exact_values.append(values)
+            else:
+                self._exact_values = None
+
+
+    def merge(self, other: "StreamingStatistics"):
+        """Adds the statistics of another part of the data."""
+        self.n_null += other.n_null
+        if other.count == 0:
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._add_moments(other.count, other.mean, other._m2, other._m3)
+
+        self.sketch.merge(other.sketch)
+        if self._exact_values is not None and other._exact_values is not None and self.count <= self.exact_limit:
+            self._exact_values.extend(other._exact_values)
+        else:
+            self._exact_values = None
+
+
+    def variance(self) -> Optional[float]:
+        return self._m2 / self.count if self.count > 0 else None
+
+
+    def standard_deviation(self) -> Optional[float]:
+        return math.sqrt(self.variance()) if self.count > 0 else None
+
+
+    def skewness(self) -> Optional[float]:
+        if self.count == 0 or self._m2 == 0:
+            return None
+        return math.sqrt(self.count) * self._m3 / self._m2 ** 1.5
+
+
+    def quantiles(self, probabilities: Sequence[float]) -> List[Optional[float]]:
+        """
+        Returns the quantiles, exact (linear interpolation) if the values were kept and approximate otherwise.
+        """
+        if self.count == 0:
+            return [None for _ in probabilities]
+        if self._exact_values is not None:
+            return [float(value) for value in np.quantile(np.concatenate(self._exact_values), probabilities)]
+        # Sketched values can fall slightly outside the data range
+        return [min(max(self.sketch.quantile(q), self.min), self.max) for q in probabilities]
+
+
+    def to_dict(self) -> dict:
+        """
+        Returns the statistics with the keys used by the descriptive statistics tools of EIS Toolkit.
+        """
+        if self.count == 0:
+            return {}
+        standard_deviation = self.standard_deviation()
+        results = {
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "standard_deviation": standard_deviation,
+            "relative_standard_deviation": standard_deviation / self.mean if self.mean != 0 else None,
+            "variance": self.variance(),
+            "skew": self.skewness(),
+        }
+        results.update(zip(QUANTILES.keys(), self.quantiles(list(QUANTILES.values()))))
+        return results
+
+
+def compute_raster_statistics(
+    layer: QgsRasterLayer,
+    band: int = 1,
+    feedback: Optional[QgsFeedback] = None,
+    exact_limit: int = EXACT_QUANTILE_LIMIT,
+) -> StreamingStatistics:
+    """Computes the statistics of a raster band in one pass over its tiles. Nodata pixels are nulls."""
+    statistics = StreamingStatistics(exact_limit)
+    for array, valid in iter_raster_blocks(layer, band, feedback=feedback):
+        statistics.add_nulls(int(valid.size - np.count_nonzero(valid)))
+        statistics.update(array[valid])
+    return statistics
+
+
+def compute_vector_statistics(
+    layer: QgsVectorLayer,
+    field: str,
+    feedback: Optional[QgsFeedback] = None,
+    exact_limit: int = EXACT_QUANTILE_LIMIT,
+) -> StreamingStatistics:
+    """Computes the statistics of a numeric field in one pass over the features. NULL values are nulls."""
+    statistics = StreamingStatistics(exact_limit)
+    request = QgsFeatureRequest()
+    request.setFlags(QgsFeatureRequest.NoGeometry)
+    request.setSubsetOfAttributes([field], layer.fields())
+
+    n_features = max(layer.featureCount(), 1)
+    n_read = 0
+    batch = []
+    for feature in layer.getFeatures(request):
+        value = feature.attribute(field)
+        if value == NULL or value is None:
+            statistics.add_nulls(1)
+        else:
+            batch.append(value)
+        n_read += 1
+
+        if n_read % FEATURE_BATCH_SIZE == 0:
+            statistics.update(np.array(batch, dtype=np.float64))
+            batch = []
+            if feedback is not None:
+                if feedback.isCanceled():
+                    return statistics
+                feedback.setProgress(100 * n_read / n_features)
+
+    statistics.update(np.array(batch, dtype=np.float64))
+    if feedback is not None:
+        feedback.setProgress(100)
+    return statistics
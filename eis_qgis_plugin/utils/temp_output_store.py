@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from qgis.core import QgsApplication, QgsProcessingUtils, QgsProject
+
+from eis_qgis_plugin.utils.file_groups import get_file_group
+from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+
+logger = logging.getLogger(__name__)
+
+
+class EISTempOutputStore:
+    """
+    Keeps track of the temporary outputs of EIS Wizard runs and removes the unused ones.
+
+    Outputs of a finished run that were written to the QGIS processing temp folder (TEMPORARY_OUTPUT)
+    are registered with their size. If automatic removal is enabled in settings and the registered
+    outputs take more space than the quota, outputs that are not the source of any layer in the project
+    and not an input of a queued or running job are deleted in least recently used order. An output counts
+    as used when it is registered and whenever it is found referenced. Files the user saved elsewhere are
+    never touched.
+
+    A static class that does not need instantiation, i.e. it should be used like this: \n
+    `EISTempOutputStore.register(results)`
+    """
+
+    INDEX_FILE = "temp_outputs.json"
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_index_path() -> str:
+        user_data_dir = os.path.join(QgsApplication.qgisSettingsDirPath(), "eis_plugin_user_data")
+        if not os.path.exists(user_data_dir):
+            os.makedirs(user_data_dir)
+        return os.path.join(user_data_dir, EISTempOutputStore.INDEX_FILE)
+
+
+    @classmethod
+    def _load(cls) -> Dict[str, dict]:
+        """Returns registered output paths mapped to their size and last use time."""
+        try:
+            with open(cls.get_index_path(), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+    @classmethod
+    def _save(cls, index: Dict[str, dict]):
+        try:
+            with open(cls.get_index_path(), "w") as f:
+                json.dump(index, f)
+        except OSError as e:
+            logger.error("Failed to save temporary output index: %s", e)
+
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path.split("|")[0]))
+
+
+    @staticmethod
+    def _is_within(path: str, directory: str) -> bool:
+        return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+    @classmethod
+    def _get_size(cls, path: str) -> int:
+        size = 0
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in files:
+                    try:
+                        size += os.path.getsize(os.path.join(root, name))
+                    except OSError:
+                        continue
+            return size
+        for file_path in get_file_group(path):
+            try:
+                size += os.path.getsize(file_path)
+            except OSError:
+                continue
+        return size
+
+
+    @classmethod
+    def _collect_paths(cls, value, temp_folder: str) -> List[str]:
+        """Returns existing paths inside the temp folder found in a result value (also in lists and dicts)."""
+        if isinstance(value, str):
+            if not value or not os.path.isabs(value.split("|")[0]):
+                return []
+            path = cls._normalize(value)
+            return [path] if cls._is_within(path, temp_folder) and os.path.exists(path) else []
+        if isinstance(value, dict):
+            value = list(value.values())
+        if isinstance(value, (list, tuple)):
+            return [path for item in value for path in cls._collect_paths(item, temp_folder)]
+        return []
+
+
+    @classmethod
+    def register(cls, results: dict):
+        """Registers the temporary outputs found in the results of a finished run."""
+        temp_folder = cls._normalize(QgsProcessingUtils.tempFolder())
+        paths = cls._collect_paths(results, temp_folder)
+        if not paths:
+            return
+        now = time.time()
+        with cls._lock:
+            index = cls._load()
+            for path in paths:
+                index[path] = {"size": cls._get_size(path), "last_used": now}
+            cls._save(index)
+
+
+    @classmethod
+    def _get_referenced_paths(cls, protected_values: Iterable) -> Set[str]:
+        """Returns the sources of the layers in the project and the paths in the protected values."""
+        referenced = set()
+        for layer in QgsProject.instance().mapLayers().values():
+            source = layer.source()
+            if source:
+                referenced.add(cls._normalize(source))
+        for value in protected_values:
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if isinstance(item, str) and item and os.path.isabs(item.split("|")[0]):
+                    referenced.add(cls._normalize(item))
+        return referenced
+
+
+    @classmethod
+    def _is_referenced(cls, path: str, referenced: Set[str]) -> bool:
+        if path in referenced:
+            return True
+        # Layers inside an output folder, or sidecar files of an output (e.g. a layer of a GeoPackage)
+        stem = os.path.splitext(path)[0]
+        return any(cls._is_within(source, path) or os.path.splitext(source)[0] == stem for source in referenced)
+
+
+    @classmethod
+    def _remove(cls, path: str, temp_folder: str):
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            for file_path in get_file_group(path):
+                try:
+                    os.remove(file_path)
+                except OSError as e:
+                    logger.warning("Failed to remove temporary output %s: %s", file_path, e)
+        # QGIS creates a folder for each temporary output, remove it too if it was left empty. Folders
+        # in the temp folders of earlier QGIS sessions are left as they are
+        parent = os.path.dirname(path)
+        if parent != temp_folder and cls._is_within(parent, temp_folder):
+            try:
+                os.rmdir(parent)
+            except OSError:
+                pass
+
+
+    @classmethod
+    def enforce_quota(cls, protected_values: Iterable = (), quota_bytes: Optional[int] = None) -> int:
+        """
+        Removes unreferenced outputs in least recently used order until the store fits the quota.
+
+        Args:
+            protected_values: Values (such as parameters of queued and running jobs) whose paths are
+                treated as referenced.
+            quota_bytes: Quota to enforce. If None, the quota from settings is used, and nothing is
+                removed unless automatic removal is enabled in settings.
+
+        Returns:
+            Number of bytes freed.
+        """
+        if quota_bytes is None:
+            if not EISSettingsManager.get_temp_output_eviction_selection():
+                return 0
+            quota_bytes = EISSettingsManager.get_temp_output_quota() * 1024 * 1024
+        temp_folder = cls._normalize(QgsProcessingUtils.tempFolder())
+        referenced = cls._get_referenced_paths(protected_values)
+        now = time.time()
+        freed = 0
+
+        with cls._lock:
+            index = {path: entry for path, entry in cls._load().items() if os.path.exists(path)}
+            for path, entry in index.items():
+                if cls._is_referenced(path, referenced):
+                    entry["last_used"] = now
+
+            total_size = sum(entry["size"] for entry in index.values())
+            candidates = sorted(
+                (entry["last_used"], path) for path, entry in index.items() if not cls._is_referenced(path, referenced)
+            )
+            for _, path in candidates:
+                if total_size <= quota_bytes:
+                    break
+                cls._remove(path, temp_folder)
+                size = index.pop(path)["size"]
+                total_size -= size
+                freed += size
+            cls._save(index)
+
+        if freed:
+            logger.info("Removed %.1f MB of unused temporary outputs", freed / (1024 * 1024))
+        return freed
+
+
+    @classmethod
+    def get_usage(cls) -> Tuple[int, int]:
+        """Returns the total size of the registered outputs and the size of the referenced ones in bytes."""
+        referenced = cls._get_referenced_paths(())
+        with cls._lock:
+            index = {path: entry for path, entry in cls._load().items() if os.path.exists(path)}
+        total_size = sum(entry["size"] for entry in index.values())
+        referenced_size = sum(
+            entry["size"] for path, entry in index.items() if cls._is_referenced(path, referenced)
+        )
+        return total_size, referenced_size
@@ -0,0 +1,92 @@
+"""
+Benchmark of the startup time of the EIS processing provider.
+
+Measures how long registering the provider takes when the algorithms are registered from the algorithm
+manifest (as EISProvider does), compared with importing every algorithm module and registering instances of
+the real algorithms (as the provider did before the manifest). Each measurement runs in a new process, so
+that module imports are not cached between them. Also measures regenerating the manifest, which happens
+once when it is missing or older than the algorithm modules.
+
+Run with the Python of QGIS from the repository root, e.g.
+`python scripts/benchmark_provider_load.py --repeat 5`.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, REPO_ROOT)
+
+MODES = ("eager", "manifest")
+
+
+def measure(mode: str):
+    """Registers the provider in a fresh QGIS application and prints the milliseconds it took."""
+    from qgis.core import QgsApplication
+
+    app = QgsApplication([], False)
+    app.initQgis()
+
+    from eis_qgis_plugin.eis_processing.algorithm_manifest import load_manifest
+    from eis_qgis_plugin.eis_processing.eis_provider import EISProvider, load_algorithm_class
+
+    class EISEagerProvider(EISProvider):
+        """Imports all algorithm modules and registers the real algorithms, like the provider used to."""
+
+        def loadAlgorithms(self) -> None:
+            for entry in load_manifest():
+                self.addAlgorithm(load_algorithm_class(entry)())
+
+    provider = EISEagerProvider() if mode == "eager" else EISProvider()
+    started = time.perf_counter()
+    QgsApplication.processingRegistry().addProvider(provider)
+    elapsed = (time.perf_counter() - started) * 1000
+    n_algorithms = len(provider.algorithms())
+
+    QgsApplication.processingRegistry().removeProvider(provider)
+    app.exitQgis()
+    print(f"{elapsed:.3f} {n_algorithms}")
+
+
+def run_measurement(mode: str):
+    """Runs one measurement in a new process and returns the milliseconds and the number of algorithms."""
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--measure", mode],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    elapsed, n_algorithms = output.strip().splitlines()[-1].split()
+    return float(elapsed), int(n_algorithms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements of each registration mode")
+    parser.add_argument("--measure", choices=MODES, help=argparse.SUPPRESS)  # Used by the child processes
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure)
+        return
+
+    for mode in MODES:
+        measurements = [run_measurement(mode) for _ in range(args.repeat)]
+        times = [elapsed for elapsed, _ in measurements]
+        print(
+            f"{mode:>8}: {measurements[0][1]} algorithms registered in {statistics.median(times):8.1f} ms "
+            f"(median, min {min(times):.1f} ms, {args.repeat} runs)"
+        )
+
+    from eis_qgis_plugin.eis_processing.algorithm_manifest import generate_manifest
+
+    started = time.perf_counter()
+    manifest = generate_manifest()
+    print(f"Regenerating the manifest of {len(manifest)} algorithms: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
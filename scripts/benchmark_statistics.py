@@ -0,0 +1,94 @@
+"""
+Benchmark of the raster statistics of the EDA Statistics tab.
+
+Writes synthetic Float32 GeoTIFFs of 1 to 100 megapixels with 10 % nodata pixels, computes their statistics
+with `compute_raster_statistics` (one streaming pass over bounded tiles) and checks the count, mean and
+standard deviation against NumPy where the raster fits in memory.
+
+Run with the Python of QGIS from the repository root, e.g.
+`python scripts/benchmark_statistics.py --sizes 1 10 100`.
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from osgeo import gdal
+from qgis.core import QgsApplication, QgsRasterLayer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+NODATA = -9999.0
+NODATA_FRACTION = 0.1
+CHECK_LIMIT_MP = 25  # Rasters up to this size are also read fully with NumPy to check the results
+
+
+def write_raster(path: str, megapixels: int, seed: int = 0) -> np.ndarray:
+    """Writes a square Float32 raster with random values and nodata, returns the values if checked."""
+    side = int(math.sqrt(megapixels * 1_000_000))
+    rng = np.random.default_rng(seed)
+    dataset = gdal.GetDriverByName("GTiff").Create(
+        path, side, side, 1, gdal.GDT_Float32, options=["TILED=YES", "COMPRESS=NONE"]
+    )
+    dataset.SetGeoTransform((0, 1, 0, side, 0, -1))
+    band = dataset.GetRasterBand(1)
+    band.SetNoDataValue(NODATA)
+
+    keep = megapixels <= CHECK_LIMIT_MP
+    values = []
+    strip_height = max(1, 4_000_000 // side)
+    for row in range(0, side, strip_height):
+        rows = min(strip_height, side - row)
+        strip = rng.normal(10, 3, (rows, side)).astype(np.float32)
+        strip[rng.random((rows, side)) < NODATA_FRACTION] = NODATA
+        band.WriteArray(strip, 0, row)
+        if keep:
+            values.append(strip)
+    dataset = None
+    return np.concatenate(values) if keep else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 25, 100], help="Raster sizes in MP")
+    args = parser.parse_args()
+
+    app = QgsApplication([], False)
+    app.initQgis()
+
+    from eis_qgis_plugin.utils.settings_manager import EISSettingsManager
+    from eis_qgis_plugin.utils.streaming_statistics import compute_raster_statistics
+
+    print(f"Tile memory limit (EIS settings): {EISSettingsManager.get_raster_read_memory()} MB")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for megapixels in args.sizes:
+            path = os.path.join(tmp_dir, f"benchmark_{megapixels}mp.tif")
+            values = write_raster(path, megapixels)
+            layer = QgsRasterLayer(path, os.path.basename(path))
+
+            started = time.perf_counter()
+            statistics = compute_raster_statistics(layer)
+            elapsed = time.perf_counter() - started
+
+            line = f"{megapixels:>5} MP: {elapsed:7.2f} s, {statistics.n_total / elapsed / 1e6:6.1f} MP/s"
+            if values is not None:
+                valid = values[values != NODATA].astype(np.float64)
+                assert statistics.count == valid.size and statistics.n_null == values.size - valid.size
+                assert math.isclose(statistics.mean, valid.mean(), rel_tol=1e-9)
+                assert math.isclose(statistics.standard_deviation(), valid.std(), rel_tol=1e-9)
+                line += ", checked against NumPy"
+            print(line)
+
+            del layer
+            values = None
+
+    app.exitQgis()
+
+
+if __name__ == "__main__":
+    main()
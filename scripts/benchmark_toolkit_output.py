@@ -0,0 +1,106 @@
+"""
+Benchmark of the output latency of EIS Toolkit runs in a new process.
+
+Runs `EISToolkitInvoker._run_toolkit_command_in_subprocess` with a child process that prints N lines and then
+keeps running, like a model training that reports its epochs, and measures the time until all lines have
+reached the feedback. The lines are delivered while the process runs, so the time should not depend on how
+long the process keeps running afterwards.
+
+The invoker of another revision can be measured for comparison, e.g. the output loop before it was changed
+to block on the output queue:
+`python scripts/benchmark_toolkit_output.py --lines 50 500 --rev f727577^`
+
+Run with the Python of QGIS from the repository root.
+"""
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from qgis.core import QgsApplication, QgsProcessingFeedback
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INVOKER_PATH = "eis_qgis_plugin/environment/eis_toolkit_invoker.py"
+
+sys.path.insert(0, REPO_ROOT)
+
+CHILD_SCRIPT = """
+import sys
+import time
+n_lines, hold = int(sys.argv[1]), float(sys.argv[2])
+for i in range(n_lines):
+    print("Epoch", i, "loss 0.123", flush=True)
+time.sleep(hold)
+"""
+
+
+class LatencyFeedback(QgsProcessingFeedback):
+    """Records when the last line printed by the child process arrives."""
+
+    def __init__(self, last_line: str) -> None:
+        super().__init__()
+        self.last_line = last_line
+        self.received_at = None
+
+    def pushInfo(self, info):
+        if self.received_at is None and info.strip() == self.last_line:
+            self.received_at = time.perf_counter()
+
+
+def load_invoker_module(rev: str, tmp_dir: str):
+    """Imports the invoker module of the working tree, or of a git revision if given."""
+    path = os.path.join(REPO_ROOT, INVOKER_PATH)
+    if rev:
+        path = os.path.join(tmp_dir, "eis_toolkit_invoker_rev.py")
+        source = subprocess.run(
+            ["git", "show", f"{rev}:{INVOKER_PATH}"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+    spec = importlib.util.spec_from_file_location(f"eis_toolkit_invoker_{rev or 'worktree'}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(invoker_module, venv_directory: str, n_lines: int, hold: float) -> float:
+    """Returns the seconds until the last of the lines printed by the child reached the feedback."""
+    invoker = invoker_module.EISToolkitInvoker(env_type="venv", venv_directory=venv_directory)
+    invoker.cmd = [sys.executable, "-c", CHILD_SCRIPT, str(n_lines), str(hold)]
+    feedback = LatencyFeedback(f"Epoch {n_lines - 1} loss 0.123")
+
+    started = time.perf_counter()
+    invoker._run_toolkit_command_in_subprocess(feedback)
+    finished = time.perf_counter()
+    return (feedback.received_at or finished) - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, nargs="+", default=[50, 500, 5000], help="Lines printed by the child")
+    parser.add_argument("--hold", type=float, default=3.0, help="Seconds the child runs after printing")
+    parser.add_argument("--rev", nargs="*", default=[], help="Git revisions to compare with the working tree")
+    args = parser.parse_args()
+
+    app = QgsApplication([], False)
+    app.initQgis()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rev in ["", *args.rev]:
+            invoker_module = load_invoker_module(rev, tmp_dir)
+            for n_lines in args.lines:
+                seconds = measure(invoker_module, tmp_dir, n_lines, args.hold)
+                print(
+                    f"{rev or 'working tree':>14}: {n_lines:>6} lines in {seconds:6.2f} s, "
+                    f"{n_lines / seconds:10,.0f} lines/s"
+                )
+
+    app.exitQgis()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+import json
+
+from eis_qgis_plugin.eis_processing.algorithm_manifest import MANIFEST_PATH, generate_manifest
+
+
+def test_committed_manifest_is_up_to_date():
+    # Release packages ship the committed file, regenerate it with build.py after changing algorithms
+    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert manifest == generate_manifest()
@@ -0,0 +1,141 @@
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from eis_qgis_plugin.environment.eis_docker_session import EISDockerSession
+from eis_qgis_plugin.environment.process_control import get_popen_kwargs
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="The fake docker is a POSIX script")
+
+# Emulates the Docker CLI commands used by the session. Commands run with `docker exec` are run on the host
+FAKE_DOCKER = textwrap.dedent(
+    """
+    import os, subprocess, sys, uuid
+
+    state = os.environ["FAKE_DOCKER_STATE"]
+    running = os.path.join(state, "running")
+    args = sys.argv[1:]
+    with open(os.path.join(state, "calls.log"), "a") as log:
+        log.write(" ".join(args) + "\\n")
+
+    if args[0] == "run":
+        open(running, "w").close()
+        print(uuid.uuid4().hex)
+    elif args[0] == "inspect":
+        print("true" if os.path.exists(running) else "false")
+    elif args[0] == "rm":
+        if os.path.exists(running):
+            os.remove(running)
+    elif args[0] == "exec":
+        args, env = args[1:], dict(os.environ)
+        while args[0] == "-e":
+            name, value = args[1].split("=", 1)
+            env[name] = value
+            args = args[2:]
+        command = args[1:]  # After the container ID
+        if command[:3] == ["poetry", "env", "info"]:
+            print(os.path.join(state, "venv"))
+            sys.exit(0)
+        sys.exit(subprocess.call(command, env=env))
+    """
+)
+
+# Module run in the container: prints its argument and sleeps if asked to
+FAKE_RUN_MODULE = textwrap.dedent(
+    """
+    import sys, time
+
+    print(sys.argv[1], flush=True)
+    if sys.argv[1] == "sleep":
+        time.sleep(60)
+    """
+)
+
+
+@pytest.fixture
+def docker_session(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_docker = bin_dir / "docker"
+    fake_docker.write_text(f"#!{sys.executable}\n{FAKE_DOCKER}")
+    fake_docker.chmod(0o755)
+
+    state_dir = tmp_path / "state"
+    (state_dir / "venv" / "bin").mkdir(parents=True)
+    (state_dir / "venv" / "bin" / "python").symlink_to(sys.executable)
+    (tmp_path / "modules").mkdir()
+    (tmp_path / "modules" / "fake_run.py").write_text(FAKE_RUN_MODULE)
+    (tmp_path / "pids").mkdir()
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_DOCKER_STATE", str(state_dir))
+    monkeypatch.setattr(EISDockerSession, "PID_DIR", str(tmp_path / "pids"))
+
+    session = EISDockerSession("docker", "eis-toolkit", [(str(tmp_path), "/data_folder")])
+    yield session
+    session.stop()
+
+
+def _get_calls(tmp_path: Path, command: str):
+    lines = (tmp_path / "state" / "calls.log").read_text().splitlines()
+    return [line for line in lines if line.split()[0] == command]
+
+
+def test_start_and_reuse(docker_session: EISDockerSession, tmp_path: Path):
+    docker_session.start()
+    assert docker_session.container_id is not None
+    assert docker_session.python_cmd == [str(tmp_path / "state" / "venv" / "bin" / "python")]
+    run_calls = _get_calls(tmp_path, "run")
+    assert len(run_calls) == 1
+    assert f"-v {tmp_path}:/data_folder eis-toolkit tail -f /dev/null" in run_calls[0]
+
+    container_id = docker_session.container_id
+    docker_session.start()
+    assert docker_session.container_id == container_id
+    assert len(_get_calls(tmp_path, "run")) == 1
+
+    # The container died, the next start replaces it
+    os.remove(tmp_path / "state" / "running")
+    docker_session.start()
+    assert len(_get_calls(tmp_path, "run")) == 2
+    assert len(_get_calls(tmp_path, "rm")) == 1
+
+    docker_session.stop()
+    assert docker_session.container_id is None
+    assert not (tmp_path / "state" / "running").exists()
+
+
+def test_exec_removes_pid_file(docker_session: EISDockerSession, tmp_path: Path):
+    cmd = docker_session.get_exec_cmd("run-1", ["-e", f"PYTHONPATH={tmp_path / 'modules'}"])
+    result = subprocess.run([*cmd, "fake_run", "done"], capture_output=True, text=True, timeout=30)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "done"
+    assert os.listdir(tmp_path / "pids") == []
+
+
+def test_signal_exec_stops_run(docker_session: EISDockerSession, tmp_path: Path):
+    cmd = docker_session.get_exec_cmd("run-2", ["-e", f"PYTHONPATH={tmp_path / 'modules'}"])
+    process = subprocess.Popen(
+        [*cmd, "fake_run", "sleep"], stdout=subprocess.PIPE, text=True, **get_popen_kwargs()
+    )
+    assert process.stdout.readline().strip() == "sleep"
+    pid_file = tmp_path / "pids" / "run-2.pid"
+    deadline = time.monotonic() + 5
+    while not pid_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert pid_file.exists()
+
+    started = time.monotonic()
+    docker_session.signal_exec("run-2")
+    process.wait(timeout=10)
+    process.stdout.close()
+
+    assert process.returncode != 0
+    assert time.monotonic() - started < 10
+    assert not pid_file.exists()
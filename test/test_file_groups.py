@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from eis_qgis_plugin.utils.file_groups import get_file_group
+
+
+def _touch(directory: Path, *names: str):
+    for name in names:
+        (directory / name).write_bytes(b"")
+
+
+def test_raster_group_excludes_files_with_same_stem(tmp_path: Path):
+    _touch(tmp_path, "out.tif", "out.tif.aux.xml", "out.tif.ovr", "out.tfw", "out.b.tif", "out.v2.gpkg")
+    group = get_file_group(str(tmp_path / "out.tif"))
+    assert [Path(path).name for path in group] == ["out.tfw", "out.tif", "out.tif.aux.xml", "out.tif.ovr"]
+
+
+def test_shapefile_group(tmp_path: Path):
+    _touch(tmp_path, "points.shp", "points.dbf", "points.shx", "points.prj", "points.cpg", "points.old.shp")
+    group = get_file_group(str(tmp_path / "points.shp"))
+    assert [Path(path).name for path in group] == [
+        "points.cpg", "points.dbf", "points.prj", "points.shp", "points.shx"
+    ]
+
+
+def test_missing_file(tmp_path: Path):
+    assert get_file_group(str(tmp_path / "missing.tif")) == []
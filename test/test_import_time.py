@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from typing import List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Packages that must not be imported when QGIS loads the plugin, only when a plot or the wizard needs them
+HEAVY_PACKAGES = ("matplotlib", "pandas", "seaborn")
+
+# Replaces qgis (and the GDAL bindings shipped with QGIS) with stubs, so that only the imports of the plugin
+# itself are measured, and loads the plugin like QGIS does
+LOAD_PLUGIN_WITH_STUBBED_QGIS = textwrap.dedent(
+    """
+    import importlib.abc
+    import importlib.machinery
+    import sys
+    import types
+
+    class _StubType(type):
+        def __getattr__(cls, name):
+            if name.startswith("__"):
+                raise AttributeError(name)
+            return _StubType(name, (_Stub,), {})
+
+        def __or__(cls, other):
+            return cls
+
+        __ror__ = __and__ = __rand__ = __or__
+
+    class _Stub(metaclass=_StubType):
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __getattr__(self, name):
+            return _StubType(name, (_Stub,), {})
+
+    class _StubModule(types.ModuleType):
+        def __getattr__(self, name):
+            if name.startswith("__"):
+                raise AttributeError(name)
+            return _StubType(name, (_Stub,), {})
+
+    class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+        def find_spec(self, name, path, target=None):
+            if name.split(".")[0] in ("qgis", "osgeo", "processing"):
+                return importlib.machinery.ModuleSpec(name, self, is_package=True)
+            return None
+
+        def create_module(self, spec):
+            module = _StubModule(spec.name)
+            module.__path__ = []
+            return module
+
+        def exec_module(self, module):
+            pass
+
+    sys.meta_path.insert(0, _StubFinder())
+
+    from eis_qgis_plugin import classFactory
+
+    classFactory(None)
+    """
+)
+
+
+def _get_imported_modules(importtime_output: str) -> List[str]:
+    """Returns the module names from the output of python -X importtime."""
+    modules = []
+    for line in importtime_output.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            if name != "imported package":
+                modules.append(name)
+    return modules
+
+
+def test_loading_plugin_does_not_import_plotting_packages():
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOAD_PLUGIN_WITH_STUBBED_QGIS],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert process.returncode == 0, process.stderr
+
+    modules = _get_imported_modules(process.stderr)
+    assert "eis_qgis_plugin.plugin" in modules
+    heavy_modules = [
+        module for module in modules if any(package in module.split(".") for package in HEAVY_PACKAGES)
+    ]
+    assert heavy_modules == []
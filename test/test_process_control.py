@@ -0,0 +1,76 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from eis_qgis_plugin.environment.process_control import (
+    TERMINATE_TIMEOUT,
+    get_popen_kwargs,
+    terminate_process_tree,
+)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Process groups and signals are POSIX only")
+
+# Ignores SIGTERM and starts a grandchild that inherits the ignored signal, then prints the grandchild PID
+CHILD_SCRIPT = textwrap.dedent(
+    """
+    import signal, subprocess, sys, time
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    grandchild = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    print(grandchild.pid, flush=True)
+    time.sleep(60)
+    """
+)
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # A killed orphan can stay as a zombie until init reaps it
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            return stat_file.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def _wait_until_stopped(pid: int, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not _is_running(pid):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_terminate_process_tree_escalates_to_sigkill():
+    process = subprocess.Popen(
+        [sys.executable, "-c", CHILD_SCRIPT], stdout=subprocess.PIPE, text=True, **get_popen_kwargs()
+    )
+    grandchild_pid = int(process.stdout.readline())
+    assert _is_running(grandchild_pid)
+
+    started = time.monotonic()
+    terminate_process_tree(process)
+    elapsed = time.monotonic() - started
+    process.stdout.close()
+
+    assert process.returncode == -signal.SIGKILL
+    assert elapsed < TERMINATE_TIMEOUT + 1
+    assert _wait_until_stopped(grandchild_pid)
+
+
+def test_terminate_process_tree_stops_at_sigterm():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"], **get_popen_kwargs())
+
+    started = time.monotonic()
+    terminate_process_tree(process)
+
+    assert process.returncode == -signal.SIGTERM
+    assert time.monotonic() - started < TERMINATE_TIMEOUT
@@ -0,0 +1,56 @@
+import os
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+from qgis.core import QgsProcessingFeedback
+
+from eis_qgis_plugin.environment.eis_toolkit_invoker import EISToolkitInvoker
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Process groups are POSIX only")
+
+# Starts a grandchild that inherits the output pipes and outlives the child, like the workers of joblib
+CHILD_SCRIPT = textwrap.dedent(
+    """
+    import subprocess, sys
+    subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    for i in range(3):
+        print("line", i, flush=True)
+    """
+)
+
+
+class RecordingFeedback(QgsProcessingFeedback):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines = []
+
+    def pushInfo(self, info):
+        self.lines.append(info.strip())
+
+
+def test_run_ends_when_grandchild_keeps_pipes_open(tmp_path: Path):
+    invoker = EISToolkitInvoker(env_type="venv", venv_directory=str(tmp_path))
+    invoker.cmd = [sys.executable, "-c", CHILD_SCRIPT]
+    feedback = RecordingFeedback()
+
+    started = time.monotonic()
+    invoker._run_toolkit_command_in_subprocess(feedback)
+
+    assert time.monotonic() - started < 10
+    assert ["line 0", "line 1", "line 2"] == [line for line in feedback.lines if line.startswith("line")]
+    assert invoker.process.returncode == 0
+
+
+def test_events_of_other_protocol_versions_are_shown_as_text(tmp_path: Path):
+    invoker = EISToolkitInvoker(env_type="venv", venv_directory=str(tmp_path))
+    feedback = RecordingFeedback()
+    results = {}
+    line = '{"eis_event": 2, "type": "result", "data": {"accuracy": 0.93}}'
+
+    invoker._process_command_output(line, feedback, results)
+
+    assert feedback.lines == [line]
+    assert results == {}